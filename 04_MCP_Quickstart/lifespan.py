@@ -0,0 +1,202 @@
+"""Lifespan-scoped resources for the quickstart MCP servers.
+
+What tools share (HTTP client pools, caches, stores, background refresh
+tasks) is opened once in the server's lifespan and reached by tools through
+`ctx.request_context.lifespan_context`. `Resources` keeps track of it all:
+
+    @asynccontextmanager
+    async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+        async with lifespan.Resources() as resources:
+            client = await resources.enter(httpx.AsyncClient())
+            resources.every(3600, store.compact)
+            await resources.warm_up(fill_cache(client))
+            yield AppContext(resources=resources, http=client)
+
+    @mcp.tool()
+    @middleware.apply(lifespan.tracked(), ...)
+    async def get_weather(city: str, ctx: Context) -> str: ...
+
+Shutdown starts with a drain: new tool calls are refused, and calls in
+progress plus tasks started with `spawn()` get MCP_DRAIN_TIMEOUT seconds to
+finish. A call counts as in progress when its tool has the `tracked()`
+policy, which finds the Resources in the call's own lifespan context; a
+server that runs one lifespan per session therefore drains each session's
+calls separately. Then periodic jobs are cancelled and everything entered is closed,
+newest first. Under `serve_http.py` the lifespan runs once per worker
+process, so every session of a worker shares the same pools and caches.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any
+
+from mcp.server.fastmcp.exceptions import ToolError
+
+import middleware
+
+# Seconds shutdown waits for running tool calls and spawned tasks
+DRAIN_TIMEOUT = float(os.environ.get("MCP_DRAIN_TIMEOUT", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+async def _cancel(tasks: set[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class Resources:
+    """Everything one server lifespan opened, closed again in reverse order."""
+
+    def __init__(self, drain_timeout: float = DRAIN_TIMEOUT) -> None:
+        self.drain_timeout = drain_timeout
+        self.draining = False
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._stack = AsyncExitStack()
+        self._periodic: set[asyncio.Task] = set()
+        self._spawned: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "Resources":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        try:
+            await self.drain()
+        finally:
+            await _cancel(self._periodic)
+            await self._stack.aclose()
+
+    async def enter(self, resource: Any) -> Any:
+        """Enter a context manager (sync or async) and return its value.
+
+        It is exited on shutdown, after the drain, newest first.
+        """
+        if hasattr(resource, "__aenter__"):
+            return await self._stack.enter_async_context(resource)
+        return self._stack.enter_context(resource)
+
+    def on_close(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Call `callback(*args)` on shutdown, in the same order as `enter()`."""
+        if inspect.iscoroutinefunction(callback):
+            self._stack.push_async_callback(callback, *args)
+        else:
+            self._stack.callback(callback, *args)
+
+    def every(self, interval: float, job: Callable[[], Any], name: str | None = None) -> None:
+        """Run `job` every `interval` seconds until shutdown.
+
+        A coroutine function runs on the event loop; a plain function runs
+        in a worker thread, so slow I/O in it does not hold up tool calls.
+        A failed run is logged and the next one happens on schedule.
+        """
+        name = name or getattr(job, "__qualname__", repr(job))
+
+        async def loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    if inspect.iscoroutinefunction(job):
+                        await job()
+                    else:
+                        await asyncio.to_thread(job)
+                except Exception:
+                    logger.exception("Periodic job %s failed", name)
+
+        self._periodic.add(asyncio.create_task(loop(), name=name))
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run `coro` in the background; shutdown waits for it to finish."""
+        task = asyncio.create_task(coro)
+        # The set also keeps a strong reference until the task is done.
+        self._spawned.add(task)
+        task.add_done_callback(self._spawned.discard)
+        return task
+
+    async def warm_up(self, *steps: Awaitable[Any], timeout: float | None = None) -> None:
+        """Run warm-up steps concurrently before the server takes requests.
+
+        A step that fails, or takes longer than `timeout` seconds, is logged
+        and abandoned: a cold cache makes the server slower, not broken.
+        """
+
+        async def run(step: Awaitable[Any]) -> None:
+            try:
+                await asyncio.wait_for(step, timeout)
+            except Exception:
+                logger.warning("Warm-up step failed; starting without it", exc_info=True)
+
+        await asyncio.gather(*(run(step) for step in steps))
+
+    @asynccontextmanager
+    async def call(self) -> AsyncIterator[None]:
+        """Count one tool call in flight; refuse it once shutdown has begun."""
+        if self.draining:
+            raise ToolError("The server is shutting down; try again shortly.")
+        self.in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if not self.in_flight:
+                self._idle.set()
+
+    async def drain(self) -> bool:
+        """Refuse new tool calls, then wait for running calls and spawned tasks.
+
+        Spawned tasks still running after `drain_timeout` seconds are
+        cancelled, and False is returned. Calling it again is harmless.
+        """
+        self.draining = True
+
+        async def settle() -> None:
+            await self._idle.wait()
+            # Tasks may spawn more tasks while finishing.
+            while self._spawned:
+                # wait() leaves the tasks running if the timeout cancels us.
+                await asyncio.wait(set(self._spawned))
+
+        try:
+            await asyncio.wait_for(settle(), self.drain_timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Shutdown: %d tool calls and %d background tasks still running after %g s",
+                self.in_flight, len(self._spawned), self.drain_timeout,
+            )
+            await _cancel(self._spawned)
+            return False
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "background_tasks": len(self._spawned),
+            "periodic_jobs": len(self._periodic),
+            "draining": self.draining,
+        }
+
+
+def tracked() -> middleware.Policy:
+    """Count each call in flight in the Resources of the lifespan serving it.
+
+    The Resources are the `resources` attribute of the call's lifespan
+    context. Put this policy first, so a call refused during shutdown
+    does no other work; without a lifespan (tests) it does nothing.
+    """
+
+    async def policy(call: middleware.ToolCall, next: middleware.Next) -> Any:
+        context = call.request.lifespan_context if call.request is not None else None
+        resources = getattr(context, "resources", None)
+        if resources is None:
+            return await next()
+        async with resources.call():
+            return await next()
+
+    return policy
@@ -0,0 +1,314 @@
+"""Prometheus-style metrics for the quickstart MCP servers.
+
+A tiny, dependency-free registry of counters, gauges and histograms that
+renders the Prometheus text format. `instrument(mcp)` times every tool call
+and adds a `GET /metrics` route to the server's HTTP app; in stdio mode
+`dump_on_signal()` writes the same text to stderr (stdout carries the
+protocol) when the process receives SIGUSR1 — Ctrl+Break on Windows:
+
+    kill -USR1 <server pid>
+"""
+
+import asyncio
+import math
+import os
+import signal
+import sys
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+# Seconds; covers a cached tool call (~100 µs) up to a slow upstream (10 s).
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# How often the event-loop lag probe wakes up
+LOOP_LAG_INTERVAL = float(os.environ.get("MCP_METRICS_LOOP_LAG_INTERVAL", "0.5"))
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """A value that only goes up (calls, errors, bytes)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """A value that goes up and down (pool size, hit ratio)."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets (latencies)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [count per bucket (not cumulative) + overflow, sum]
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = entry
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def time(self, **labels: Any) -> "_Timer":
+        """Context manager that observes the elapsed wall time of its block."""
+        return _Timer(self, labels)
+
+    def count(self, **labels: Any) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> Iterable[str]:
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total[0])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict[str, Any]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+
+
+class Registry:
+    """All metrics of one process, rendered together.
+
+    Collectors are callbacks run just before rendering; use them for values
+    that are cheaper to read on demand than to track (cache sizes, pool use).
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def _get(self, cls: type, name: str, help: str, labelnames: Iterable[str], **kwargs) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+        elif type(metric) is not cls:
+            raise ValueError(f"{name} is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labelnames, buckets=buckets)
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        self._collectors.append(collect)
+
+    def remove_collector(self, collect: Callable[[], None]) -> None:
+        if collect in self._collectors:
+            self._collectors.remove(collect)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        for collect in list(self._collectors):
+            collect()
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+# The process-wide registry used by the servers
+REGISTRY = Registry()
+
+
+def httpx_pool_stats(client: Any) -> dict[str, int]:
+    """Connections open / idle and requests queued in an httpx client's pool.
+
+    Reads httpcore internals, so it returns an empty dict when the layout
+    is not the expected one (custom transports, other versions).
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "_connections", None)
+    if connections is None:
+        return {}
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {
+        "open": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+        "queued": len(getattr(pool, "_requests", ())),
+    }
+
+
+async def _watch_loop_lag(histogram: Histogram) -> None:
+    """Sleep for a fixed interval and record how late the loop woke us up."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        histogram.observe(max(0.0, loop.time() - start - LOOP_LAG_INTERVAL))
+
+
+def instrument(mcp: FastMCP, registry: Registry = REGISTRY) -> Registry:
+    """Time every tool call of `mcp` and serve `registry` at `GET /metrics`.
+
+    Records per-tool call counts, errors and latency, plus event-loop lag
+    (how long ready callbacks wait — blocking code shows up here). Calling
+    it twice on the same server is harmless.
+    """
+    if getattr(mcp, "_metrics_registry", None) is not None:
+        return mcp._metrics_registry
+    mcp._metrics_registry = registry
+
+    calls = registry.counter("mcp_tool_calls_total", "Tool calls received.", ["tool"])
+    errors = registry.counter("mcp_tool_errors_total", "Tool calls that failed.", ["tool"])
+    latency = registry.histogram(
+        "mcp_tool_duration_seconds", "Wall time of a tool call.", ["tool"]
+    )
+    loop_lag = registry.histogram(
+        "mcp_event_loop_lag_seconds",
+        "Delay between a timer being due and the event loop running it.",
+    )
+    manager = mcp._tool_manager
+    call_tool = manager.call_tool
+    lag_watchers: dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    async def timed_call_tool(name: str, arguments: dict[str, Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop not in lag_watchers:
+            # Started lazily: there is no event loop yet when the server is built.
+            lag_watchers[loop] = loop.create_task(_watch_loop_lag(loop_lag))
+        # Unknown names would give every typo its own time series.
+        label = name if manager.get_tool(name) is not None else "unknown"
+        start = time.perf_counter()
+        try:
+            return await call_tool(name, arguments, *args, **kwargs)
+        except Exception:
+            errors.inc(tool=label)
+            raise
+        finally:
+            calls.inc(tool=label)
+            latency.observe(time.perf_counter() - start, tool=label)
+
+    manager.call_tool = timed_call_tool
+
+    @mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def metrics_endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+    return registry
+
+
+def dump_on_signal(registry: Registry = REGISTRY, path: str | None = None) -> None:
+    """Write the metrics to stderr (or `path`) whenever SIGUSR1 arrives.
+
+    For stdio servers, which have no HTTP endpoint. On Windows, where there
+    is no SIGUSR1, Ctrl+Break (SIGBREAK) is used instead. `path` defaults to
+    the MCP_METRICS_FILE environment variable.
+    """
+    signum = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
+    if signum is None:
+        return
+    path = path or os.environ.get("MCP_METRICS_FILE")
+
+    def dump(_signum: int, _frame: Any) -> None:
+        text = registry.render()
+        if path:
+            with open(path, "w", encoding="utf-8") as out:
+                out.write(text)
+        else:
+            sys.stderr.write(text)
+            sys.stderr.flush()
+
+    signal.signal(signum, dump)
@@ -0,0 +1,280 @@
+"""Composable policies for MCP tool functions: rate limits, concurrency caps,
+timing and result caching.
+
+Stack them between `@mcp.tool()` and the function; the first policy is the
+outermost one:
+
+    @mcp.tool()
+    @middleware.apply(
+        middleware.rate_limit(rate=5, burst=10),   # per client
+        middleware.concurrency(limit=8, timeout=2.0),
+        middleware.timed(),
+    )
+    async def get_weather(city: str, ctx: Context) -> str: ...
+
+The wrapper keeps the function's name, docstring and signature, so FastMCP
+builds the same input schema and still injects `ctx`. A policy that turns a
+call away raises ToolError, which the client sees as a tool error.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Distinct clients tracked by one rate_limit(); the least recently seen go first.
+MAX_TRACKED_CLIENTS = 10_000
+
+# Which client-sent headers client_key() may believe; serve_http.py sets both.
+# The transport checks mcp-session-id against its own sessions only in
+# stateful mode, and X-Forwarded-For is only true when our proxy wrote it.
+TRUST_SESSION_ID = False
+TRUSTED_PROXIES: frozenset[str] = frozenset()
+
+REJECTED = metrics.REGISTRY.counter(
+    "mcp_tool_rejected_total", "Tool calls turned away by a policy.", ["tool", "policy"]
+)
+BODY_SECONDS = metrics.REGISTRY.histogram(
+    "mcp_tool_body_seconds", "Time inside the tool function, after all policies let it run.",
+    ["tool"],
+)
+
+
+@dataclass
+class ToolCall:
+    """What a policy knows about the call it is wrapping."""
+
+    tool: str
+    arguments: dict[str, Any]         # bound arguments, Context excluded
+    request: RequestContext | None    # None outside an MCP request (e.g. tests)
+
+
+Next = Callable[[], Awaitable[Any]]
+Policy = Callable[[ToolCall, Next], Awaitable[Any]]
+
+
+def apply(*policies: Policy) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Wrap a tool function in `policies`, outermost first."""
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+        is_async = inspect.iscoroutinefunction(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            call = ToolCall(
+                tool=fn.__name__,
+                arguments={
+                    name: value
+                    for name, value in bound.arguments.items()
+                    if not isinstance(value, Context)
+                },
+                request=request_ctx.get(None),
+            )
+
+            async def run(index: int) -> Any:
+                if index == len(policies):
+                    return await fn(*args, **kwargs) if is_async else fn(*args, **kwargs)
+                return await policies[index](call, lambda: run(index + 1))
+
+            return await run(0)
+
+        return wrapper
+
+    return decorate
+
+
+class TokenBucket:
+    """`rate` tokens per second, at most `burst` saved up."""
+
+    def __init__(
+        self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """Take a token. Returns 0.0 on success, else seconds until one is available."""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+def client_key(request: RequestContext | None) -> Hashable:
+    """Who is calling: the MCP session, else the HTTP client, else this process.
+
+    Over stdio a server has exactly one client. The session id counts only
+    when TRUST_SESSION_ID is set, and X-Forwarded-For only when the peer is
+    one of TRUSTED_PROXIES; otherwise a client could pick its own key and
+    dodge the rate limit.
+    """
+    if request is None:
+        return "local"
+    http = request.request
+    headers = getattr(http, "headers", None)
+    if headers is not None:
+        if TRUST_SESSION_ID and "mcp-session-id" in headers:
+            return headers["mcp-session-id"]
+        peer = http.client.host if http.client is not None else None
+        if peer in TRUSTED_PROXIES and "x-forwarded-for" in headers:
+            # Our proxies append to the header, so walk it from the right and
+            # take the first address they did not add themselves.
+            hops = [hop.strip() for hop in headers["x-forwarded-for"].split(",")]
+            for hop in reversed(hops):
+                if hop and hop not in TRUSTED_PROXIES:
+                    return hop
+        if peer is not None:
+            return peer
+    return id(request.session)
+
+
+def rate_limit(
+    rate: float,
+    burst: float | None = None,
+    key: Callable[[RequestContext | None], Hashable] | None = client_key,
+    max_wait: float = 0.0,
+) -> Policy:
+    """Token bucket per `key(request)`; `key=None` shares one bucket by all callers.
+
+    A call without a token waits for one if that takes at most `max_wait`
+    seconds, and is rejected otherwise. A shared bucket protects an upstream
+    quota; a per-client one keeps one busy agent from starving the rest.
+    `burst` defaults to one second's worth of tokens, and at least one.
+    Bad settings raise ValueError here, when the tool is defined, rather
+    than on its first call.
+    """
+    if burst is None:
+        burst = max(1.0, rate)
+    TokenBucket(rate, burst)  # validates
+    buckets: OrderedDict[Hashable, TokenBucket] = OrderedDict()
+
+    async def policy(call: ToolCall, next: Next) -> Any:
+        client = None if key is None else key(call.request)
+        bucket = buckets.get(client)
+        if bucket is None:
+            bucket = buckets[client] = TokenBucket(rate, burst)
+            if len(buckets) > MAX_TRACKED_CLIENTS:
+                buckets.popitem(last=False)
+        buckets.move_to_end(client)
+        # Waiting consumes a future token, so re-check after the sleep.
+        while (delay := bucket.acquire()) > 0:
+            if delay > max_wait:
+                REJECTED.inc(tool=call.tool, policy="rate_limit")
+                raise ToolError(f"Rate limit exceeded for {call.tool}; retry in {delay:.2f} s.")
+            await asyncio.sleep(delay)
+        return await next()
+
+    return policy
+
+
+def concurrency(limit: int, timeout: float | None = None) -> Policy:
+    """At most `limit` calls of the tool at once; the others queue.
+
+    With `timeout`, a call that has queued that long is rejected instead of
+    waiting further, which keeps tail latency bounded under bursts.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def policy(call: ToolCall, next: Next) -> Any:
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            REJECTED.inc(tool=call.tool, policy="concurrency")
+            raise ToolError(f"{call.tool} is busy; try again shortly.") from None
+        try:
+            return await next()
+        finally:
+            semaphore.release()
+
+    return policy
+
+
+def timed(slow: float | None = None) -> Policy:
+    """Record the time spent in everything below this policy.
+
+    Put it last to time the tool body alone; `mcp_tool_duration_seconds`
+    minus `mcp_tool_body_seconds` is then time spent queueing in policies.
+    Calls slower than `slow` seconds are logged with their arguments.
+    """
+
+    async def policy(call: ToolCall, next: Next) -> Any:
+        start = time.perf_counter()
+        try:
+            return await next()
+        finally:
+            elapsed = time.perf_counter() - start
+            BODY_SECONDS.observe(elapsed, tool=call.tool)
+            if slow is not None and elapsed > slow:
+                logger.warning("Slow call: %s(%s) took %.3f s", call.tool, call.arguments, elapsed)
+
+    return policy
+
+
+class _Uncacheable(Exception):
+    """Carries a result that cache_if rejected past the cache, uncached."""
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+
+def cached(
+    cache: Any,
+    ttl: float | Callable[[], float] | None = None,
+    cache_if: Callable[[Any], bool] | None = None,
+) -> Policy:
+    """Reuse results for identical arguments.
+
+    `cache` is anything with `get_or_load(key, load, ttl)`, such as the
+    weather server's TTLCache: concurrent identical calls then share one
+    run, and errors are not cached. It may also be a function of the
+    ToolCall that returns the cache, e.g. one owned by the server lifespan;
+    when that returns None the call is not cached. `ttl` may be a function,
+    called per entry. A result for which `cache_if(result)` is false (say,
+    one that reports an upstream failure) is returned but not stored.
+    """
+
+    async def policy(call: ToolCall, next: Next) -> Any:
+        store = cache(call) if callable(cache) else cache
+        if store is None:
+            return await next()
+        key = (call.tool, json.dumps(call.arguments, sort_keys=True, default=str))
+
+        async def load() -> Any:
+            result = await next()
+            if cache_if is not None and not cache_if(result):
+                # Raised, not returned: the cache stores nothing on errors
+                # but still hands the outcome to every concurrent waiter.
+                raise _Uncacheable(result)
+            return result
+
+        try:
+            return await store.get_or_load(key, load, ttl() if callable(ttl) else ttl)
+        except _Uncacheable as exc:
+            return exc.result
+
+    return policy
@@ -0,0 +1,172 @@
+"""Serve a quickstart MCP server over streamable HTTP, with several workers.
+
+The task servers call `mcp.run()`, which speaks stdio: one process per client.
+This script serves the very same FastMCP app over HTTP instead, so a single
+deployment behind a load balancer can handle many agents:
+
+    uv run serve_http.py task_02_weather/server.py --workers 4 --stateless
+    uv run serve_http.py task_01_hello_world/server.py --port 8001
+
+Clients connect to http://HOST:PORT/mcp.
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import uvicorn
+from mcp.server.fastmcp import FastMCP
+from mcp.server.transport_security import TransportSecuritySettings
+from starlette.applications import Starlette
+
+import lifespan
+import metrics
+import middleware
+import tracing
+
+# Worker processes re-create the app from scratch, so the options travel
+# through environment variables rather than function arguments.
+ENV_SERVER = "MCP_HTTP_SERVER"
+ENV_STATELESS = "MCP_HTTP_STATELESS"
+ENV_JSON_RESPONSE = "MCP_HTTP_JSON_RESPONSE"
+ENV_ALLOWED_HOSTS = "MCP_HTTP_ALLOWED_HOSTS"
+ENV_PUBLIC = "MCP_HTTP_PUBLIC"
+ENV_TRUSTED_PROXIES = "MCP_HTTP_TRUSTED_PROXIES"
+ENV_INSTRUMENT = "MCP_HTTP_INSTRUMENT"
+
+logger = logging.getLogger("serve_http")
+
+
+def load_server(path: str) -> FastMCP:
+    """Import a task's server.py by file path and return its `mcp` object."""
+    server_file = Path(path).resolve()
+    # Let server.py import its sibling modules (cache.py, models.py, ...)
+    sys.path.insert(0, str(server_file.parent))
+    spec = importlib.util.spec_from_file_location("server", server_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["server"] = module
+    spec.loader.exec_module(module)
+    return module.mcp
+
+
+def create_app() -> Starlette:
+    """uvicorn app factory — runs once in every worker process."""
+    mcp = load_server(os.environ[ENV_SERVER])
+    mcp.settings.stateless_http = os.environ.get(ENV_STATELESS) == "1"
+    mcp.settings.json_response = os.environ.get(ENV_JSON_RESPONSE) == "1"
+    # Rate limits key on these; see middleware.client_key().
+    middleware.TRUST_SESSION_ID = not mcp.settings.stateless_http
+    middleware.TRUSTED_PROXIES = frozenset(
+        p for p in os.environ.get(ENV_TRUSTED_PROXIES, "").split(",") if p
+    )
+    allowed_hosts = [h for h in os.environ.get(ENV_ALLOWED_HOSTS, "").split(",") if h]
+    if allowed_hosts:
+        mcp.settings.transport_security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=True,
+            allowed_hosts=allowed_hosts,
+            allowed_origins=[f"{scheme}://{host}" for host in allowed_hosts for scheme in ("http", "https")],
+        )
+    elif os.environ.get(ENV_PUBLIC) == "1":
+        # Behind a load balancer the Host header is the public name, not localhost.
+        mcp.settings.transport_security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=False
+        )
+
+    # Adds GET /metrics and tool spans; no-ops for servers that already call them.
+    if os.environ.get(ENV_INSTRUMENT, "1") == "1":
+        metrics.instrument(mcp)
+        tracing.instrument(mcp)
+    app = mcp.streamable_http_app()
+
+    # FastMCP enters the server lifespan once per MCP session — and in
+    # stateless mode once per request. Enter it once per worker process
+    # instead, and hand every session the same context, so pooled clients
+    # and caches are shared by all requests this worker handles.
+    lowlevel = mcp._mcp_server
+    server_lifespan = lowlevel.lifespan
+    shared: dict = {}
+
+    @asynccontextmanager
+    async def worker_lifespan(_app: Starlette):
+        async with server_lifespan(lowlevel) as context:
+            shared["context"] = context
+            async with mcp.session_manager.run():
+                try:
+                    yield
+                finally:
+                    # Leaving run() cancels every session, so let running
+                    # tool calls finish first (up to MCP_DRAIN_TIMEOUT).
+                    resources = getattr(context, "resources", None)
+                    if isinstance(resources, lifespan.Resources):
+                        await resources.drain()
+
+    @asynccontextmanager
+    async def session_lifespan(_server):
+        yield shared["context"]
+
+    lowlevel.lifespan = session_lifespan
+    app.router.lifespan_context = worker_lifespan
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("server", help="path to a task's server.py")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="interface to bind; use 0.0.0.0 behind a load balancer")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--stateless", action="store_true",
+                        help="no server-side sessions: any worker can answer any request")
+    parser.add_argument("--json-response", action="store_true",
+                        help="answer with plain JSON instead of an SSE stream")
+    parser.add_argument("--limit-concurrency", type=int, default=None,
+                        help="per worker: answer HTTP 503 above this many open requests")
+    parser.add_argument("--backlog", type=int, default=2048,
+                        help="maximum queued connections waiting for accept()")
+    parser.add_argument("--timeout-keep-alive", type=int, default=5,
+                        help="seconds an idle client connection stays open")
+    parser.add_argument("--timeout-graceful-shutdown", type=int, default=30,
+                        help="seconds to let in-flight requests finish on shutdown")
+    parser.add_argument("--allowed-host", action="append", default=[], metavar="HOST[:PORT]",
+                        help="Host header to accept (repeatable); enables DNS rebinding protection")
+    parser.add_argument("--trusted-proxy", action="append", default=[], metavar="ADDRESS",
+                        help="load balancer address whose X-Forwarded-For is believed (repeatable)")
+    parser.add_argument("--no-instrument", action="store_true",
+                        help="serve without /metrics and tool spans (protocol benchmarks)")
+    args = parser.parse_args()
+
+    if args.workers > 1 and not args.stateless:
+        logger.warning(
+            "Sessions live in a single worker: with --workers > 1 either pass "
+            "--stateless or configure sticky sessions (mcp-session-id) on the load balancer."
+        )
+
+    os.environ[ENV_SERVER] = str(Path(args.server).resolve())
+    os.environ[ENV_STATELESS] = "1" if args.stateless else "0"
+    os.environ[ENV_JSON_RESPONSE] = "1" if args.json_response else "0"
+    os.environ[ENV_ALLOWED_HOSTS] = ",".join(args.allowed_host)
+    os.environ[ENV_TRUSTED_PROXIES] = ",".join(args.trusted_proxy)
+    os.environ[ENV_INSTRUMENT] = "0" if args.no_instrument else "1"
+    os.environ[ENV_PUBLIC] = "0" if args.host in ("127.0.0.1", "localhost", "::1") else "1"
+
+    uvicorn.run(
+        "serve_http:create_app",
+        factory=True,
+        app_dir=str(Path(__file__).resolve().parent),
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        limit_concurrency=args.limit_concurrency,
+        backlog=args.backlog,
+        timeout_keep_alive=args.timeout_keep_alive,
+        timeout_graceful_shutdown=args.timeout_graceful_shutdown,
+    )
+
+
+if __name__ == "__main__":
+    main()
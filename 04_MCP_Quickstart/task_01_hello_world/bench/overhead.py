@@ -0,0 +1,425 @@
+"""Benchmark: MCP protocol overhead per tool call, with hello_world as the tool.
+
+hello_world does no work, so everything measured here is the cost of MCP
+itself. Two groups of results:
+
+- layers (in one process, microseconds per call):
+    function   calling hello_world() directly: the floor
+    jsonrpc    encoding and decoding a tools/call request and its result,
+               as both sides of a transport do
+    schema     the JSON Schema checks of one call: the server and then the
+               client validate the structured result against the output
+               schema (FastMCP checks arguments with pydantic, not jsonschema)
+    dispatch   FastMCP.call_tool(): pydantic argument validation and result
+               conversion
+    session    a full client/server session over in-memory streams: all of
+               the above plus request routing, without a real transport
+- transports (separate processes, N concurrent clients):
+    stdio      every client launches its own server, like separate desktop apps
+    http       all clients share one server started with ../serve_http.py
+
+    python bench/overhead.py                                  # everything
+    python bench/overhead.py --transports http --clients 1 10 -o base.json
+    python bench/overhead.py --compare base.json              # exits 1 on a regression
+    python bench/overhead.py --instrumented --compare base.json   # cost of metrics + tracing
+
+server.py stays the bare tutorial server. `--instrumented` adds the metrics
+and tracing wrappers (../metrics.py, ../tracing.py) from this harness, in
+every layer and transport, so their cost shows up against a bare run.
+
+Subtract these numbers from bench/loadtest.py results of the weather
+server to see how much of a weather call is protocol and how much is work.
+INFO logging is switched off in every process: FastMCP's per-request log
+line is not framing cost. With 100 clients the single client process may become
+the bottleneck; compare runs on the same machine only.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+
+import jsonschema
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import (
+    CallToolResult,
+    JSONRPCMessage,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    TextContent,
+)
+
+TASK_DIR = Path(__file__).resolve().parent.parent
+SERVER = TASK_DIR / "server.py"
+SERVE_HTTP = TASK_DIR.parent / "serve_http.py"
+sys.path.insert(0, str(TASK_DIR))
+sys.path.insert(1, str(TASK_DIR.parent))
+
+import metrics  # noqa: E402
+import server  # noqa: E402
+import tracing  # noqa: E402
+
+# Runs a script with INFO logging off; FastMCP has no setting for that.
+QUIET = (
+    "import logging, os, runpy, sys; logging.disable(logging.INFO); "
+    "sys.argv = sys.argv[1:]; sys.path.insert(0, os.path.dirname(sys.argv[0])); "
+    "runpy.run_path(sys.argv[0], run_name='__main__')"
+)
+# The same, with the metrics and tracing wrappers added before mcp.run().
+QUIET_INSTRUMENTED = (
+    "import logging, os, runpy, sys; logging.disable(logging.INFO); "
+    "sys.argv = sys.argv[1:]; sys.path[:0] = [os.path.dirname(sys.argv[0]), sys.argv[1]]; "
+    "import metrics, tracing; mcp = runpy.run_path(sys.argv[0])['mcp']; "
+    "metrics.instrument(mcp); tracing.instrument(mcp); mcp.run()"
+)
+TOOL = "hello_world"
+ARGUMENTS = {"name": "bench"}
+FORMAT_VERSION = 1
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def latency_summary(seconds: list[float]) -> dict:
+    us = sorted(value * 1e6 for value in seconds)
+    return {
+        "mean": round(statistics.fmean(us), 1) if us else 0.0,
+        "p50": round(percentile(us, 50), 1),
+        "p95": round(percentile(us, 95), 1),
+        "p99": round(percentile(us, 99), 1),
+        "max": round(us[-1], 1) if us else 0.0,
+    }
+
+
+async def time_layer(call: Callable[[], Awaitable[object] | object], calls: int) -> dict:
+    """Per-call latency of `call` (sync or async), after a short warm-up."""
+    for _ in range(min(100, calls)):
+        result = call()
+        if asyncio.iscoroutine(result):
+            await result
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = call()
+        if asyncio.iscoroutine(result):
+            await result
+        latencies.append(time.perf_counter() - start)
+    return {"calls": calls, "latency_us": latency_summary(latencies)}
+
+
+def jsonrpc_round_trip() -> None:
+    """What the two transports' ends do to one call: 2 encodes and 2 decodes."""
+    request = JSONRPCMessage(JSONRPCRequest(
+        jsonrpc="2.0", id=1, method="tools/call", params={"name": TOOL, "arguments": ARGUMENTS}
+    ))
+    JSONRPCMessage.model_validate_json(request.model_dump_json(by_alias=True, exclude_none=True))
+    result = CallToolResult(
+        content=[TextContent(type="text", text=server.hello_world(**ARGUMENTS))],
+        structuredContent={"result": server.hello_world(**ARGUMENTS)},
+    )
+    response = JSONRPCMessage(JSONRPCResponse(
+        jsonrpc="2.0", id=1, result=result.model_dump(by_alias=True, exclude_none=True)
+    ))
+    JSONRPCMessage.model_validate_json(response.model_dump_json(by_alias=True, exclude_none=True))
+
+
+def schema_checks() -> None:
+    """The lowlevel server's and ClientSession's checks of the structured result.
+
+    FastMCP registers its handler with `validate_input=False`, so no
+    jsonschema check of the arguments runs on either side.
+    """
+    tool = server.mcp._tool_manager.get_tool(TOOL)
+    structured = {"result": server.hello_world(**ARGUMENTS)}
+    jsonschema.validate(instance=structured, schema=tool.output_schema)
+    jsonschema.validate(instance=structured, schema=tool.output_schema)
+
+
+async def run_layers(calls: int) -> list[dict]:
+    results = []
+
+    async def measure(layer: str, call: Callable[[], object]) -> None:
+        results.append({"layer": layer, **await time_layer(call, calls)})
+
+    await measure("function", lambda: server.hello_world(**ARGUMENTS))
+    await measure("jsonrpc", jsonrpc_round_trip)
+    await measure("schema", schema_checks)
+    await measure("dispatch", lambda: server.mcp.call_tool(TOOL, ARGUMENTS))
+    async with create_connected_server_and_client_session(server.mcp._mcp_server) as session:
+        await measure("session", lambda: session.call_tool(TOOL, ARGUMENTS))
+    return results
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def http_server(json_response: bool, instrumented: bool):
+    """serve_http.py in a child process; yields its /mcp URL once it accepts connections."""
+    port = free_port()
+    command = [
+        sys.executable, "-c", QUIET, str(SERVE_HTTP), str(SERVER), "--port", str(port),
+        "--stateless",
+    ]
+    if json_response:
+        command.append("--json-response")
+    if not instrumented:
+        command.append("--no-instrument")
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("serve_http.py did not start") from None
+                await asyncio.sleep(0.1)
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+@asynccontextmanager
+async def open_session(transport: str, url: str | None, instrumented: bool):
+    if transport == "stdio":
+        if instrumented:
+            args = ["-c", QUIET_INSTRUMENTED, str(SERVER), str(SERVE_HTTP.parent)]
+        else:
+            args = ["-c", QUIET, str(SERVER)]
+        params = StdioServerParameters(command=sys.executable, args=args)
+        with open(os.devnull, "w") as devnull:
+            async with stdio_client(params, errlog=devnull) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    yield session
+    else:
+        async with streamablehttp_client(url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+async def run_transport(
+    transport: str, clients: int, calls: int, warmup: int, url: str | None, instrumented: bool
+) -> dict:
+    """`clients` sessions that each make `calls` timed calls, all at once.
+
+    Sessions are opened and warmed up first; the clock starts when all of
+    them are ready, so server start-up is not counted.
+    """
+    latencies: list[float] = []
+    errors: list[str] = []
+    waiting = clients
+    ready = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def client() -> None:
+        nonlocal waiting
+        async with open_session(transport, url, instrumented) as session:
+            for _ in range(warmup):
+                await session.call_tool(TOOL, ARGUMENTS)
+            waiting -= 1
+            if not waiting:
+                ready.set()
+            await ready.wait()
+            for _ in range(calls):
+                start = time.perf_counter()
+                try:
+                    result = await session.call_tool(TOOL, ARGUMENTS)
+                except Exception as exc:  # transport failure — keep going
+                    errors.append(repr(exc))
+                    continue
+                latencies.append(time.perf_counter() - start)
+                if result.isError:
+                    errors.append(result.content[0].text if result.content else "tool error")
+            # Closing a session (and a stdio server) would slow the others down.
+            await finished.wait()
+
+    tasks = [asyncio.create_task(client()) for _ in range(clients)]
+    # A client that fails to start would otherwise leave the others waiting forever.
+    while not ready.is_set():
+        failed = [task for task in tasks if task.done() and task.exception()]
+        if failed:
+            finished.set()
+            ready.set()
+            raise failed[0].exception()
+        await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    while len(latencies) + len(errors) < clients * calls:
+        failed = [task for task in tasks if task.done() and task.exception()]
+        if failed:
+            finished.set()
+            raise failed[0].exception()
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - start
+    finished.set()
+    await asyncio.gather(*tasks)
+    return {
+        "transport": transport,
+        "clients": clients,
+        "calls": clients * calls,
+        "errors": len(errors),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_us": latency_summary(latencies),
+        "sample_errors": sorted(set(errors))[:5],
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=TASK_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "mcp": version("mcp"),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    report = {
+        "format": FORMAT_VERSION,
+        "started": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "instrumented": args.instrumented,
+        "layers": [],
+        "transports": [],
+    }
+    if args.instrumented:
+        metrics.instrument(server.mcp)
+        tracing.instrument(server.mcp)
+    if not args.skip_layers:
+        report["layers"] = await run_layers(args.layer_calls)
+    for transport in args.transports:
+        if transport == "http":
+            async with http_server(args.json_response, args.instrumented) as url:
+                for clients in args.clients:
+                    report["transports"].append(await run_transport(
+                        transport, clients, args.calls, args.warmup, url, args.instrumented
+                    ))
+        else:
+            for clients in args.clients:
+                report["transports"].append(await run_transport(
+                    transport, clients, args.calls, args.warmup, None, args.instrumented
+                ))
+    return report
+
+
+def print_report(report: dict) -> None:
+    for row in report["layers"]:
+        lat = row["latency_us"]
+        print(f"layer {row['layer']:<9} p50 {lat['p50']:>9.1f} µs  p99 {lat['p99']:>9.1f} µs")
+    for row in report["transports"]:
+        lat = row["latency_us"]
+        print(
+            f"{row['transport']:<5} clients={row['clients']:<4} {row['throughput_rps']:>8.1f} calls/s"
+            f"  p50 {lat['p50']:>9.1f} µs  p99 {lat['p99']:>9.1f} µs  errors {row['errors']}"
+        )
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Rows whose p50 latency grew, or throughput fell, by more than `tolerance`."""
+
+    def rows(data: dict) -> dict:
+        keyed = {("layer", row["layer"]): row for row in data.get("layers", [])}
+        keyed.update({(row["transport"], row["clients"]): row for row in data.get("transports", [])})
+        return keyed
+
+    regressions = []
+    old_rows = rows(baseline)
+    for key, new in rows(report).items():
+        old = old_rows.get(key)
+        if old is None:
+            continue
+        old_p50, new_p50 = old["latency_us"]["p50"], new["latency_us"]["p50"]
+        change = (new_p50 - old_p50) / old_p50 if old_p50 else 0.0
+        line = f"{key[0]} {key[1]}: p50 {old_p50:.1f} -> {new_p50:.1f} µs ({change:+.0%})"
+        if "throughput_rps" in new:
+            old_rps, new_rps = old["throughput_rps"], new["throughput_rps"]
+            line += f", {old_rps:.0f} -> {new_rps:.0f} calls/s"
+            if old_rps and (old_rps - new_rps) / old_rps > tolerance:
+                change = max(change, tolerance + 1e-9)
+        print(line)
+        if change > tolerance:
+            regressions.append(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transports", nargs="+", choices=["stdio", "http"],
+                        default=["stdio", "http"])
+    parser.add_argument("--clients", nargs="+", type=int, default=[1, 10, 100],
+                        help="concurrency levels (default: 1 10 100)")
+    parser.add_argument("--calls", type=int, default=100, help="timed calls per client")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed calls per client first")
+    parser.add_argument("--layer-calls", type=int, default=5000,
+                        help="calls per in-process layer")
+    parser.add_argument("--skip-layers", action="store_true")
+    parser.add_argument("--json-response", action="store_true",
+                        help="HTTP server answers with plain JSON instead of SSE")
+    parser.add_argument("--instrumented", action="store_true",
+                        help="add the metrics and tracing wrappers to the server")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="JSON results file (default: overhead-<UTC time>.json)")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="results file of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="slowdown that counts as a regression (default: 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    report = asyncio.run(run(args))
+    output = args.output or Path(
+        f"overhead-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print_report(report)
+    print(f"Results written to {output}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("instrumented", False) != args.instrumented:
+            print("Comparing an instrumented run with a bare one: the change is the "
+                  "cost of metrics + tracing", file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Microbenchmark: decoding large Open-Meteo hourly responses, per JSON backend.
+
+    python bench/bench_json.py --locations 100 --days 16
+
+The payload mimics a real multi-location `hourly=` response, including the
+metadata and the extra variables the server never reads. The first row is
+what `response.json()` does (stdlib json on the raw bytes); "typed" is the
+msgspec path in decoding.py, which skips the unread fields.
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import decoding  # noqa: E402
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Read by the server (see decoding.HourlyBlock) ...
+USED = ["temperature_2m", "relative_humidity_2m", "precipitation", "wind_speed_10m", "weather_code"]
+# ... and requested by many clients, but not by this server
+UNUSED = ["apparent_temperature", "dew_point_2m", "cloud_cover", "surface_pressure",
+          "visibility", "wind_direction_10m", "wind_gusts_10m", "uv_index"]
+
+
+def make_payload(locations: int, days: int, extra: bool, rng: random.Random) -> bytes:
+    hours = days * 24
+    names = USED + (UNUSED if extra else [])
+    body = []
+    for i in range(locations):
+        hourly = {"time": [f"2025-01-{h // 24 + 1:02d}T{h % 24:02d}:00" for h in range(hours)]}
+        for name in names:
+            if name == "weather_code":
+                hourly[name] = [rng.choice([0, 1, 2, 3, 61, 63, 95]) for _ in range(hours)]
+            else:
+                hourly[name] = [round(rng.uniform(-10, 40), 1) for _ in range(hours)]
+        body.append({
+            "latitude": 48.86 + i * 0.01,
+            "longitude": 2.35,
+            "generationtime_ms": 0.9,
+            "utc_offset_seconds": 3600,
+            "timezone": "Europe/Paris",
+            "timezone_abbreviation": "CET",
+            "elevation": 43.0,
+            "hourly_units": {name: "°C" for name in ["time", *names]},
+            "hourly": hourly,
+        })
+    return json.dumps(body if locations > 1 else body[0]).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=100)
+    parser.add_argument("--days", type=int, default=16)
+    parser.add_argument("--no-extra", action="store_true",
+                        help="request only the variables the server reads")
+    args = parser.parse_args()
+
+    payload = make_payload(args.locations, args.days, not args.no_extra, random.Random(0))
+    candidates = {
+        "json (response.json)": lambda: json.loads(payload),
+    }
+    if orjson is not None:
+        candidates["orjson"] = lambda: orjson.loads(payload)
+    if msgspec is not None:
+        candidates["msgspec (untyped)"] = lambda: msgspec.json.decode(payload)
+        typed = msgspec.json.Decoder(decoding.ForecastResponse)
+        candidates["msgspec (typed)"] = lambda: typed.decode(payload)
+        # Same numbers on the fields the server reads
+        full, trimmed = json.loads(payload), typed.decode(payload)
+        if args.locations == 1:
+            full, trimmed = [full], [trimmed]
+        for location, kept in zip(full, trimmed):
+            assert kept["hourly"] == {name: location["hourly"][name] for name in ["time", *USED]}
+
+    size_mb = len(payload) / 1e6
+    print(f"payload: {size_mb:.2f} MB, {args.locations} locations x {args.days * 24} hours "
+          f"(backend in use: {decoding.BACKEND})")
+    baseline = None
+    for name, decode in candidates.items():
+        number = max(1, int(2 / size_mb))
+        best = min(timeit.repeat(decode, number=number, repeat=5)) / number
+        baseline = baseline or best
+        print(f"{name:22}: {best * 1e3:8.2f} ms  {size_mb / best:7.0f} MB/s  "
+              f"x{baseline / best:4.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Microbenchmark: WMO code lookup, per-call dict literal vs precomputed table.
+
+    python bench/bench_wmo.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import wmo_codes  # noqa: E402
+
+# Codes as they show up in real responses: mostly the common ones
+SAMPLE = [0, 1, 2, 3, 3, 2, 61, 63, 80, 45, 71, 95, 3, 1, 0, 51]
+
+
+def per_call_dict(code: int) -> str:
+    """The original implementation: builds the dict on every call."""
+    codes = {
+        0: "Clear sky",
+        1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+        45: "Fog", 48: "Icy fog",
+        51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
+        61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+        71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
+        77: "Snow grains",
+        80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
+        85: "Slight snow showers", 86: "Heavy snow showers",
+        95: "Thunderstorm",
+        96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail",
+    }
+    return codes.get(code, f"Unknown condition (code {code})")
+
+
+def precomputed(code: int) -> str:
+    return wmo_codes.describe(code)
+
+
+def main() -> None:
+    for code in SAMPLE:
+        assert per_call_dict(code) == precomputed(code), code
+
+    number = 20_000
+    for name, fn in [("per-call dict", per_call_dict), ("precomputed table", precomputed)]:
+        best = min(timeit.repeat(lambda: [fn(c) for c in SAMPLE], number=number, repeat=5))
+        per_lookup_ns = best / (number * len(SAMPLE)) * 1e9
+        print(f"{name:18}: {per_lookup_ns:7.1f} ns per lookup")
+
+
+if __name__ == "__main__":
+    main()
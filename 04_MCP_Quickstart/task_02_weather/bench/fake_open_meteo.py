@@ -0,0 +1,157 @@
+"""Local stand-in for the two Open-Meteo endpoints used by the weather server.
+
+Answers are deterministic (coordinates and weather are derived from a hash
+of the input), so runs are comparable. Latency, jitter and error rate are
+configurable to simulate a slow or flaky upstream.
+
+    python bench/fake_open_meteo.py --port 8900 --latency 0.08 --jitter 0.02
+
+Then start the weather server against it:
+
+    WEATHER_GEOCODING_URL=http://127.0.0.1:8900/v1/search \\
+    WEATHER_FORECAST_URL=http://127.0.0.1:8900/v1/forecast \\
+    uv run server.py
+
+City names starting with "zz" are treated as unknown.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+WEATHER_CODES = [0, 1, 2, 3, 45, 51, 61, 63, 71, 80, 95]
+
+
+def _unit(text: str, salt: str = "") -> float:
+    """A stable pseudo-random number in [0, 1) derived from `text`."""
+    digest = hashlib.blake2b(f"{salt}:{text}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+def daily_block(key: str, days: int) -> dict:
+    """`daily=...` arrays for `days` days starting 2025-01-01."""
+    base = [_unit(f"{key}:{day}", "t") * 40 - 10 for day in range(days)]
+    return {
+        "time": [f"2025-01-{day + 1:02d}" for day in range(days)],
+        "weather_code": [
+            WEATHER_CODES[int(_unit(f"{key}:{day}", "c") * len(WEATHER_CODES))]
+            for day in range(days)
+        ],
+        "temperature_2m_max": [round(t + 8, 1) for t in base],
+        "temperature_2m_min": [round(t, 1) for t in base],
+        "precipitation_sum": [round(_unit(f"{key}:{day}", "p") * 12, 1) for day in range(days)],
+        "wind_speed_10m_max": [round(_unit(f"{key}:{day}", "w") * 60, 1) for day in range(days)],
+    }
+
+
+def hourly_block(key: str, days: int) -> dict:
+    """`hourly=...` arrays for `days` × 24 hours starting 2025-01-01T00:00."""
+    hours = range(days * 24)
+    return {
+        "time": [f"2025-01-{hour // 24 + 1:02d}T{hour % 24:02d}:00" for hour in hours],
+        "temperature_2m": [round(_unit(f"{key}:{h}", "t") * 40 - 10, 1) for h in hours],
+        "relative_humidity_2m": [int(_unit(f"{key}:{h}", "h") * 100) for h in hours],
+        "precipitation": [round(max(0.0, _unit(f"{key}:{h}", "p") - 0.7) * 3, 1) for h in hours],
+        "wind_speed_10m": [round(_unit(f"{key}:{h}", "w") * 60, 1) for h in hours],
+        "weather_code": [
+            WEATHER_CODES[int(_unit(f"{key}:{h}", "c") * len(WEATHER_CODES))] for h in hours
+        ],
+    }
+
+
+def make_app(latency: float, jitter: float, error_rate: float) -> Starlette:
+    counters = {"search": 0, "forecast": 0, "errors": 0}
+
+    async def delay() -> bool:
+        """Sleep like a real upstream; return True if this request should fail."""
+        await asyncio.sleep(max(0.0, random.gauss(latency, jitter)))
+        if random.random() < error_rate:
+            counters["errors"] += 1
+            return True
+        return False
+
+    async def search(request: Request) -> JSONResponse:
+        counters["search"] += 1
+        if await delay():
+            return JSONResponse({"error": True, "reason": "injected failure"}, status_code=503)
+        name = request.query_params.get("name", "").strip()
+        if not name or name.casefold().startswith("zz"):
+            return JSONResponse({"generationtime_ms": 0.1})
+        key = name.casefold()
+        return JSONResponse({
+            "results": [{
+                "name": name.title(),
+                "country": "Fakeland",
+                "country_code": "FL",
+                "population": int(_unit(key, "population") * 1_000_000),
+                "latitude": round(_unit(key, "lat") * 140 - 70, 4),
+                "longitude": round(_unit(key, "lon") * 360 - 180, 4),
+            }],
+            "generationtime_ms": 0.1,
+        })
+
+    async def forecast(request: Request) -> JSONResponse:
+        counters["forecast"] += 1
+        if await delay():
+            return JSONResponse({"error": True, "reason": "injected failure"}, status_code=503)
+        query = request.query_params
+        lats = query.get("latitude", "").split(",")
+        lons = query.get("longitude", "").split(",")
+        days = int(query.get("forecast_days", 7))
+        locations = []
+        for lat, lon in zip(lats, lons):
+            key = f"{lat},{lon}"
+            location = {"latitude": float(lat), "longitude": float(lon)}
+            if "daily" in query:
+                location["daily"] = daily_block(key, days)
+            elif "hourly" in query:
+                location["hourly"] = hourly_block(key, days)
+            else:
+                location["current"] = {
+                    "time": "2025-01-01T12:00",
+                    "interval": 900,
+                    "temperature_2m": round(_unit(key, "t") * 50 - 15, 1),
+                    "relative_humidity_2m": int(_unit(key, "h") * 100),
+                    "wind_speed_10m": round(_unit(key, "w") * 60, 1),
+                    "weather_code": WEATHER_CODES[int(_unit(key, "c") * len(WEATHER_CODES))],
+                    "is_day": int(_unit(key, "d") < 0.5),
+                }
+            locations.append(location)
+        # Like the real API: one location is an object, several are a list.
+        return JSONResponse(locations[0] if len(locations) == 1 else locations)
+
+    async def stats(request: Request) -> JSONResponse:
+        return JSONResponse(counters)
+
+    return Starlette(routes=[
+        Route("/v1/search", search),
+        Route("/v1/forecast", forecast),
+        Route("/stats", stats),
+    ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="mean response delay in seconds (default: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.01,
+                        help="standard deviation of the delay (default: 0.01)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="fraction of requests answered with HTTP 503 (default: 0)")
+    args = parser.parse_args()
+
+    app = make_app(args.latency, args.jitter, args.error_rate)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
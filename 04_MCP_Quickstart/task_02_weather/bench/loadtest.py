@@ -0,0 +1,215 @@
+"""Load generator for the weather MCP server.
+
+Drives the server with N concurrent MCP clients and reports throughput and
+p50/p95/p99 latency per tool call.
+
+stdio — every client launches its own server process, exactly like N
+separate Claude Desktop sessions would:
+
+    python bench/loadtest.py --transport stdio --clients 10 --requests 50
+
+streamable-http — all clients share one running server:
+
+    WEATHER_GEOSTORE_PATH= uv run ../serve_http.py server.py --workers 2 --stateless  # other shell
+    python bench/loadtest.py --transport streamable-http --url http://127.0.0.1:8000/mcp
+
+Use together with bench/fake_open_meteo.py; with --fake-upstream the stdio
+servers are pointed at it automatically, with the geocode store switched off.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+SERVER = Path(__file__).resolve().parent.parent / "server.py"
+
+DEFAULT_CITIES = [
+    "Tokyo", "Delhi", "Shanghai", "São Paulo", "Mexico City", "Cairo", "Mumbai",
+    "Beijing", "Dhaka", "Osaka", "New York", "Karachi", "Buenos Aires", "Istanbul",
+    "Kolkata", "Lagos", "Manila", "Rio de Janeiro", "Guangzhou", "Los Angeles",
+    "Moscow", "Paris", "London", "Berlin", "Madrid", "Rome", "Sydney", "Toronto",
+]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+@asynccontextmanager
+async def open_session(args: argparse.Namespace):
+    """One MCP client session over the selected transport."""
+    if args.transport == "stdio":
+        env = dict(os.environ)
+        if args.fake_upstream:
+            env["WEATHER_GEOCODING_URL"] = f"{args.fake_upstream}/v1/search"
+            env["WEATHER_FORECAST_URL"] = f"{args.fake_upstream}/v1/forecast"
+            # Fake places must not end up in the real geocode store, and
+            # every run should start from the same cold caches.
+            env["WEATHER_GEOSTORE_PATH"] = ""
+        params = StdioServerParameters(command=sys.executable, args=[str(SERVER)], env=env)
+        with open(os.devnull, "w") as devnull:
+            errlog = sys.stderr if args.server_logs else devnull
+            async with stdio_client(params, errlog=errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    yield session
+    else:
+        async with streamablehttp_client(args.url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+def tool_call(args: argparse.Namespace, rng: random.Random) -> tuple[str, dict]:
+    if args.tool == "get_weather_many":
+        return args.tool, {"cities": rng.sample(args.cities, min(args.batch, len(args.cities)))}
+    return args.tool, {"city": rng.choice(args.cities)}
+
+
+async def run_client(
+    client_id: int,
+    args: argparse.Namespace,
+    latencies: list[float],
+    errors: list[str],
+    opened: asyncio.Event,
+    ready: asyncio.Event,
+    done: asyncio.Event,
+    finished: asyncio.Event,
+) -> None:
+    rng = random.Random(args.seed + client_id)
+    async with open_session(args) as session:
+        opened.set()
+        await ready.wait()
+        for _ in range(args.requests):
+            name, arguments = tool_call(args, rng)
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(name, arguments)
+            except Exception as exc:  # transport failure — keep going
+                errors.append(repr(exc))
+                continue
+            latencies.append(time.perf_counter() - start)
+            if result.isError:
+                errors.append(result.content[0].text if result.content else "tool error")
+        done.set()
+        # Closing a session (and a stdio server) would slow the others down.
+        await finished.wait()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Open and initialize every session first; the clock starts once all
+    of them are ready, so server start-up is not counted.
+    """
+    latencies: list[float] = []
+    errors: list[str] = []
+    opened = [asyncio.Event() for _ in range(args.clients)]
+    done = [asyncio.Event() for _ in range(args.clients)]
+    ready = asyncio.Event()
+    finished = asyncio.Event()
+    tasks = [
+        asyncio.create_task(
+            run_client(i, args, latencies, errors, opened[i], ready, done[i], finished)
+        )
+        for i in range(args.clients)
+    ]
+
+    def failure() -> BaseException | None:
+        # A client that fails would otherwise leave the others waiting forever.
+        for task in tasks:
+            if task.done() and task.exception() is not None:
+                finished.set()
+                ready.set()
+                return task.exception()
+        return None
+
+    while not all(event.is_set() for event in opened):
+        if (exc := failure()) is not None:
+            raise exc
+        await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    ready.set()
+    while not all(event.is_set() for event in done):
+        if (exc := failure()) is not None:
+            raise exc
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - start
+    finished.set()
+    await asyncio.gather(*tasks)
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        "transport": args.transport,
+        "tool": args.tool,
+        "clients": args.clients,
+        "calls": args.clients * args.requests,
+        "errors": len(errors),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(ms), 2) if ms else 0.0,
+            "p50": round(percentile(ms, 50), 2),
+            "p95": round(percentile(ms, 95), 2),
+            "p99": round(percentile(ms, 99), 2),
+            "max": round(ms[-1], 2) if ms else 0.0,
+        },
+        "sample_errors": sorted(set(errors))[:5],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=["stdio", "streamable-http"], default="stdio")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp",
+                        help="server URL for streamable-http")
+    parser.add_argument("--clients", type=int, default=10, help="concurrent MCP clients")
+    parser.add_argument("--requests", type=int, default=20, help="tool calls per client")
+    parser.add_argument("--tool", choices=["get_weather", "get_weather_many"], default="get_weather")
+    parser.add_argument("--batch", type=int, default=10,
+                        help="cities per get_weather_many call")
+    parser.add_argument("--cities-file", type=Path,
+                        help="one city per line (default: a built-in list of large cities)")
+    parser.add_argument("--fake-upstream", metavar="URL",
+                        help="base URL of fake_open_meteo.py, e.g. http://127.0.0.1:8900 (stdio only)")
+    parser.add_argument("--server-logs", action="store_true",
+                        help="show the stdio servers' log output")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    if args.cities_file:
+        args.cities = [line.strip() for line in args.cities_file.read_text().splitlines() if line.strip()]
+    else:
+        args.cities = DEFAULT_CITIES
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    lat = report["latency_ms"]
+    print(f"{report['transport']}  {report['tool']}  clients={report['clients']}")
+    print(f"  calls      : {report['calls']}  (errors: {report['errors']})")
+    print(f"  elapsed    : {report['elapsed_s']} s")
+    print(f"  throughput : {report['throughput_rps']} calls/s")
+    print(f"  latency ms : p50 {lat['p50']}  p95 {lat['p95']}  p99 {lat['p99']}  max {lat['max']}")
+    for error in report["sample_errors"]:
+        print(f"  error      : {error}")
+
+
+if __name__ == "__main__":
+    main()
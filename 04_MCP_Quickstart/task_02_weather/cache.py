@@ -0,0 +1,153 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from singleflight import SingleFlight
+
+# Returned by TTLCache.get() on a miss, so a cached `None` (e.g. "city not
+# found") can be told apart from "nothing cached".
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded in-memory cache with least-recently-used eviction and expiry.
+
+    Every entry expires `ttl` seconds after it was stored (a per-entry `ttl`
+    can override the default). When the cache is full, the entry that was
+    read or written least recently is dropped first.
+
+    Expired entries are kept for another `stale_ttl` seconds so that
+    `get_or_refresh()` can still serve them while a fresh copy is loaded.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        # key -> (expires_at, value); order = least to most recently used
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # Loads in flight, for get_or_load() / get_or_refresh()
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for `key`, or `MISSING`."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            if expires_at + self.stale_ttl <= self._clock():
+                del self._data[key]
+            self.misses += 1
+            return MISSING
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get_stale(self, key: Hashable) -> Any:
+        """Return an expired value still inside the stale window, or `MISSING`.
+
+        Call after `get()` missed; fresh entries are not returned here.
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] > self._clock():
+            return MISSING
+        self.stale_hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store `value` under `key`, evicting the oldest entry if full."""
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Return the cached value for `key`, calling `load()` on a miss.
+
+        Concurrent misses for the same key share a single `load()` call, so a
+        burst of identical requests reaches the upstream API only once. Errors
+        are passed to every waiter and nothing is cached. The load is only
+        cancelled once every waiter has been cancelled.
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+        return await self._flights.do(key, lambda: self._load(key, load, ttl))
+
+    async def get_or_refresh(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        spawn: Callable[[Awaitable[Any]], asyncio.Future] = asyncio.ensure_future,
+    ) -> tuple[Any, bool]:
+        """Like `get_or_load()`, but serve stale data instead of waiting.
+
+        Returns `(value, stale)`. An expired entry that is still inside the
+        stale window is returned at once with `stale=True`, and a refresh is
+        started in the background with `spawn`. Only when there is nothing to
+        serve does the caller wait for `load()`.
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value, False
+        value = self.get_stale(key)
+        if value is not MISSING:
+            # The refresh must finish even though nobody waits for it.
+            self._flights.start(key, lambda: self._load(key, load, ttl), spawn)
+            return value, True
+        return await self._flights.do(key, lambda: self._load(key, load, ttl)), False
+
+    async def _load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float | None,
+    ) -> Any:
+        value = await load()
+        self.set(key, value, ttl)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "coalesced": self._flights.shared,
+            "stale_hits": self.stale_hits,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,128 @@
+"""JSON decoding for Open-Meteo responses.
+
+Uses the fastest backend that is installed (override with
+WEATHER_JSON_BACKEND):
+
+- msgspec: decodes straight into the typed dicts below. Fields the server
+  does not read are skipped without being built.
+- orjson: full decode, several times faster than the stdlib.
+- json: the stdlib fallback.
+
+Every backend returns plain dicts and lists, so callers do not care which
+one ran. The schemas must list every field the server reads. Keep them in
+sync with CURRENT_VARIABLES, DAILY_VARIABLES and HOURLY_VARIABLES in
+server.py.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any, TypedDict
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec
+    msgspec = None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+Number = int | float | None
+
+
+class GeocodeResult(TypedDict, total=False):
+    name: str
+    country: str
+    country_code: str
+    latitude: float
+    longitude: float
+    population: int
+
+
+class GeocodeResponse(TypedDict, total=False):
+    results: list[GeocodeResult]
+
+
+class CurrentBlock(TypedDict, total=False):
+    temperature_2m: Number
+    relative_humidity_2m: Number
+    wind_speed_10m: Number
+    weather_code: Number
+    is_day: Number
+
+
+class DailyBlock(TypedDict, total=False):
+    time: list[str]
+    weather_code: list[Number]
+    temperature_2m_max: list[Number]
+    temperature_2m_min: list[Number]
+    precipitation_sum: list[Number]
+    wind_speed_10m_max: list[Number]
+
+
+class HourlyBlock(TypedDict, total=False):
+    time: list[str]
+    temperature_2m: list[Number]
+    relative_humidity_2m: list[Number]
+    precipitation: list[Number]
+    wind_speed_10m: list[Number]
+    weather_code: list[Number]
+
+
+class ForecastLocation(TypedDict, total=False):
+    current: CurrentBlock
+    daily: DailyBlock
+    hourly: HourlyBlock
+
+
+# One location is an object; several are a list of objects.
+ForecastResponse = ForecastLocation | list[ForecastLocation]
+
+
+def _pick_backend(requested: str) -> str:
+    available = {"msgspec": msgspec is not None, "orjson": orjson is not None, "json": True}
+    if requested:
+        if available.get(requested):
+            return requested
+        logger.warning("WEATHER_JSON_BACKEND=%s is not installed; choosing another", requested)
+    return next(name for name, installed in available.items() if installed)
+
+
+BACKEND = _pick_backend(os.environ.get("WEATHER_JSON_BACKEND", "").strip().lower())
+
+
+def loads(data: bytes) -> Any:
+    """Decode a whole JSON document with the selected backend."""
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def decoder(schema: Any) -> Callable[[bytes], Any]:
+    """A decode function for responses shaped like `schema`.
+
+    With msgspec, only the fields in `schema` are decoded. A response that
+    does not match (an API change) is decoded in full instead of failing.
+    """
+    if BACKEND != "msgspec":
+        return loads
+    typed = msgspec.json.Decoder(schema)
+
+    def decode(data: bytes) -> Any:
+        try:
+            return typed.decode(data)
+        except msgspec.ValidationError as exc:
+            logger.warning("Unexpected response shape (%s); decoding it in full", exc)
+            return loads(data)
+
+    return decode
+
+
+decode_geocode = decoder(GeocodeResponse)
+decode_forecast = decoder(ForecastResponse)
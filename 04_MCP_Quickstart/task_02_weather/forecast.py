@@ -0,0 +1,100 @@
+"""Columnar helpers for multi-day forecasts.
+
+Open-Meteo returns hourly and daily data as parallel arrays, one per
+variable. They are kept that way here — one float column per variable,
+never a list of per-hour dicts — and summarised with vectorised operations.
+
+NumPy is used when it is installed (`uv add numpy`); otherwise columns are
+`array.array("d")` and the same statistics are computed in plain Python.
+Missing values (JSON null) become NaN and are ignored by every statistic.
+"""
+
+import math
+from array import array
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+HOURS_PER_DAY = 24
+
+
+def column(values: Sequence[float | None]):
+    """A float column from a JSON array; nulls become NaN."""
+    if np is not None:
+        # dtype=float maps None to NaN in a single C-level pass
+        return np.asarray(values, dtype=np.float64)
+    return array("d", (math.nan if v is None else v for v in values))
+
+
+def _finite(col) -> list[float]:
+    return [v for v in col if not math.isnan(v)]
+
+
+def summarize(col, total: bool = False) -> dict[str, float | None]:
+    """min / max / mean of a column, plus the sum when `total` is set."""
+    if np is not None:
+        finite = col[~np.isnan(col)]
+        if finite.size == 0:
+            stats = {"min": None, "max": None, "mean": None}
+        else:
+            stats = {
+                "min": float(finite.min()),
+                "max": float(finite.max()),
+                "mean": float(finite.mean()),
+            }
+        if total:
+            stats["total"] = float(finite.sum())
+    else:
+        finite = _finite(col)
+        stats = {
+            "min": min(finite) if finite else None,
+            "max": max(finite) if finite else None,
+            "mean": math.fsum(finite) / len(finite) if finite else None,
+        }
+        if total:
+            stats["total"] = math.fsum(finite)
+    return {key: None if value is None else round(value, 2) for key, value in stats.items()}
+
+
+def daily(col, how: str) -> list[float | None]:
+    """Roll an hourly column up to one value per day.
+
+    `how` is "min", "max", "mean" or "sum". Trailing hours that do not make
+    a whole day are dropped.
+    """
+    days = len(col) // HOURS_PER_DAY
+    if np is not None:
+        grid = np.asarray(col[: days * HOURS_PER_DAY]).reshape(days, HOURS_PER_DAY)
+        empty = np.isnan(grid).all(axis=1)
+        if how == "sum":
+            rolled = np.nansum(grid, axis=1)
+        else:
+            # Fill all-NaN days first so the nan-reductions do not warn
+            safe = np.where(empty[:, None], 0.0, grid)
+            rolled = {"min": np.nanmin, "max": np.nanmax, "mean": np.nanmean}[how](safe, axis=1)
+        return [None if gap else round(float(v), 2) for v, gap in zip(rolled, empty)]
+
+    reduce = {
+        "min": min,
+        "max": max,
+        "mean": lambda vs: math.fsum(vs) / len(vs),
+        "sum": math.fsum,
+    }[how]
+    result = []
+    for day in range(days):
+        finite = _finite(col[day * HOURS_PER_DAY:(day + 1) * HOURS_PER_DAY])
+        result.append(round(reduce(finite), 2) if finite else None)
+    return result
+
+
+def daily_worst_code(col) -> list[int | None]:
+    """Most severe (highest) WMO code per day from an hourly code column."""
+    return [None if v is None else int(v) for v in daily(col, "max")]
+
+
+def to_list(col) -> list[float | None]:
+    """Column back to a JSON-friendly list (NaN -> None)."""
+    return [None if math.isnan(v) else v for v in (col.tolist() if np is not None else col)]
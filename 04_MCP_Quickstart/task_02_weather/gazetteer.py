@@ -0,0 +1,395 @@
+"""Offline city lookups from a GeoNames dump.
+
+Build an index once from a GeoNames cities file and the matching
+countryInfo.txt (both from https://download.geonames.org/export/dump/;
+cities15000.zip is a good start, cities500.zip covers small towns too):
+
+    uv run gazetteer.py build cities15000.txt --countries countryInfo.txt -o cities.idx
+
+then point WEATHER_GAZETTEER_PATH at the result. The index is a single file
+that is memory-mapped rather than read: opening it is instant, the OS pages
+in only what lookups touch, and every server process on the machine shares
+those pages.
+
+Layout (native byte order; every section starts on an 8-byte boundary):
+
+    header          magic, version, then (offset, length) of each section
+    keys            distinct normalized names, sorted, concatenated
+    key_index       u32 start of each key in `keys`, plus the end
+    key_rows        u32 first row of each key, plus the end
+    rows            one ROW struct per place, grouped by key, most populous first
+    names           display names, UTF-8, concatenated
+    countries       "CC<tab>Country" lines, indexed by ROW.country
+    trigrams        sorted u32 trigram codes
+    postings_index  u32 start of each trigram's postings, plus the end
+    postings        u32 key numbers, ascending within each trigram
+
+A name is found by binary search over `keys` in tens of microseconds. A name
+that is not there goes to the trigram index: keys sharing enough trigrams
+with it are scored with difflib, and the best one above the fuzzy cutoff
+wins. Places sharing a name are ranked by population, unless the query
+names a country: "Paris, US" or "Paris, United States".
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import NamedTuple
+
+MAGIC = b"MCPGAZ"
+VERSION = 1
+SECTIONS = (
+    "keys", "key_index", "key_rows", "rows", "names", "countries",
+    "trigrams", "postings_index", "postings",
+)
+HEADER = struct.Struct(f"<6sH{2 * len(SECTIONS)}Q")
+# latitude, longitude, population, country, name offset, name length
+ROW = struct.Struct("<ffIHIH")
+
+# Default similarity a misspelled name needs (difflib ratio: "pairs" ~ "paris" is 0.8)
+FUZZY_CUTOFF = 0.8
+# Keys scored per fuzzy lookup, those sharing the most trigrams first
+FUZZY_CANDIDATES = 2000
+# Shorter names are never matched fuzzily: "la" is not a typo for "lao".
+FUZZY_MIN_LENGTH = 4
+
+
+class Match(NamedTuple):
+    name: str
+    country: str
+    country_code: str
+    latitude: float
+    longitude: float
+    population: int
+    score: float  # 1.0 for an exact name, the difflib ratio for a fuzzy one
+
+
+def normalize(name: str) -> str:
+    """Case-, whitespace- and accent-insensitive form of a place name.
+
+    "  São   Paulo", "sao paulo" and "SAO PAULO" all map to "sao paulo".
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+def split_country(query: str) -> tuple[str, str]:
+    """`"Paris, FR"` -> `("Paris", "fr")`; the qualifier is "" without a comma."""
+    name, comma, qualifier = query.rpartition(",")
+    if not comma or not name.strip():
+        return query, ""
+    return name, normalize(qualifier)
+
+
+def trigrams(key: bytes) -> set[int]:
+    """Byte trigrams of a normalized name, padded so that its start weighs more."""
+    padded = b"  " + key + b" "
+    return {
+        padded[i] << 16 | padded[i + 1] << 8 | padded[i + 2] for i in range(len(padded) - 2)
+    }
+
+
+class Gazetteer:
+    """Read-only view of an index file built by `build()`."""
+
+    def __init__(self, path: str | Path, fuzzy_cutoff: float = FUZZY_CUTOFF) -> None:
+        self.path = Path(path).expanduser()
+        self.fuzzy_cutoff = fuzzy_cutoff
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, *bounds = HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic, version, bounds = b"", 0, []
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} gazetteer index")
+
+        self._views: list[memoryview] = [memoryview(self._mmap)]
+        sections = {}
+        for name, offset, length in zip(SECTIONS, bounds[::2], bounds[1::2]):
+            view = self._views[0][offset:offset + length]
+            if name not in ("keys", "rows", "names", "countries"):
+                view = view.cast("I")
+            self._views.append(view)
+            sections[name] = view
+        self._keys = sections["keys"]
+        self._key_index = sections["key_index"]
+        self._key_rows = sections["key_rows"]
+        self._rows = sections["rows"]
+        self._names = sections["names"]
+        self._trigrams = sections["trigrams"]
+        self._postings_index = sections["postings_index"]
+        self._postings = sections["postings"]
+        self._countries = [
+            tuple(line.split("\t", 1))
+            for line in bytes(sections["countries"]).decode("utf-8").splitlines()
+        ]
+
+    def __len__(self) -> int:
+        """Number of distinct names."""
+        return len(self._key_index) - 1
+
+    def __getitem__(self, number: int) -> bytes:
+        # A sequence of the sorted keys, so bisect can search it in place.
+        return bytes(self._keys[self._key_index[number]:self._key_index[number + 1]])
+
+    def _find(self, key: bytes) -> int:
+        """Number of `key`, or -1."""
+        number = bisect_left(self, key)
+        return number if number < len(self) and self[number] == key else -1
+
+    def _places(self, number: int, score: float) -> list[Match]:
+        places = []
+        for row in range(self._key_rows[number], self._key_rows[number + 1]):
+            lat, lon, population, country, name_at, name_len = ROW.unpack_from(
+                self._rows, row * ROW.size
+            )
+            code, country_name = self._countries[country]
+            places.append(Match(
+                name=bytes(self._names[name_at:name_at + name_len]).decode("utf-8"),
+                country=country_name,
+                country_code=code,
+                latitude=round(lat, 4),
+                longitude=round(lon, 4),
+                population=population,
+                score=score,
+            ))
+        return places
+
+    def _similar(self, key: bytes) -> list[tuple[int, float]]:
+        """`(key number, ratio)` of stored keys at least `fuzzy_cutoff` similar to `key`."""
+        grams = trigrams(key)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            i = bisect_left(self._trigrams, gram)
+            if i < len(self._trigrams) and self._trigrams[i] == gram:
+                shared.update(self._postings[self._postings_index[i]:self._postings_index[i + 1]])
+        # A single typo leaves at least a third of the trigrams of a short name intact.
+        least = max(1, len(grams) // 3)
+        text = key.decode("utf-8")
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(text)  # the side difflib preprocesses
+        similar = []
+        for number, count in shared.most_common(FUZZY_CANDIDATES):
+            if count < least:
+                break
+            matcher.set_seq1(self[number].decode("utf-8"))
+            if (
+                matcher.real_quick_ratio() >= self.fuzzy_cutoff
+                and matcher.quick_ratio() >= self.fuzzy_cutoff
+                and (ratio := matcher.ratio()) >= self.fuzzy_cutoff
+            ):
+                similar.append((number, ratio))
+        return similar
+
+    def search(self, query: str, limit: int = 5, fuzzy: bool = True) -> list[Match]:
+        """Places named like `query`, best first.
+
+        An exact name beats any misspelling; then the more populous place
+        wins. A ", country" suffix (ISO code or English name) keeps only
+        places in that country. Misspellings are only looked for when exact
+        matches do not fill `limit`, `fuzzy` is set and the name has at
+        least FUZZY_MIN_LENGTH characters. That search takes milliseconds,
+        so run it off the event loop.
+        """
+        name, country = split_country(query)
+        key = normalize(name).encode("utf-8")
+        if not key:
+            return []
+
+        def wanted(places: list[Match]) -> list[Match]:
+            if not country:
+                return places
+            return [
+                place for place in places
+                if country in (place.country_code.casefold(), normalize(place.country))
+            ]
+
+        number = self._find(key)
+        # Rows are stored most populous first.
+        found = wanted(self._places(number, 1.0)) if number >= 0 else []
+        if (
+            fuzzy
+            and len(found) < limit
+            and self.fuzzy_cutoff < 1.0
+            and len(key.decode("utf-8")) >= FUZZY_MIN_LENGTH
+        ):
+            similar = [
+                place
+                for n, ratio in self._similar(key) if n != number
+                for place in wanted(self._places(n, ratio))
+            ]
+            similar.sort(key=lambda place: (place.score, place.population), reverse=True)
+            found += similar
+        return found[:limit]
+
+    def lookup(self, query: str, fuzzy: bool = True) -> Match | None:
+        """The best place for `query`, or None if the index has nothing close."""
+        found = self.search(query, limit=1, fuzzy=fuzzy)
+        return found[0] if found else None
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+
+def read_countries(path: str | Path) -> dict[str, str]:
+    """ISO code -> English name from GeoNames' countryInfo.txt."""
+    countries = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if line.startswith("#") or not line.strip():
+            continue
+        fields = line.split("\t")
+        countries[fields[0]] = fields[4]
+    return countries
+
+
+def build(
+    dump: str | Path,
+    output: str | Path,
+    countries: dict[str, str] | None = None,
+    alternate_names: bool = False,
+    min_population: int = 0,
+) -> tuple[int, int]:
+    """Write an index of the populated places in a GeoNames dump.
+
+    Each place is indexed under its name and ASCII name, and with
+    `alternate_names` under every other spelling GeoNames lists (a much
+    larger file). Without `countries`, places show their ISO country code
+    instead of the country name. Returns `(places, distinct names)`.
+    """
+    countries = countries or {}
+    country_numbers: dict[str, int] = {}
+    names = bytearray()
+    name_offsets: dict[str, int] = {}
+    # key -> [(population, packed row)]
+    by_key: defaultdict[bytes, list[tuple[int, bytes]]] = defaultdict(list)
+    places = 0
+    with open(dump, encoding="utf-8") as f:
+        for line in f:
+            fields = line.rstrip("\n").split("\t")
+            # Feature class P: cities, towns, villages (lets allCountries.txt work too)
+            if len(fields) < 15 or fields[6] != "P":
+                continue
+            population = int(fields[14] or 0)
+            if population < min_population:
+                continue
+            name, code = fields[1], fields[8]
+            if name not in name_offsets:
+                name_offsets[name] = len(names)
+                names += name.encode("utf-8")
+            encoded_len = len(name.encode("utf-8"))
+            country = country_numbers.setdefault(code, len(country_numbers))
+            row = ROW.pack(
+                float(fields[4]), float(fields[5]), min(population, 2**32 - 1),
+                country, name_offsets[name], encoded_len,
+            )
+            spellings = {name, fields[2]}
+            if alternate_names and fields[3]:
+                spellings.update(fields[3].split(","))
+            keys = {normalize(spelling).encode("utf-8") for spelling in spellings}
+            for key in keys - {b""}:
+                by_key[key].append((population, row))
+            places += 1
+
+    keys = sorted(by_key)
+    key_index, key_rows = array("I", [0]), array("I", [0])
+    rows = bytearray()
+    postings_by_gram: defaultdict[int, array] = defaultdict(lambda: array("I"))
+    for number, key in enumerate(keys):
+        key_index.append(key_index[-1] + len(key))
+        ranked = sorted(by_key[key], key=lambda entry: entry[0], reverse=True)
+        rows += b"".join(row for _, row in ranked)
+        key_rows.append(key_rows[-1] + len(ranked))
+        for gram in trigrams(key):
+            postings_by_gram[gram].append(number)
+
+    grams = array("I", sorted(postings_by_gram))
+    postings_index, postings = array("I", [0]), array("I")
+    for gram in grams:
+        postings.extend(postings_by_gram[gram])
+        postings_index.append(len(postings))
+    country_lines = "".join(
+        f"{code}\t{countries.get(code, code)}\n"
+        for code, _ in sorted(country_numbers.items(), key=lambda item: item[1])
+    )
+
+    blobs = [
+        b"".join(keys), key_index.tobytes(), key_rows.tobytes(), bytes(rows), bytes(names),
+        country_lines.encode("utf-8"), grams.tobytes(), postings_index.tobytes(),
+        postings.tobytes(),
+    ]
+    bounds, offset = [], HEADER.size
+    for blob in blobs:
+        offset += -offset % 8
+        bounds += [offset, len(blob)]
+        offset += len(blob)
+    output = Path(output)
+    tmp = output.with_name(output.name + ".tmp")
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, *bounds))
+        for blob in blobs:
+            out.write(b"\0" * (-out.tell() % 8))
+            out.write(blob)
+    # Servers may have the old file mapped; replacing it leaves their view intact.
+    tmp.replace(output)
+    return places, len(keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline city index for the weather server.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    make = commands.add_parser("build", help="index a GeoNames dump")
+    make.add_argument("dump", type=Path, help="e.g. cities15000.txt or allCountries.txt")
+    make.add_argument("-o", "--output", type=Path, default=Path("cities.idx"))
+    make.add_argument("--countries", type=Path, help="countryInfo.txt, for country names")
+    make.add_argument("--alternate-names", action="store_true",
+                      help="also index every alternate spelling (much larger)")
+    make.add_argument("--min-population", type=int, default=0)
+    find = commands.add_parser("lookup", help="query an index")
+    find.add_argument("index", type=Path)
+    find.add_argument("query", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        countries = read_countries(args.countries) if args.countries else None
+        places, keys = build(
+            args.dump, args.output, countries, args.alternate_names, args.min_population
+        )
+        size = args.output.stat().st_size / 2**20
+        print(
+            f"{places} places, {keys} names -> {args.output} ({size:.1f} MiB)"
+            f" in {time.perf_counter() - start:.1f} s",
+            file=sys.stderr,
+        )
+        return
+    gazetteer = Gazetteer(args.index)
+    try:
+        for query in args.query:
+            start = time.perf_counter()
+            found = gazetteer.search(query)
+            elapsed = (time.perf_counter() - start) * 1e6
+            print(f"{query!r} ({elapsed:.0f} µs):")
+            for place in found:
+                print(
+                    f"  {place.name}, {place.country} ({place.latitude}, {place.longitude})"
+                    f" pop {place.population} score {place.score:.2f}"
+                )
+    finally:
+        gazetteer.close()
+
+
+if __name__ == "__main__":
+    main()
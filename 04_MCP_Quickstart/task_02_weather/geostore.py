@@ -0,0 +1,150 @@
+import sqlite3
+import time
+from pathlib import Path
+
+from cache import MISSING
+
+# Seconds a lookup or write on the event loop waits for another writer. The
+# store only saves a geocoding call, so a busy database counts as a miss.
+BUSY_TIMEOUT = 0.05
+
+# (name, country, latitude, longitude) — or None for "city not found"
+PlaceRow = tuple[str, str, float, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    key        TEXT PRIMARY KEY,
+    name       TEXT,
+    country    TEXT,
+    latitude   REAL,
+    longitude  REAL,
+    expires_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS places_updated_at ON places (updated_at);
+"""
+
+
+def _busy(exc: sqlite3.OperationalError) -> bool:
+    """Whether `exc` means another connection held the lock too long."""
+    return str(exc).startswith(("database is locked", "database table is locked"))
+
+
+class GeoStore:
+    """SQLite-backed city -> place mapping that survives server restarts.
+
+    The database runs in WAL mode, so any number of server processes can read
+    it while one of them writes. Rows carry an absolute expiry time; expired
+    rows are ignored on read and removed by `compact()`.
+
+    `get()` and `put()` run on the event loop, so they wait at most
+    BUSY_TIMEOUT for a lock another process holds, then give up.
+
+    Keys are stored under `scope` (the geocoding API's URL), so answers
+    from a fake or staging upstream never reach a server using another one.
+    """
+
+    def __init__(self, path: str | Path, scope: str = "") -> None:
+        self.path = Path(path).expanduser()
+        self.scope = scope
+        # Stored keys are "<scope>|<key>"; "}" sorts right after "|", which
+        # bounds the range of this scope's keys.
+        self._prefix = f"{scope}|"
+        self._end = f"{scope}}}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect(timeout=5.0)
+        conn.executescript(_SCHEMA)
+        # Now that the file exists, later statements must not stall the loop.
+        conn.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT * 1000)}")
+        self._conn = conn
+
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        # auto_vacuum only takes effect on a new database file, so it must be
+        # set before anything else touches it.
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL syncs on checkpoint only — a crash can lose the last few
+        # cache writes, which is fine for data we can always fetch again.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def get(self, key: str) -> tuple[PlaceRow | None, float] | object:
+        """Return `(row, expires_at)` for `key`, or `MISSING` (also when busy)."""
+        try:
+            found = self._conn.execute(
+                "SELECT name, country, latitude, longitude, expires_at"
+                " FROM places WHERE key = ? AND expires_at > ?",
+                (self._prefix + key, time.time()),
+            ).fetchone()
+        except sqlite3.OperationalError as exc:
+            if not _busy(exc):
+                raise
+            return MISSING
+        if found is None:
+            return MISSING
+        name, country, lat, lon, expires_at = found
+        row = None if name is None else (name, country, lat, lon)
+        return row, expires_at
+
+    def put(self, key: str, row: PlaceRow | None, ttl: float) -> bool:
+        """Insert or replace one entry that expires `ttl` seconds from now.
+
+        Returns False, having written nothing, if the database stayed busy.
+        """
+        now = time.time()
+        name, country, lat, lon = row if row is not None else (None, None, None, None)
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO places"
+                " (key, name, country, latitude, longitude, expires_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._prefix + key, name, country, lat, lon, now + ttl, now),
+            )
+        except sqlite3.OperationalError as exc:
+            if not _busy(exc):
+                raise
+            return False
+        return True
+
+    def recent(self, limit: int) -> list[tuple[str, PlaceRow | None, float]]:
+        """The `limit` most recently written live entries, newest first.
+
+        Used to pre-fill the in-memory cache at startup.
+        """
+        rows = self._conn.execute(
+            "SELECT key, name, country, latitude, longitude, expires_at"
+            " FROM places WHERE key > ? AND key < ? AND expires_at > ?"
+            " ORDER BY updated_at DESC LIMIT ?",
+            (self._prefix, self._end, time.time(), limit),
+        ).fetchall()
+        return [
+            (key[len(self._prefix):], None if name is None else (name, country, lat, lon), expires_at)
+            for key, name, country, lat, lon, expires_at in rows
+        ]
+
+    def compact(self) -> int:
+        """Drop expired rows and give the freed pages back to the filesystem.
+
+        Opens its own connection so it can run in a worker thread while the
+        event loop keeps serving reads. Returns the number of rows removed.
+        """
+        conn = self._connect(timeout=5.0)
+        try:
+            removed = conn.execute(
+                "DELETE FROM places WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            # Each result row is one freed page, so step through all of them.
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return removed
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM places WHERE key > ? AND key < ?", (self._prefix, self._end)
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,133 @@
+from typing import NamedTuple
+
+from pydantic import BaseModel, Field
+
+
+class Place(NamedTuple):
+    """A geocoded city."""
+
+    name: str
+    country: str
+    latitude: float
+    longitude: float
+
+
+def _measured(value: float | None, unit: str) -> str:
+    """A reading with its unit, or "n/a" when the upstream had none."""
+    return "n/a" if value is None else f"{value}{unit}"
+
+
+class WeatherReport(BaseModel):
+    """Current conditions for one city."""
+
+    name: str = Field(description="Resolved city name")
+    country: str = Field(description="Country of the resolved city")
+    condition: str = Field(description="Human-readable WMO weather description")
+    weather_code: int | None = Field(description="WMO weather interpretation code")
+    icon: str = Field(description="Icon key, day/night aware, e.g. 'partly-cloudy-night'")
+    # Open-Meteo sends null for a value a station did not report.
+    temperature_c: float | None = Field(description="Air temperature at 2 m, °C")
+    humidity_pct: int | None = Field(description="Relative humidity at 2 m, %")
+    wind_speed_kmh: float | None = Field(description="Wind speed at 10 m, km/h")
+    stale: bool = Field(
+        default=False,
+        description="True if served from an expired cache entry while it refreshes",
+    )
+
+    def render(self) -> str:
+        """The classic multi-line text view."""
+        text = (
+            f"Weather in {self.name}, {self.country}:\n"
+            f"  Condition  : {self.condition}\n"
+            f"  Temperature: {_measured(self.temperature_c, '°C')}\n"
+            f"  Humidity   : {_measured(self.humidity_pct, '%')}\n"
+            f"  Wind Speed : {_measured(self.wind_speed_kmh, ' km/h')}"
+        )
+        if self.stale:
+            text += "\n  (cached data — a refresh is in progress)"
+        return text
+
+
+class CityWeather(BaseModel):
+    """One entry of a batch answer.
+
+    `weather` is null for unknown cities and when the upstream failed, in
+    which case `error` says why.
+    """
+
+    city: str = Field(description="City name exactly as requested")
+    weather: WeatherReport | None = None
+    error: str | None = None
+
+    def render(self) -> str:
+        if self.error is not None:
+            return f"City '{self.city}': {self.error}"
+        if self.weather is None:
+            return f"City '{self.city}' not found."
+        return self.weather.render()
+
+
+class WeatherBatch(BaseModel):
+    """Answers for several cities, in request order."""
+
+    results: list[CityWeather]
+
+    def render(self) -> str:
+        return "\n\n".join(entry.render() for entry in self.results)
+
+
+class DailySeries(BaseModel):
+    """Day-by-day values, one list per variable (columnar, index = day)."""
+
+    date: list[str]
+    temperature_max_c: list[float | None]
+    temperature_min_c: list[float | None]
+    precipitation_mm: list[float | None]
+    wind_speed_max_kmh: list[float | None]
+    weather_code: list[int | None]
+    condition: list[str]
+
+
+class CityForecast(BaseModel):
+    """Multi-day forecast for one city.
+
+    `summary` maps each variable to its min / max / mean over the whole
+    range (and `total` for precipitation).
+    """
+
+    city: str = Field(description="City name exactly as requested")
+    name: str | None = None
+    country: str | None = None
+    daily: DailySeries | None = None
+    summary: dict[str, dict[str, float | None]] = Field(default_factory=dict)
+    hourly: dict[str, list] | None = Field(
+        default=None, description="Raw hourly columns, only when requested"
+    )
+    error: str | None = None
+
+    def render(self) -> str:
+        if self.error is not None:
+            return f"City '{self.city}': {self.error}"
+        if self.daily is None:
+            return f"City '{self.city}' not found."
+        d = self.daily
+        lines = [f"Forecast for {self.name}, {self.country}:"]
+        for i, date in enumerate(d.date):
+            lines.append(
+                f"  {date}  {d.condition[i]:<24} "
+                f"{d.temperature_min_c[i]}–{d.temperature_max_c[i]}°C  "
+                f"rain {d.precipitation_mm[i]} mm  wind ≤{d.wind_speed_max_kmh[i]} km/h"
+            )
+        precipitation = self.summary.get("precipitation", {})
+        if precipitation.get("total") is not None:
+            lines.append(f"  Total precipitation: {precipitation['total']} mm")
+        return "\n".join(lines)
+
+
+class ForecastBatch(BaseModel):
+    """Forecasts for several cities, in request order."""
+
+    results: list[CityForecast]
+
+    def render(self) -> str:
+        return "\n\n".join(entry.render() for entry in self.results)
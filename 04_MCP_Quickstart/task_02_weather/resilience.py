@@ -0,0 +1,140 @@
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+# Worth retrying: the upstream is overloaded or briefly unavailable.
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class UpstreamError(Exception):
+    """An upstream API could not answer, even after retries."""
+
+
+class CircuitOpenError(UpstreamError):
+    """The circuit breaker for an upstream is open; no request was sent."""
+
+
+class CircuitBreaker:
+    """Stop calling an upstream that keeps failing, then probe it again later.
+
+    closed    — requests flow; `failure_threshold` failures in a row open it
+    open      — requests fail fast for `reset_timeout` seconds
+    half-open — one probe request is let through; success closes the
+                circuit, failure opens it again. A probe that never reports
+                back (cancelled, or stuck) is replaced after `reset_timeout`
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+
+    def allow(self) -> bool:
+        """Whether a request may be sent right now."""
+        if self.state == "closed":
+            return True
+        now = self._clock()
+        if self.state == "open" and now - self.opened_at >= self.reset_timeout:
+            self.state = "half-open"
+            self._probing = False
+        if self.state == "half-open" and (
+            not self._probing or now - self._probe_started >= self.reset_timeout
+        ):
+            self._probing = True
+            self._probe_started = now
+            return True
+        return False
+
+    def release(self) -> None:
+        """Forget a probe that ended without a verdict on the upstream."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half-open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = self._clock()
+            self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": self.state, "failures": self.failures}
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2^attempt)]."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+async def get_json(
+    client: httpx.AsyncClient,
+    breaker: CircuitBreaker,
+    url: str,
+    params: dict,
+    retries: int = 2,
+    backoff_base: float = 0.2,
+    backoff_cap: float = 2.0,
+    observe: Callable[[str, float], None] | None = None,
+    decode: Callable[[bytes], Any] | None = None,
+) -> Any:
+    """GET `url` and decode the JSON body, retrying transient failures.
+
+    Timeouts, connection errors and 429/5xx answers are retried up to
+    `retries` times and count against `breaker`. Other 4xx answers are
+    raised straight away — the upstream is healthy, the request is not.
+
+    `observe(phase, seconds)`, if given, is called with "request" for every
+    HTTP attempt and with "decode" for the JSON parsing. `decode` replaces
+    `response.json()`; it gets the raw body.
+    """
+    for attempt in range(retries + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(f"{breaker.name} is unavailable (circuit open)")
+        start = time.perf_counter()
+        try:
+            response = await client.get(url, params=params)
+            if observe is not None:
+                observe("request", time.perf_counter() - start)
+            if response.status_code in RETRYABLE_STATUS:
+                raise UpstreamError(f"{breaker.name} answered HTTP {response.status_code}")
+        except (httpx.TransportError, UpstreamError) as exc:
+            if observe is not None and isinstance(exc, httpx.TransportError):
+                observe("request", time.perf_counter() - start)
+            breaker.record_failure()
+            if attempt == retries:
+                raise UpstreamError(f"{breaker.name} is unavailable: {exc}") from exc
+            await asyncio.sleep(backoff_delay(attempt, backoff_base, backoff_cap))
+            continue
+        except BaseException:
+            # Cancelled, or failed for a reason that says nothing about the
+            # upstream: let the next request probe instead of locking it out.
+            breaker.release()
+            raise
+        breaker.record_success()
+        if response.is_error:
+            raise UpstreamError(f"{breaker.name} rejected the request: HTTP {response.status_code}")
+        start = time.perf_counter()
+        data = response.json() if decode is None else decode(response.content)
+        if observe is not None:
+            observe("decode", time.perf_counter() - start)
+        return data
@@ -1,75 +1,1081 @@
+import argparse
+import asyncio
+import functools
+import importlib.util
+import logging
+import os
+import sys
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Annotated, Any, Literal
+
 import httpx
-from mcp.server.fastmcp import FastMCP
-
-mcp = FastMCP("weather")
-
-
-def weather_code_to_description(code: int) -> str:
-    """Convert WMO weather code to a human-readable description."""
-    codes = {
-        0: "Clear sky",
-        1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-        45: "Fog", 48: "Icy fog",
-        51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
-        61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-        71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
-        77: "Snow grains",
-        80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
-        85: "Slight snow showers", 86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail",
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import CallToolResult, TextContent
+from pydantic import Field
+
+# Modules shared with serve_http.py (metrics.py, lifespan.py, ...) live one level up.
+sys.path.insert(1, str(Path(__file__).resolve().parent.parent))
+
+import decoding
+import forecast
+import gazetteer
+import lifespan
+import metrics
+import middleware
+import tracing
+import wmo_codes
+from cache import MISSING, TTLCache
+from gazetteer import Gazetteer
+from geostore import GeoStore
+from models import (
+    CityForecast,
+    CityWeather,
+    DailySeries,
+    ForecastBatch,
+    Place,
+    WeatherBatch,
+    WeatherReport,
+)
+from resilience import CircuitBreaker, get_json
+from singleflight import SingleFlight
+
+# Point these at bench/fake_open_meteo.py to benchmark without the real API
+GEOCODING_URL = os.environ.get(
+    "WEATHER_GEOCODING_URL", "https://geocoding-api.open-meteo.com/v1/search"
+)
+FORECAST_URL = os.environ.get(
+    "WEATHER_FORECAST_URL", "https://api.open-meteo.com/v1/forecast"
+)
+
+# Connection pool settings — override with environment variables
+MAX_CONNECTIONS = int(os.environ.get("WEATHER_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("WEATHER_MAX_KEEPALIVE_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY = float(os.environ.get("WEATHER_KEEPALIVE_EXPIRY", "30"))
+
+# HTTP/2 needs the optional `h2` package:  uv add "httpx[http2]"
+HTTP2 = (
+    os.environ.get("WEATHER_HTTP2", "1") == "1"
+    and importlib.util.find_spec("h2") is not None
+)
+
+# Upstream timeouts and failure handling. Worst case for one upstream call is
+# (RETRIES + 1) attempts, each bounded by the connect + read timeouts.
+CONNECT_TIMEOUT = float(os.environ.get("WEATHER_CONNECT_TIMEOUT", "2"))
+READ_TIMEOUT = float(os.environ.get("WEATHER_READ_TIMEOUT", "5"))
+RETRIES = int(os.environ.get("WEATHER_RETRIES", "2"))
+BREAKER_THRESHOLD = int(os.environ.get("WEATHER_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.environ.get("WEATHER_BREAKER_RESET_TIMEOUT", "30"))
+
+# Geocoding cache — a city's coordinates never change, so entries live long.
+# Misspelled names are cached too, but only briefly.
+GEOCODE_CACHE_SIZE = int(os.environ.get("WEATHER_GEOCODE_CACHE_SIZE", "4096"))
+GEOCODE_TTL = float(os.environ.get("WEATHER_GEOCODE_TTL", str(30 * 24 * 3600)))
+GEOCODE_NEGATIVE_TTL = float(os.environ.get("WEATHER_GEOCODE_NEGATIVE_TTL", "3600"))
+
+# On-disk geocode store shared by every server process on this machine.
+# Set WEATHER_GEOSTORE_PATH to an empty string to keep the cache in memory only.
+GEOSTORE_PATH = os.environ.get(
+    "WEATHER_GEOSTORE_PATH", "~/.cache/mcp-weather/geocode.sqlite3"
+)
+GEOSTORE_COMPACT_INTERVAL = float(
+    os.environ.get("WEATHER_GEOSTORE_COMPACT_INTERVAL", "3600")
+)
+
+# Offline city index built by `gazetteer.py build`; cities it knows never
+# reach the geocoding API. Unset = every lookup goes upstream.
+GAZETTEER_PATH = os.environ.get("WEATHER_GAZETTEER_PATH", "")
+# Similarity a misspelled name needs to match; 1 allows exact names only
+GAZETTEER_FUZZY_CUTOFF = float(
+    os.environ.get("WEATHER_GAZETTEER_FUZZY_CUTOFF", str(gazetteer.FUZZY_CUTOFF))
+)
+# Geocoding API results compared per lookup (ambiguous names return several)
+GEOCODE_CANDIDATES = int(os.environ.get("WEATHER_GEOCODE_CANDIDATES", "10"))
+
+# Forecast cache — Open-Meteo refreshes its models about every 15 minutes, so
+# entries expire at the next refresh. Nearby coordinates share one grid cell.
+FORECAST_CACHE_SIZE = int(os.environ.get("WEATHER_FORECAST_CACHE_SIZE", "4096"))
+FORECAST_TTL = float(os.environ.get("WEATHER_FORECAST_TTL", "900"))
+FORECAST_GRID = float(os.environ.get("WEATHER_FORECAST_GRID", "0.05"))
+# After expiry, an entry may still be served (flagged stale) for this long
+# while a refresh runs in the background — or while the upstream is down.
+FORECAST_STALE_TTL = float(os.environ.get("WEATHER_FORECAST_STALE_TTL", "3600"))
+
+# decoding.py's schemas must name every variable requested below.
+CURRENT_VARIABLES = "temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code,is_day"
+
+# Multi-day forecast tools
+MAX_FORECAST_DAYS = 16  # Open-Meteo's limit
+DAILY_VARIABLES = (
+    "weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum,wind_speed_10m_max"
+)
+HOURLY_VARIABLES = "temperature_2m,relative_humidity_2m,precipitation,wind_speed_10m,weather_code"
+
+# Language for condition descriptions: en, de, es or fr
+LANGUAGE = os.environ.get("WEATHER_LANGUAGE", "en")
+
+# Batch tool limits
+MAX_BATCH_CITIES = int(os.environ.get("WEATHER_MAX_BATCH_CITIES", "100"))
+GEOCODE_CONCURRENCY = int(os.environ.get("WEATHER_GEOCODE_CONCURRENCY", "8"))
+# Locations per multi-location forecast request (keeps the URL a sane length)
+FORECAST_BATCH_SIZE = int(os.environ.get("WEATHER_FORECAST_BATCH_SIZE", "100"))
+
+# Tool policies (middleware.py); a rate of 0 turns that limit off
+CLIENT_RATE_LIMIT = float(os.environ.get("WEATHER_CLIENT_RATE_LIMIT", "0"))
+CLIENT_RATE_BURST = float(os.environ.get("WEATHER_CLIENT_RATE_BURST", "20"))
+GLOBAL_RATE_LIMIT = float(os.environ.get("WEATHER_GLOBAL_RATE_LIMIT", "0"))
+GLOBAL_RATE_MAX_WAIT = float(os.environ.get("WEATHER_GLOBAL_RATE_MAX_WAIT", "2"))
+if CLIENT_RATE_LIMIT > 0 and CLIENT_RATE_BURST < 1:
+    # Checked here so a bad setting stops startup instead of failing every call.
+    raise ValueError("WEATHER_CLIENT_RATE_BURST must be at least 1")
+TOOL_CONCURRENCY = int(os.environ.get("WEATHER_TOOL_CONCURRENCY", "64"))
+TOOL_QUEUE_TIMEOUT = float(os.environ.get("WEATHER_TOOL_QUEUE_TIMEOUT", "10"))
+SLOW_CALL_SECONDS = float(os.environ.get("WEATHER_SLOW_CALL_SECONDS", "5"))
+FORECAST_RESULT_CACHE_SIZE = int(os.environ.get("WEATHER_FORECAST_RESULT_CACHE_SIZE", "256"))
+
+# Cache warm-up: `server.py preload cities.txt`, or at startup with a file set here
+PRELOAD_FILE = os.environ.get("WEATHER_PRELOAD_FILE", "")
+PRELOAD_CONCURRENCY = int(os.environ.get("WEATHER_PRELOAD_CONCURRENCY", "8"))
+PRELOAD_RATE = float(os.environ.get("WEATHER_PRELOAD_RATE", "10"))  # lookups started per second
+
+
+logger = logging.getLogger(__name__)
+
+# Upstream instrumentation (see also metrics.instrument() below)
+UPSTREAM_SECONDS = metrics.REGISTRY.histogram(
+    "weather_upstream_request_seconds",
+    "Time of one HTTP request to Open-Meteo, network included.",
+    ["upstream"],
+)
+JSON_DECODE_SECONDS = metrics.REGISTRY.histogram(
+    "weather_json_decode_seconds", "Time spent decoding an Open-Meteo response.", ["upstream"]
+)
+UPSTREAM_ERRORS = metrics.REGISTRY.counter(
+    "weather_upstream_errors_total", "Upstream calls that failed after retries.", ["upstream"]
+)
+GAZETTEER_LOOKUPS = metrics.REGISTRY.counter(
+    "weather_gazetteer_lookups_total",
+    "Geocode cache misses looked up in the offline index.",
+    ["result"],  # exact or miss; fuzzy for a misspelling the API did not know
+)
+
+
+@dataclass
+class AppContext:
+    """Resources shared by every tool call for the lifetime of the server."""
+
+    resources: lifespan.Resources
+    http: httpx.AsyncClient
+    geocode_cache: TTLCache
+    forecast_cache: TTLCache
+    # Whole forecast-tool results, keyed by arguments (multi-day data changes slowly)
+    forecast_results: TTLCache
+    # One breaker per upstream host, so a geocoding outage does not block
+    # forecasts for cities that are already resolved (and vice versa).
+    geocode_breaker: CircuitBreaker
+    forecast_breaker: CircuitBreaker
+    geostore: GeoStore | None = None
+    gazetteer: Gazetteer | None = None
+    # Identical upstream requests in flight, shared by every tool call
+    flights: SingleFlight = field(default_factory=SingleFlight)
+
+
+def load_geostore(cache: TTLCache) -> GeoStore | None:
+    """Open the on-disk geocode store and copy its newest entries into `cache`."""
+    if not GEOSTORE_PATH:
+        return None
+    store = GeoStore(GEOSTORE_PATH, scope=GEOCODING_URL)
+    now = time.time()
+    # Oldest first, so the newest entries end up most recently used.
+    for key, row, expires_at in reversed(store.recent(cache.maxsize)):
+        place = None if row is None else Place(*row)
+        cache.set(key, place, ttl=expires_at - now)
+    return store
+
+
+@asynccontextmanager
+async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+    """Open the HTTP pool, caches and stores at startup; drain and close them on shutdown."""
+    async with lifespan.Resources() as resources:
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        timeout = httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+        client = await resources.enter(
+            httpx.AsyncClient(http2=HTTP2, limits=limits, timeout=timeout)
+        )
+        geocode_cache = TTLCache(GEOCODE_CACHE_SIZE, GEOCODE_TTL)
+        geostore = load_geostore(geocode_cache)
+        if geostore is not None:
+            resources.on_close(geostore.close)
+            # Purges expired rows in a worker thread while tool calls go on.
+            resources.every(GEOSTORE_COMPACT_INTERVAL, geostore.compact, "geostore compaction")
+        index = None
+        if GAZETTEER_PATH:
+            index = Gazetteer(GAZETTEER_PATH, GAZETTEER_FUZZY_CUTOFF)
+            resources.on_close(index.close)
+        app = AppContext(
+            resources=resources,
+            http=client,
+            geocode_cache=geocode_cache,
+            forecast_cache=TTLCache(
+                FORECAST_CACHE_SIZE, FORECAST_TTL, stale_ttl=FORECAST_STALE_TTL
+            ),
+            forecast_results=TTLCache(FORECAST_RESULT_CACHE_SIZE, FORECAST_TTL),
+            geocode_breaker=CircuitBreaker(
+                "geocoding API", BREAKER_THRESHOLD, BREAKER_RESET_TIMEOUT
+            ),
+            forecast_breaker=CircuitBreaker(
+                "forecast API", BREAKER_THRESHOLD, BREAKER_RESET_TIMEOUT
+            ),
+            geostore=geostore,
+            gazetteer=index,
+        )
+        collector = functools.partial(collect_metrics, app)
+        metrics.REGISTRY.add_collector(collector)
+        resources.on_close(metrics.REGISTRY.remove_collector, collector)
+        if PRELOAD_FILE:
+
+            async def preload_file() -> None:
+                await preload(app, read_cities(PRELOAD_FILE), report=log_progress, report_every=5)
+
+            # Before the first request: stdio and HTTP both wait for the lifespan.
+            await resources.warm_up(preload_file())
+        yield app
+
+
+mcp = FastMCP("weather", lifespan=app_lifespan)
+metrics.instrument(mcp)
+tracing.instrument(mcp)  # only with MCP_TRACING set
+
+# One bucket for every tool, so the total request rate stays inside the
+# upstream quota; calls wait briefly for a token before they are refused.
+GLOBAL_RATE = (
+    middleware.rate_limit(GLOBAL_RATE_LIMIT, key=None, max_wait=GLOBAL_RATE_MAX_WAIT)
+    if GLOBAL_RATE_LIMIT > 0
+    else None
+)
+
+
+def forecast_results(call: middleware.ToolCall) -> TTLCache | None:
+    """The forecast-result cache of the lifespan serving `call`."""
+    return call.request.lifespan_context.forecast_results if call.request else None
+
+
+def tool_policies(cache: middleware.Policy | None = None) -> list[middleware.Policy]:
+    """The policy stack of one tool: drain, rate limits, cache, concurrency cap, timing.
+
+    Called once per tool, so each tool gets its own semaphore and per-client
+    buckets; the global bucket is shared.
+    """
+    # Counted for the shutdown drain, and refused once it has begun
+    policies = [lifespan.tracked()]
+    if CLIENT_RATE_LIMIT > 0:
+        policies.append(middleware.rate_limit(CLIENT_RATE_LIMIT, CLIENT_RATE_BURST))
+    if GLOBAL_RATE is not None:
+        policies.append(GLOBAL_RATE)
+    # Cache hits skip the queue below
+    if cache is not None:
+        policies.append(cache)
+    policies.append(middleware.concurrency(TOOL_CONCURRENCY, TOOL_QUEUE_TIMEOUT))
+    policies.append(middleware.timed(SLOW_CALL_SECONDS))
+    return policies
+
+
+def collect_metrics(app: AppContext) -> None:
+    """Copy cache, breaker and connection-pool state into gauges at scrape time."""
+    registry = metrics.REGISTRY
+    hit_ratio = registry.gauge("weather_cache_hit_ratio", "Cache hits / lookups.", ["cache"])
+    entries = registry.gauge("weather_cache_entries", "Entries in the cache.", ["cache"])
+    coalesced = registry.gauge(
+        "weather_cache_coalesced", "Cache misses that joined a load in flight.", ["cache"]
+    )
+    for name, cache in (("geocode", app.geocode_cache), ("forecast", app.forecast_cache)):
+        stats = cache.stats()
+        hit_ratio.set(stats["hit_ratio"], cache=name)
+        entries.set(stats["size"], cache=name)
+        coalesced.set(stats["coalesced"], cache=name)
+
+    circuit_open = registry.gauge(
+        "weather_circuit_open", "1 while the upstream's circuit breaker is not closed.", ["upstream"]
+    )
+    for name, breaker in (("geocode", app.geocode_breaker), ("forecast", app.forecast_breaker)):
+        circuit_open.set(int(breaker.state != "closed"), upstream=name)
+    flights = app.flights.stats()
+    registry.gauge(
+        "weather_upstream_in_flight", "Distinct upstream calls in flight."
+    ).set(flights["in_flight"])
+    registry.gauge(
+        "weather_upstream_shared", "Callers that joined an identical upstream call in flight."
+    ).set(flights["shared"])
+
+    pool = metrics.httpx_pool_stats(app.http)
+    connections = registry.gauge(
+        "weather_http_pool_connections", "Pooled upstream connections.", ["state"]
+    )
+    for state in ("active", "idle"):
+        connections.set(pool.get(state, 0), state=state)
+    registry.gauge(
+        "weather_http_pool_queued", "Requests waiting for a pooled connection."
+    ).set(pool.get("queued", 0))
+    registry.gauge(
+        "weather_http_pool_max_connections", "Connection limit of the pool."
+    ).set(MAX_CONNECTIONS)
+
+
+def weather_code_to_description(code: int | None, is_day: bool | None = None) -> str:
+    """Convert WMO weather code to a human-readable description.
+
+    With `is_day` known, clear skies read "Sunny" by day and "Clear" at night.
+    """
+    # Precomputed table in wmo_codes.py — no per-call allocation.
+    return wmo_codes.describe(code, LANGUAGE, is_day)
+
+
+def normalize_city(city: str) -> str:
+    """Cache key for a city name: case-, whitespace- and accent-insensitive.
+
+    "  São   Paulo", "sao paulo" and "SAO PAULO" all map to "sao paulo".
+    """
+    # Same rule as the offline index, so its keys and ours agree.
+    return gazetteer.normalize(city)
+
+
+async def fetch_json(
+    app: AppContext, upstream: Literal["geocode", "forecast"], params: dict
+) -> Any:
+    """`get_json()` against one of the two APIs, through the single-flight layer.
+
+    Concurrent requests for the same URL and parameters are sent upstream
+    once and every caller gets the same decoded response (treat it as
+    read-only). The parameter order does not matter.
+    """
+    if upstream == "geocode":
+        url, breaker, decode = GEOCODING_URL, app.geocode_breaker, decoding.decode_geocode
+    else:
+        url, breaker, decode = FORECAST_URL, app.forecast_breaker, decoding.decode_forecast
+
+    def observe(phase: str, seconds: float) -> None:
+        if phase == "request":
+            UPSTREAM_SECONDS.observe(seconds, upstream=upstream)
+            tracing.record_span("http request", seconds, **{"http.url": url})
+        else:
+            JSON_DECODE_SECONDS.observe(seconds, upstream=upstream)
+            tracing.record_span("json decode", seconds)
+
+    async def call() -> Any:
+        try:
+            return await get_json(
+                app.http,
+                breaker,
+                url,
+                params,
+                retries=RETRIES,
+                observe=observe,
+                decode=decode,
+            )
+        except Exception:
+            UPSTREAM_ERRORS.inc(upstream=upstream)
+            raise
+
+    key = (url, tuple(sorted((name, str(value)) for name, value in params.items())))
+    # The request spans hang off the caller that actually sent the request;
+    # callers that joined it only get this span.
+    with tracing.span(upstream, **{"server.address": httpx.URL(url).host}):
+        return await app.flights.do(key, call)
+
+
+async def geocode(app: AppContext, city: str) -> Place | None:
+    """Resolve a city name to coordinates, or None if it does not exist."""
+    key = normalize_city(city)
+    cached = app.geocode_cache.get(key)
+    if cached is not MISSING:
+        return cached
+    # Keyed by the normalized name, so "Paris" and "paris " share one lookup.
+    return await app.flights.do(("geocode", key), lambda: resolve_city(app, city, key))
+
+
+async def resolve_city(app: AppContext, city: str, key: str) -> Place | None:
+    """Geocode cache miss: ask the offline index, the geocode store, then the API.
+
+    Only exact index hits come before the API. A misspelled name is matched
+    against the index only once the API has nothing for it, and that guess
+    is kept in memory for GEOCODE_NEGATIVE_TTL, never in the store.
+    """
+    if app.gazetteer is not None:
+        match = app.gazetteer.lookup(city, fuzzy=False)
+        GAZETTEER_LOOKUPS.inc(result="miss" if match is None else "exact")
+        if match is not None:
+            place = Place(match.name, match.country, match.latitude, match.longitude)
+            app.geocode_cache.set(key, place)
+            return place
+
+    # Another server process (or a previous run) may already have resolved it.
+    place: Place | None | object = MISSING
+    if app.geostore is not None:
+        stored = app.geostore.get(key)
+        if stored is not MISSING:
+            row, expires_at = stored
+            place = None if row is None else Place(*row)
+            app.geocode_cache.set(key, place, ttl=expires_at - time.time())
+
+    if place is MISSING:
+        place = await geocode_upstream(app, city, key)
+    if place is None and app.gazetteer is not None:
+        place = await fuzzy_place(app, city, key)
+    return place
+
+
+async def fuzzy_place(app: AppContext, city: str, key: str) -> Place | None:
+    """Last resort for a name nobody knows: the closest spelling in the index."""
+    # Scoring candidates takes milliseconds, too long for the event loop.
+    match = await asyncio.to_thread(app.gazetteer.lookup, city)
+    if match is None:
+        return None
+    GAZETTEER_LOOKUPS.inc(result="fuzzy")
+    place = Place(match.name, match.country, match.latitude, match.longitude)
+    app.geocode_cache.set(key, place, ttl=GEOCODE_NEGATIVE_TTL)
+    return place
+
+
+def best_result(results: list[dict], name: str, country: str = "") -> dict | None:
+    """The geocoding result meant by `name`: an exact name beats a partial
+    one, then the larger population wins. With a `country` qualifier (ISO
+    code or name, normalized), only results in that country count.
+    """
+    if country:
+        results = [
+            result for result in results
+            if country in (
+                result.get("country_code", "").casefold(),
+                normalize_city(result.get("country", "")),
+            )
+        ]
+    wanted = normalize_city(name)
+    return max(
+        results,
+        key=lambda result: (
+            normalize_city(result["name"]) == wanted, result.get("population") or 0
+        ),
+        default=None,
+    )
+
+
+async def geocode_upstream(app: AppContext, city: str, key: str) -> Place | None:
+    """Ask the geocoding API and store the answer in both caches."""
+    # The API matches names only: "Paris, FR" is sent as "Paris" and the
+    # country is used to choose between the results.
+    name, country = gazetteer.split_country(city)
+    geo_params = {
+        "name": name.strip(),
+        "count": GEOCODE_CANDIDATES,
+        "language": "en",
+        "format": "json",
+    }
+    geo_data = await fetch_json(app, "geocode", geo_params)
+
+    result = best_result(geo_data.get("results") or [], name, country)
+    if result is None:
+        app.geocode_cache.set(key, None, ttl=GEOCODE_NEGATIVE_TTL)
+        if app.geostore is not None:
+            app.geostore.put(key, None, ttl=GEOCODE_NEGATIVE_TTL)
+        return None
+
+    place = Place(
+        name=result["name"],
+        country=result.get("country", ""),
+        latitude=result["latitude"],
+        longitude=result["longitude"],
+    )
+    app.geocode_cache.set(key, place)
+    if app.geostore is not None:
+        app.geostore.put(key, tuple(place), ttl=GEOCODE_TTL)
+    return place
+
+
+def grid_cell(lat: float, lon: float) -> tuple[int, int]:
+    """Snap coordinates to the forecast grid; the result is the cache key."""
+    return round(lat / FORECAST_GRID), round(lon / FORECAST_GRID)
+
+
+def until_next_refresh() -> float:
+    """Seconds until Open-Meteo publishes its next model update."""
+    return FORECAST_TTL - time.time() % FORECAST_TTL
+
+
+def forecast_params(cells: list[tuple[int, int]]) -> dict:
+    """Query parameters asking for current conditions at one or more grid cells.
+
+    Open-Meteo accepts comma-separated coordinate lists and then answers with
+    a JSON array, one entry per location, in the same order.
+    """
+    return {
+        "latitude": ",".join(str(round(lat * FORECAST_GRID, 4)) for lat, _ in cells),
+        "longitude": ",".join(str(round(lon * FORECAST_GRID, 4)) for _, lon in cells),
+        "current": CURRENT_VARIABLES,
+        "wind_speed_unit": "kmh",
     }
-    return codes.get(code, f"Unknown condition (code {code})")
+
+
+async def fetch_current(app: AppContext, cells: list[tuple[int, int]]) -> list[dict]:
+    """One forecast request for the `current` block of each grid cell."""
+    data = await fetch_json(app, "forecast", forecast_params(cells))
+    # A single location comes back as an object rather than a list.
+    locations = data if isinstance(data, list) else [data]
+    ttl = until_next_refresh()
+    for cell, location in zip(cells, locations):
+        app.forecast_cache.set(cell, location["current"], ttl=ttl)
+    return [location["current"] for location in locations]
+
+
+async def current_conditions(app: AppContext, place: Place) -> tuple[dict, bool]:
+    """The `current` block for a place, shared by its whole grid cell.
+
+    Returns `(current, stale)`; stale data is served while it refreshes.
+    """
+    cell = grid_cell(place.latitude, place.longitude)
+
+    async def fetch() -> dict:
+        (current,) = await fetch_current(app, [cell])
+        return current
+
+    # Shutdown waits for a background refresh, as for current_conditions_many().
+    return await app.forecast_cache.get_or_refresh(
+        cell, fetch, ttl=until_next_refresh(), spawn=app.resources.spawn
+    )
+
+
+async def current_conditions_many(
+    app: AppContext, places: list[Place]
+) -> dict[tuple[int, int], tuple[dict, bool] | Exception]:
+    """Current conditions for many places, keyed by grid cell.
+
+    Cached cells are served from memory and stale ones are refreshed in the
+    background. All the others are fetched with as few multi-location
+    requests as possible, sent concurrently. A cell whose fetch failed maps
+    to the exception instead of `(current, stale)`.
+    """
+    found: dict[tuple[int, int], tuple[dict, bool] | Exception] = {}
+    missing: list[tuple[int, int]] = []
+    stale: list[tuple[int, int]] = []
+    for place in places:
+        cell = grid_cell(place.latitude, place.longitude)
+        if cell in found or cell in missing:
+            continue
+        current = app.forecast_cache.get(cell)
+        if current is not MISSING:
+            found[cell] = (current, False)
+            continue
+        current = app.forecast_cache.get_stale(cell)
+        if current is MISSING:
+            missing.append(cell)
+        else:
+            found[cell] = (current, True)
+            stale.append(cell)
+
+    def chunked(cells: list[tuple[int, int]]) -> list[list[tuple[int, int]]]:
+        return [cells[i:i + FORECAST_BATCH_SIZE] for i in range(0, len(cells), FORECAST_BATCH_SIZE)]
+
+    async def refresh(cells: list[tuple[int, int]]) -> None:
+        await asyncio.gather(*(fetch_current(app, chunk) for chunk in chunked(cells)),
+                             return_exceptions=True)
+
+    if stale:
+        # Shutdown waits for the refresh, so its results still reach the caches.
+        app.resources.spawn(refresh(stale))
+
+    chunks = chunked(missing)
+    fetched = await asyncio.gather(
+        *(fetch_current(app, chunk) for chunk in chunks), return_exceptions=True
+    )
+    for chunk, outcome in zip(chunks, fetched):
+        for i, cell in enumerate(chunk):
+            found[cell] = outcome if isinstance(outcome, Exception) else (outcome[i], False)
+    return found
+
+
+async def geocode_many(
+    app: AppContext, cities: list[str]
+) -> dict[str, Place | None | Exception]:
+    """Geocode every distinct city concurrently, GEOCODE_CONCURRENCY at a time.
+
+    Keyed by normalize_city(); a failed lookup maps to its exception.
+    """
+    limit = asyncio.Semaphore(GEOCODE_CONCURRENCY)
+
+    async def bounded_geocode(city: str) -> Place | None:
+        async with limit:
+            return await geocode(app, city)
+
+    unique: dict[str, str] = {}
+    for city in cities:
+        unique.setdefault(normalize_city(city), city)
+    resolved = await asyncio.gather(
+        *(bounded_geocode(city) for city in unique.values()), return_exceptions=True
+    )
+    return dict(zip(unique, resolved))
+
+
+@dataclass
+class PreloadProgress:
+    """Counters reported while `preload()` runs."""
+
+    total: int
+    skipped: int = 0      # already in the geocode store
+    resolved: int = 0
+    not_found: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def done(self) -> int:
+        return self.skipped + self.resolved + self.not_found + self.failed
+
+    @property
+    def rate(self) -> float:
+        """Cities looked up upstream per second."""
+        elapsed = time.perf_counter() - self.started
+        return (self.resolved + self.not_found + self.failed) / elapsed if elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.done}/{self.total} cities: {self.resolved} resolved, "
+            f"{self.not_found} not found, {self.failed} failed, {self.skipped} already stored "
+            f"— {self.rate:.1f} lookups/s"
+        )
+
+
+def read_cities(path: str | Path) -> list[str]:
+    """City names from a text file: one per line; blank lines and # comments skipped."""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+async def preload(
+    app: AppContext,
+    cities: list[str],
+    concurrency: int = PRELOAD_CONCURRENCY,
+    rate: float = PRELOAD_RATE,
+    refresh: bool = False,
+    report: Callable[[PreloadProgress], None] | None = None,
+    report_every: float = 1.0,
+) -> PreloadProgress:
+    """Geocode `cities` into the geocode caches, e.g. right after a deploy.
+
+    Cities already in the geocode store are skipped unless `refresh` is set,
+    so an interrupted run can simply be started again. At most `concurrency`
+    lookups run at once and at most `rate` start per second (0 = no limit).
+    `report` is called every `report_every` seconds and once at the end.
+    """
+    unique: dict[str, str] = {}
+    for city in cities:
+        unique.setdefault(normalize_city(city), city)
+    progress = PreloadProgress(total=len(unique))
+    # burst=1: lookups start evenly spaced instead of in one initial spike
+    bucket = middleware.TokenBucket(rate, 1) if rate > 0 else None
+    limit = asyncio.Semaphore(concurrency)
+
+    async def load(key: str, city: str) -> None:
+        if not refresh and app.geostore is not None and app.geostore.get(key) is not MISSING:
+            progress.skipped += 1
+            return
+        async with limit:
+            while bucket is not None and (delay := bucket.acquire()) > 0:
+                await asyncio.sleep(delay)
+            try:
+                place = await geocode_upstream(app, city, key)
+            except Exception:
+                progress.failed += 1
+                return
+        if place is None:
+            progress.not_found += 1
+        else:
+            progress.resolved += 1
+
+    async def report_periodically() -> None:
+        while True:
+            await asyncio.sleep(report_every)
+            report(progress)
+
+    reporter = asyncio.create_task(report_periodically()) if report is not None else None
+    try:
+        await asyncio.gather(*(load(key, city) for key, city in unique.items()))
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+    if report is not None:
+        report(progress)
+    return progress
+
+
+def log_progress(progress: PreloadProgress) -> None:
+    logger.info("Preload: %s", progress)
+
+
+def build_report(place: Place, current: dict, stale: bool = False) -> WeatherReport:
+    is_day = current.get("is_day")
+    is_day = None if is_day is None else bool(is_day)
+    return WeatherReport(
+        name=place.name,
+        country=place.country,
+        condition=weather_code_to_description(current["weather_code"], is_day),
+        weather_code=current["weather_code"],
+        icon=wmo_codes.icon(current["weather_code"], is_day is not False),
+        temperature_c=current["temperature_2m"],
+        humidity_pct=current["relative_humidity_2m"],
+        wind_speed_kmh=current["wind_speed_10m"],
+        stale=stale,
+    )
+
+
+def tool_result(
+    model: WeatherReport | WeatherBatch | ForecastBatch, view: str
+) -> CallToolResult:
+    """Structured content plus a text block: compact JSON, or the prose view.
+
+    FastMCP would otherwise add an indented JSON copy of the model, which
+    costs the client more tokens than the data itself.
+    """
+    text = model.render() if view == "text" else model.model_dump_json()
+    return CallToolResult(
+        content=[TextContent(type="text", text=text)],
+        structuredContent=model.model_dump(mode="json"),
+    )
+
+
+@mcp.tool()
+@middleware.apply(*tool_policies())
+async def get_weather(
+    city: str,
+    ctx: Context,
+    view: Literal["json", "text"] = "json",
+) -> Annotated[CallToolResult, WeatherReport]:
+    """Get the current weather for any city in the world.
+
+    Returns a structured report. Pass view="text" for a human-readable summary.
+    """
+    # Pooled HTTP client and caches, created once in app_lifespan()
+    app = ctx.request_context.lifespan_context
+
+    # Step 1: Convert city name to latitude/longitude (cached after the first lookup)
+    place = await geocode(app, city)
+    if place is None:
+        raise ToolError(f"City '{city}' not found. Please check the spelling and try again.")
+
+    # Step 2: Fetch current weather (cached until Open-Meteo's next model update)
+    current, stale = await current_conditions(app, place)
+    return tool_result(build_report(place, current, stale), view)
+
+
+@mcp.tool()
+@middleware.apply(*tool_policies())
+async def get_weather_many(
+    cities: list[str],
+    ctx: Context,
+    view: Literal["json", "text"] = "json",
+) -> Annotated[CallToolResult, WeatherBatch]:
+    """Get the current weather for several cities in one call."""
+    if len(cities) > MAX_BATCH_CITIES:
+        raise ToolError(f"At most {MAX_BATCH_CITIES} cities per call (got {len(cities)}).")
+    app = ctx.request_context.lifespan_context
+
+    # Step 1: Geocode every distinct city concurrently, a few at a time
+    places = await geocode_many(app, cities)
+
+    # Step 2: One multi-location forecast request for all uncached places
+    conditions = await current_conditions_many(
+        app, [place for place in places.values() if isinstance(place, Place)]
+    )
+
+    results = []
+    for city in cities:
+        place = places[normalize_city(city)]
+        if isinstance(place, Exception):
+            results.append(CityWeather(city=city, error=str(place)))
+            continue
+        if place is None:
+            results.append(CityWeather(city=city))
+            continue
+        outcome = conditions[grid_cell(place.latitude, place.longitude)]
+        if isinstance(outcome, Exception):
+            results.append(CityWeather(city=city, error=str(outcome)))
+            continue
+        current, stale = outcome
+        results.append(CityWeather(city=city, weather=build_report(place, current, stale)))
+    return tool_result(WeatherBatch(results=results), view)
+
+
+async def fetch_ranges(
+    app: AppContext, places: list[Place], params: dict
+) -> list[dict | Exception]:
+    """One forecast response per place, using multi-location requests.
+
+    `params` selects the variables (`daily=...` or `hourly=...`); the
+    coordinates are added here. A failed request maps its places to the
+    exception.
+    """
+    async def fetch(chunk: list[Place]) -> list[dict]:
+        data = await fetch_json(
+            app,
+            "forecast",
+            {
+                **params,
+                "latitude": ",".join(str(place.latitude) for place in chunk),
+                "longitude": ",".join(str(place.longitude) for place in chunk),
+            },
+        )
+        return data if isinstance(data, list) else [data]
+
+    chunks = [
+        places[i:i + FORECAST_BATCH_SIZE] for i in range(0, len(places), FORECAST_BATCH_SIZE)
+    ]
+    outcomes = await asyncio.gather(*(fetch(chunk) for chunk in chunks), return_exceptions=True)
+    results: list[dict | Exception] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        results.extend(outcome if isinstance(outcome, list) else [outcome] * len(chunk))
+    return results
+
+
+def daily_series(dates: list[str], t_max, t_min, precipitation, wind_max, codes) -> DailySeries:
+    code_list = [None if c is None else int(c) for c in forecast.to_list(codes)]
+    return DailySeries(
+        date=dates,
+        temperature_max_c=forecast.to_list(t_max),
+        temperature_min_c=forecast.to_list(t_min),
+        precipitation_mm=forecast.to_list(precipitation),
+        wind_speed_max_kmh=forecast.to_list(wind_max),
+        weather_code=code_list,
+        condition=[
+            "Unknown" if c is None else weather_code_to_description(c) for c in code_list
+        ],
+    )
+
+
+def summarize_daily(data: dict) -> tuple[DailySeries, dict]:
+    """Columns and range summary from a `daily=...` response."""
+    block = data["daily"]
+    t_max = forecast.column(block["temperature_2m_max"])
+    t_min = forecast.column(block["temperature_2m_min"])
+    precipitation = forecast.column(block["precipitation_sum"])
+    wind_max = forecast.column(block["wind_speed_10m_max"])
+    codes = forecast.column(block["weather_code"])
+    summary = {
+        "temperature_max_c": forecast.summarize(t_max),
+        "temperature_min_c": forecast.summarize(t_min),
+        "precipitation": forecast.summarize(precipitation, total=True),
+        "wind_speed_max_kmh": forecast.summarize(wind_max),
+    }
+    return daily_series(block["time"], t_max, t_min, precipitation, wind_max, codes), summary
+
+
+def summarize_hourly(data: dict, include_hourly: bool) -> tuple[DailySeries, dict, dict | None]:
+    """Daily roll-up, range summary and (optionally) raw columns from `hourly=...`."""
+    block = data["hourly"]
+    temperature = forecast.column(block["temperature_2m"])
+    humidity = forecast.column(block["relative_humidity_2m"])
+    precipitation = forecast.column(block["precipitation"])
+    wind = forecast.column(block["wind_speed_10m"])
+    codes = forecast.column(block["weather_code"])
+    dates = [stamp[:10] for stamp in block["time"][::forecast.HOURS_PER_DAY]]
+    days = daily_series(
+        dates,
+        *(
+            forecast.column(values)
+            for values in (
+                forecast.daily(temperature, "max"),
+                forecast.daily(temperature, "min"),
+                forecast.daily(precipitation, "sum"),
+                forecast.daily(wind, "max"),
+                forecast.daily_worst_code(codes),
+            )
+        ),
+    )
+    summary = {
+        "temperature_c": forecast.summarize(temperature),
+        "humidity_pct": forecast.summarize(humidity),
+        "precipitation": forecast.summarize(precipitation, total=True),
+        "wind_speed_kmh": forecast.summarize(wind),
+    }
+    hourly = None
+    if include_hourly:
+        hourly = {"time": block["time"]} | {
+            name: forecast.to_list(col)
+            for name, col in [
+                ("temperature_c", temperature),
+                ("humidity_pct", humidity),
+                ("precipitation_mm", precipitation),
+                ("wind_speed_kmh", wind),
+                ("weather_code", codes),
+            ]
+        }
+    return days, summary, hourly
+
+
+async def forecast_batch(
+    app: AppContext, cities: list[str], params: dict, build
+) -> ForecastBatch:
+    """Shared flow of the forecast tools: geocode, fetch, then `build(entry, data)`."""
+    if len(cities) > MAX_BATCH_CITIES:
+        raise ToolError(f"At most {MAX_BATCH_CITIES} cities per call (got {len(cities)}).")
+    places = await geocode_many(app, cities)
+    found = list({p for p in places.values() if isinstance(p, Place)})
+    responses = dict(zip(found, await fetch_ranges(app, found, params)))
+
+    results = []
+    for city in cities:
+        place = places[normalize_city(city)]
+        if isinstance(place, Exception):
+            results.append(CityForecast(city=city, error=str(place)))
+            continue
+        if place is None:
+            results.append(CityForecast(city=city))
+            continue
+        entry = CityForecast(city=city, name=place.name, country=place.country)
+        data = responses[place]
+        if isinstance(data, Exception):
+            entry.error = str(data)
+        else:
+            build(entry, data)
+        results.append(entry)
+    return ForecastBatch(results=results)
+
+
+def no_errors(result: CallToolResult) -> bool:
+    """Whether every city in a forecast batch got an answer.
+
+    A batch with an error in it ("circuit open", "API unavailable") is not
+    cached, so the next call retries instead of repeating the failure until
+    the next refresh boundary.
+    """
+    return not any(entry.get("error") for entry in result.structuredContent["results"])
 
 
 @mcp.tool()
-def get_weather(city: str) -> str:
-    """Get the current weather for any city in the world."""
-
-    # Step 1: Convert city name to latitude/longitude using Open-Meteo geocoding API
-    geo_url = "https://geocoding-api.open-meteo.com/v1/search"
-    geo_params = {"name": city, "count": 1, "language": "en", "format": "json"}
-
-    with httpx.Client() as client:
-        geo_response = client.get(geo_url, params=geo_params)
-        geo_data = geo_response.json()
-
-    if not geo_data.get("results"):
-        return f"City '{city}' not found. Please check the spelling and try again."
-
-    result = geo_data["results"][0]
-    lat = result["latitude"]
-    lon = result["longitude"]
-    name = result["name"]
-    country = result.get("country", "")
-
-    # Step 2: Fetch current weather using Open-Meteo weather API
-    weather_url = "https://api.open-meteo.com/v1/forecast"
-    weather_params = {
-        "latitude": lat,
-        "longitude": lon,
-        "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code",
+@middleware.apply(*tool_policies(middleware.cached(
+    forecast_results, ttl=until_next_refresh, cache_if=no_errors
+)))
+async def get_daily_forecast(
+    cities: list[str],
+    ctx: Context,
+    days: Annotated[int, Field(ge=1, le=MAX_FORECAST_DAYS)] = 7,
+    view: Literal["json", "text"] = "json",
+) -> Annotated[CallToolResult, ForecastBatch]:
+    """Daily forecast (min/max temperature, precipitation, wind, conditions)
+    for one or more cities over the next `days` days, with range summaries.
+    """
+    params = {
+        "daily": DAILY_VARIABLES,
+        "forecast_days": days,
+        "timezone": "auto",
         "wind_speed_unit": "kmh",
     }
 
-    with httpx.Client() as client:
-        weather_response = client.get(weather_url, params=weather_params)
-        weather_data = weather_response.json()
-
-    current = weather_data["current"]
-    temp = current["temperature_2m"]
-    humidity = current["relative_humidity_2m"]
-    wind = current["wind_speed_10m"]
-    condition = weather_code_to_description(current["weather_code"])
-
-    return (
-        f"Weather in {name}, {country}:\n"
-        f"  Condition  : {condition}\n"
-        f"  Temperature: {temp}°C\n"
-        f"  Humidity   : {humidity}%\n"
-        f"  Wind Speed : {wind} km/h"
+    def build(entry: CityForecast, data: dict) -> None:
+        entry.daily, entry.summary = summarize_daily(data)
+
+    app = ctx.request_context.lifespan_context
+    return tool_result(await forecast_batch(app, cities, params, build), view)
+
+
+@mcp.tool()
+@middleware.apply(*tool_policies(middleware.cached(
+    forecast_results, ttl=until_next_refresh, cache_if=no_errors
+)))
+async def get_hourly_forecast(
+    cities: list[str],
+    ctx: Context,
+    days: Annotated[int, Field(ge=1, le=MAX_FORECAST_DAYS)] = 2,
+    include_hourly: bool = False,
+    view: Literal["json", "text"] = "json",
+) -> Annotated[CallToolResult, ForecastBatch]:
+    """Hourly forecast for one or more cities over the next `days` days.
+
+    Hourly temperature, humidity, precipitation and wind are rolled up into
+    per-day values and range summaries. Set include_hourly=true to also get
+    the raw hourly columns.
+    """
+    params = {
+        "hourly": HOURLY_VARIABLES,
+        "forecast_days": days,
+        "timezone": "auto",
+        "wind_speed_unit": "kmh",
+    }
+
+    def build(entry: CityForecast, data: dict) -> None:
+        entry.daily, entry.summary, entry.hourly = summarize_hourly(data, include_hourly)
+
+    app = ctx.request_context.lifespan_context
+    return tool_result(await forecast_batch(app, cities, params, build), view)
+
+
+@mcp.resource("weather://cache-stats")
+def cache_stats() -> dict:
+    """Hit/miss counters for the server's caches."""
+    app = mcp.get_context().request_context.lifespan_context
+    stats = {
+        "geocode": app.geocode_cache.stats(),
+        "forecast": app.forecast_cache.stats(),
+        "forecast_results": app.forecast_results.stats(),
+        "breakers": {
+            "geocode": app.geocode_breaker.stats(),
+            "forecast": app.forecast_breaker.stats(),
+        },
+        "singleflight": app.flights.stats(),
+        "lifespan": app.resources.stats(),
+    }
+    if app.geostore is not None:
+        stats["geostore"] = {"path": str(app.geostore.path), "size": len(app.geostore)}
+    if app.gazetteer is not None:
+        stats["gazetteer"] = {"path": str(app.gazetteer.path), "names": len(app.gazetteer)}
+    return stats
+
+
+async def preload_main(args: argparse.Namespace) -> int:
+    if not GEOSTORE_PATH:
+        print("preload needs the geocode store; set WEATHER_GEOSTORE_PATH", file=sys.stderr)
+        return 2
+    cities = read_cities(args.cities_file)
+    # One log line per request would drown the progress line.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    def show(progress: PreloadProgress) -> None:
+        print(f"\r{progress}", end="", file=sys.stderr, flush=True)
+
+    async with app_lifespan(mcp) as app:
+        progress = await preload(
+            app, cities, args.concurrency, args.rate, args.refresh, report=show
+        )
+    print(f"\nStored in {GEOSTORE_PATH}", file=sys.stderr)
+    return 1 if progress.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Weather MCP server (stdio).")
+    commands = parser.add_subparsers(dest="command")
+    warm = commands.add_parser(
+        "preload", help="geocode a list of cities into the geocode store, then exit"
     )
+    warm.add_argument("cities_file", type=Path, help="one city per line; # starts a comment")
+    warm.add_argument("--concurrency", type=int, default=PRELOAD_CONCURRENCY,
+                      help=f"lookups in flight at once (default: {PRELOAD_CONCURRENCY})")
+    warm.add_argument("--rate", type=float, default=PRELOAD_RATE,
+                      help=f"lookups started per second, 0 = unlimited (default: {PRELOAD_RATE:g})")
+    warm.add_argument("--refresh", action="store_true",
+                      help="look up cities that are already stored as well")
+    args = parser.parse_args()
+
+    if args.command == "preload":
+        sys.exit(asyncio.run(preload_main(args)))
+    # No HTTP endpoint over stdio: `kill -USR1 <pid>` prints the metrics to stderr.
+    metrics.dump_on_signal()
+    mcp.run()
 
 
 if __name__ == "__main__":
-    mcp.run()
+    main()
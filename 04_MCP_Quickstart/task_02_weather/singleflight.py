@@ -0,0 +1,109 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    """One in-flight call and the callers waiting for it."""
+
+    __slots__ = ("task", "waiters", "detached")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+        # Set when someone started the call without waiting for it (a
+        # background refresh): it must then run to completion.
+        self.detached = False
+
+
+class SingleFlight:
+    """Share identical in-flight async calls between concurrent callers.
+
+    The first `do(key, fn)` runs `fn()`; every `do()` with the same key that
+    arrives before it finishes waits for that same call instead of starting
+    another one. All waiters get the same result or the same exception.
+    Nothing is remembered afterwards — caching is the caller's business.
+
+    Cancellation is per waiter: a caller that gives up (timeout, client
+    disconnect) only stops waiting. The shared call is cancelled only when
+    every waiter has given up, unless it was started with `start()`.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self.calls = 0       # calls actually started
+        self.shared = 0      # callers that joined a call already in flight
+        self.cancelled = 0   # calls cancelled because nobody was waiting any more
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _join(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        spawn: Callable[[Awaitable[Any]], asyncio.Future] = asyncio.ensure_future,
+    ) -> _Call:
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+            return call
+        task = spawn(fn())
+        call = self._calls[key] = _Call(task)
+        self.calls += 1
+        task.add_done_callback(lambda done: self._done(key, call))
+        return call
+
+    def _done(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            # Mark the exception as retrieved: a detached call may have no waiter.
+            call.task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of `fn()`, sharing the call with concurrent callers."""
+        call = self._join(key, fn)
+        call.waiters += 1
+        try:
+            # shield(): this waiter being cancelled must not cancel the call itself.
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.detached and not call.task.done():
+                # Last one out: nobody wants the result any more. Forget the
+                # call first, so a newcomer starts afresh instead of joining
+                # a call that is being torn down.
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+                self.cancelled += 1
+            raise
+        finally:
+            call.waiters -= 1
+
+    def start(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        spawn: Callable[[Awaitable[Any]], asyncio.Future] = asyncio.ensure_future,
+    ) -> asyncio.Future:
+        """Start `fn()` (or join the call in flight) without waiting for it.
+
+        The call runs to completion even if no one ever waits for it. `spawn`
+        schedules it, e.g. `Resources.spawn` so that shutdown waits for it.
+        """
+        started = self.calls
+        call = self._join(key, fn, spawn)
+        if self.calls == started and not call.detached:
+            # Joined a call someone else scheduled: track it all the same.
+            spawn(asyncio.wait([call.task]))
+        call.detached = True
+        return call.task
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "calls": self.calls,
+            "shared": self.shared,
+            "cancelled": self.cancelled,
+        }
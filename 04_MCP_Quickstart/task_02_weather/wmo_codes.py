@@ -0,0 +1,232 @@
+"""WMO 4677 present-weather codes (ww 00–99), built once at import time.
+
+Open-Meteo reports a subset of these codes with its own, simpler wording
+(0 = "Clear sky", 3 = "Overcast", 96 = "Thunderstorm with slight hail", ...).
+Those codes keep Open-Meteo's wording and have translations; the remaining
+codes use the WMO 4677 wording in English.
+"""
+
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class WmoCode(NamedTuple):
+    """One row of the code table."""
+
+    description: str
+    day: str          # wording while the sun is up, e.g. "Sunny"
+    night: str        # wording after dark, e.g. "Clear"
+    icon_day: str
+    icon_night: str
+
+
+def _same(description: str, icon: str) -> WmoCode:
+    """A code that looks the same by day and by night."""
+    return WmoCode(description, description, description, icon, icon)
+
+
+def _shaded(description: str, icon: str) -> WmoCode:
+    """A code worded the same by day and by night, with a day and a night icon."""
+    return WmoCode(description, description, description, f"{icon}-day", f"{icon}-night")
+
+
+def _sky(description: str, day: str, night: str, icon: str) -> WmoCode:
+    """A code whose wording and icon depend on daylight."""
+    return WmoCode(description, day, night, f"{icon}-day", f"{icon}-night")
+
+
+# Indexed by code: WMO_CODES[63] is the row for code 63.
+WMO_CODES: tuple[WmoCode, ...] = (
+    # 00–03: Open-Meteo uses these for cloud cover
+    _sky("Clear sky", "Sunny", "Clear", "clear"),
+    _sky("Mainly clear", "Mainly sunny", "Mainly clear", "mostly-clear"),
+    _shaded("Partly cloudy", "partly-cloudy"),
+    _same("Overcast", "overcast"),
+    # 04–19: no precipitation at the station
+    _same("Visibility reduced by smoke", "smoke"),
+    _same("Haze", "haze"),
+    _same("Widespread dust in suspension", "dust"),
+    _same("Dust or sand raised by wind", "dust"),
+    _same("Dust or sand whirls", "dust"),
+    _same("Duststorm or sandstorm within sight", "dust"),
+    _same("Mist", "mist"),
+    _same("Patches of shallow fog", "fog"),
+    _same("Continuous shallow fog", "fog"),
+    _same("Lightning visible, no thunder heard", "lightning"),
+    _same("Precipitation within sight, not reaching the ground", "overcast"),
+    _same("Distant precipitation within sight", "overcast"),
+    _same("Nearby precipitation within sight", "overcast"),
+    _same("Thunder without precipitation", "thunderstorm"),
+    _same("Squalls", "wind"),
+    _same("Funnel cloud (tornado or waterspout)", "tornado"),
+    # 20–29: precipitation or fog during the past hour, but not now
+    _same("Recent drizzle or snow grains", "drizzle"),
+    _same("Recent rain", "rain"),
+    _same("Recent snow", "snow"),
+    _same("Recent rain and snow", "sleet"),
+    _same("Recent freezing drizzle or rain", "freezing-rain"),
+    _same("Recent rain showers", "rain-showers"),
+    _same("Recent snow showers", "snow-showers"),
+    _same("Recent hail showers", "hail"),
+    _same("Recent fog", "fog"),
+    _same("Recent thunderstorm", "thunderstorm"),
+    # 30–39: duststorm, sandstorm, drifting or blowing snow
+    _same("Slight or moderate duststorm, decreasing", "dust"),
+    _same("Slight or moderate duststorm", "dust"),
+    _same("Slight or moderate duststorm, increasing", "dust"),
+    _same("Severe duststorm, decreasing", "dust"),
+    _same("Severe duststorm", "dust"),
+    _same("Severe duststorm, increasing", "dust"),
+    _same("Slight or moderate drifting snow", "blowing-snow"),
+    _same("Heavy drifting snow", "blowing-snow"),
+    _same("Slight or moderate blowing snow", "blowing-snow"),
+    _same("Heavy blowing snow", "blowing-snow"),
+    # 40–49: fog at the time of observation
+    _same("Fog at a distance", "fog"),
+    _same("Fog in patches", "fog"),
+    _same("Fog, sky visible, thinning", "fog"),
+    _same("Fog, sky obscured, thinning", "fog"),
+    _same("Fog, sky visible", "fog"),
+    _same("Fog", "fog"),
+    _same("Fog, sky visible, thickening", "fog"),
+    _same("Fog, sky obscured, thickening", "fog"),
+    _same("Icy fog", "fog"),
+    _same("Icy fog, sky obscured", "fog"),
+    # 50–59: drizzle
+    _same("Intermittent light drizzle", "drizzle"),
+    _same("Light drizzle", "drizzle"),
+    _same("Intermittent moderate drizzle", "drizzle"),
+    _same("Moderate drizzle", "drizzle"),
+    _same("Intermittent dense drizzle", "drizzle"),
+    _same("Dense drizzle", "drizzle"),
+    _same("Light freezing drizzle", "freezing-drizzle"),
+    _same("Dense freezing drizzle", "freezing-drizzle"),
+    _same("Light drizzle and rain", "drizzle"),
+    _same("Heavy drizzle and rain", "rain"),
+    # 60–69: rain
+    _same("Intermittent slight rain", "rain"),
+    _same("Slight rain", "rain"),
+    _same("Intermittent moderate rain", "rain"),
+    _same("Moderate rain", "rain"),
+    _same("Intermittent heavy rain", "heavy-rain"),
+    _same("Heavy rain", "heavy-rain"),
+    _same("Light freezing rain", "freezing-rain"),
+    _same("Heavy freezing rain", "freezing-rain"),
+    _same("Light rain and snow", "sleet"),
+    _same("Heavy rain and snow", "sleet"),
+    # 70–79: solid precipitation, not in showers
+    _same("Intermittent slight snow", "snow"),
+    _same("Slight snow", "snow"),
+    _same("Intermittent moderate snow", "snow"),
+    _same("Moderate snow", "snow"),
+    _same("Intermittent heavy snow", "heavy-snow"),
+    _same("Heavy snow", "heavy-snow"),
+    _same("Diamond dust", "snow"),
+    _same("Snow grains", "snow-grains"),
+    _same("Isolated star-like snow crystals", "snow"),
+    _same("Ice pellets", "ice-pellets"),
+    # 80–90: showers
+    _shaded("Slight rain showers", "rain-showers"),
+    _shaded("Moderate rain showers", "rain-showers"),
+    _same("Violent rain showers", "heavy-rain"),
+    _same("Slight rain and snow showers", "sleet"),
+    _same("Heavy rain and snow showers", "sleet"),
+    _shaded("Slight snow showers", "snow-showers"),
+    _shaded("Heavy snow showers", "snow-showers"),
+    _same("Slight snow pellet showers", "hail"),
+    _same("Heavy snow pellet showers", "hail"),
+    _same("Slight hail showers", "hail"),
+    _same("Heavy hail showers", "hail"),
+    # 91–99: thunderstorm now or during the past hour
+    _same("Slight rain after a thunderstorm", "rain"),
+    _same("Heavy rain after a thunderstorm", "heavy-rain"),
+    _same("Slight snow or hail after a thunderstorm", "snow"),
+    _same("Heavy snow or hail after a thunderstorm", "heavy-snow"),
+    _same("Thunderstorm", "thunderstorm"),
+    _same("Thunderstorm with slight hail", "thunderstorm-hail"),
+    _same("Heavy thunderstorm with rain or snow", "thunderstorm"),
+    _same("Thunderstorm with duststorm", "thunderstorm"),
+    _same("Thunderstorm with heavy hail", "thunderstorm-hail"),
+)
+assert len(WMO_CODES) == 100
+
+# Translations of the codes Open-Meteo actually reports.
+LOCALIZED: MappingProxyType[str, MappingProxyType[int, str]] = MappingProxyType({
+    "de": MappingProxyType({
+        0: "Klarer Himmel", 1: "Überwiegend klar", 2: "Teilweise bewölkt", 3: "Bedeckt",
+        45: "Nebel", 48: "Eisnebel",
+        51: "Leichter Nieselregen", 53: "Mäßiger Nieselregen", 55: "Starker Nieselregen",
+        56: "Leichter gefrierender Nieselregen", 57: "Starker gefrierender Nieselregen",
+        61: "Leichter Regen", 63: "Mäßiger Regen", 65: "Starker Regen",
+        66: "Leichter gefrierender Regen", 67: "Starker gefrierender Regen",
+        71: "Leichter Schneefall", 73: "Mäßiger Schneefall", 75: "Starker Schneefall",
+        77: "Schneegriesel",
+        80: "Leichte Regenschauer", 81: "Mäßige Regenschauer", 82: "Heftige Regenschauer",
+        85: "Leichte Schneeschauer", 86: "Starke Schneeschauer",
+        95: "Gewitter", 96: "Gewitter mit leichtem Hagel", 99: "Gewitter mit starkem Hagel",
+    }),
+    "es": MappingProxyType({
+        0: "Cielo despejado", 1: "Mayormente despejado", 2: "Parcialmente nublado", 3: "Cubierto",
+        45: "Niebla", 48: "Niebla helada",
+        51: "Llovizna ligera", 53: "Llovizna moderada", 55: "Llovizna densa",
+        56: "Llovizna helada ligera", 57: "Llovizna helada densa",
+        61: "Lluvia ligera", 63: "Lluvia moderada", 65: "Lluvia fuerte",
+        66: "Lluvia helada ligera", 67: "Lluvia helada fuerte",
+        71: "Nevada ligera", 73: "Nevada moderada", 75: "Nevada fuerte",
+        77: "Granos de nieve",
+        80: "Chubascos ligeros", 81: "Chubascos moderados", 82: "Chubascos violentos",
+        85: "Chubascos de nieve ligeros", 86: "Chubascos de nieve fuertes",
+        95: "Tormenta", 96: "Tormenta con granizo ligero", 99: "Tormenta con granizo fuerte",
+    }),
+    "fr": MappingProxyType({
+        0: "Ciel dégagé", 1: "Principalement dégagé", 2: "Partiellement nuageux", 3: "Couvert",
+        45: "Brouillard", 48: "Brouillard givrant",
+        51: "Bruine légère", 53: "Bruine modérée", 55: "Bruine dense",
+        56: "Bruine verglaçante légère", 57: "Bruine verglaçante dense",
+        61: "Pluie faible", 63: "Pluie modérée", 65: "Forte pluie",
+        66: "Pluie verglaçante faible", 67: "Forte pluie verglaçante",
+        71: "Neige faible", 73: "Neige modérée", 75: "Forte neige",
+        77: "Neige en grains",
+        80: "Averses de pluie faibles", 81: "Averses de pluie modérées",
+        82: "Averses de pluie violentes",
+        85: "Averses de neige faibles", 86: "Fortes averses de neige",
+        95: "Orage", 96: "Orage avec grêle faible", 99: "Orage avec forte grêle",
+    }),
+})
+
+
+def _row(code: object) -> WmoCode | None:
+    """The table row for `code`, or None for a missing or unknown code."""
+    # The old dict lookup also matched 3.0 for 3; keep accepting that.
+    if isinstance(code, float) and code.is_integer():
+        code = int(code)
+    if isinstance(code, int) and 0 <= code < len(WMO_CODES):
+        return WMO_CODES[code]
+    return None
+
+
+def describe(code: int | None, lang: str = "en", is_day: bool | None = None) -> str:
+    """Human-readable text for a WMO code.
+
+    With `is_day` set, the day or night wording is used ("Sunny" / "Clear").
+    Languages other than English fall back to English for codes that have
+    no translation. A missing or unknown code gives "Unknown condition".
+    """
+    row = _row(code)
+    if row is None:
+        return f"Unknown condition (code {code})"
+    if lang != "en":
+        text = LOCALIZED.get(lang, {}).get(code)
+        if text is not None:
+            return text
+    if is_day is None:
+        return row.description
+    return row.day if is_day else row.night
+
+
+def icon(code: int | None, is_day: bool = True) -> str:
+    """Icon key for a WMO code, e.g. "partly-cloudy-night"."""
+    row = _row(code)
+    if row is None:
+        return "unknown"
+    return row.icon_day if is_day else row.icon_night
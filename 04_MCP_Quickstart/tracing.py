@@ -0,0 +1,169 @@
+"""Opt-in OpenTelemetry tracing for the quickstart MCP servers.
+
+Off unless MCP_TRACING is set, and then only if the OpenTelemetry SDK is
+installed (`uv add opentelemetry-sdk`):
+
+    MCP_TRACING=console     spans printed to stderr (stdout carries stdio MCP)
+    MCP_TRACING=otlp-file   spans appended as OTLP/JSON lines to MCP_TRACING_FILE
+                            (needs opentelemetry-exporter-otlp-proto-common)
+
+`instrument(mcp)` opens one span per tool call. The parent is taken from
+the W3C trace context the client sent: `traceparent` / `tracestate` in the
+request's `_meta`, or else in the HTTP headers. Server code adds child spans
+with `span()` and `record_span()`; both do nothing while tracing is off.
+"""
+
+import base64
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from contextlib import nullcontext
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover - exercised only without opentelemetry
+    trace = None
+
+TRACING = os.environ.get("MCP_TRACING", "").strip().lower()
+TRACING_FILE = os.environ.get("MCP_TRACING_FILE", "traces.otlp.jsonl")
+# Trace-context keys looked up in _meta and HTTP headers
+PROPAGATION_KEYS = ("traceparent", "tracestate", "baggage")
+
+logger = logging.getLogger(__name__)
+
+# Set by instrument() once tracing is configured; None means "off".
+_tracer: Any = None
+
+
+def _otlp_file_exporter(path: str) -> Any:
+    """A span exporter writing one OTLP/JSON `ExportTraceServiceRequest` per line."""
+    from google.protobuf import json_format
+    from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+    def hex_ids(node: Any) -> None:
+        # OTLP/JSON wants hex ids; protobuf's JSON mapping produces base64.
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ("traceId", "spanId", "parentSpanId") and isinstance(value, str):
+                    node[key] = base64.b64decode(value).hex()
+                else:
+                    hex_ids(value)
+        elif isinstance(node, list):
+            for item in node:
+                hex_ids(item)
+
+    class OtlpJsonFileExporter(SpanExporter):
+        def __init__(self) -> None:
+            self._out = open(path, "a", encoding="utf-8")
+            self._lock = threading.Lock()
+
+        def export(self, spans: Sequence[Any]) -> Any:
+            document = json_format.MessageToDict(encode_spans(spans))
+            hex_ids(document)
+            with self._lock:
+                self._out.write(json.dumps(document, separators=(",", ":")) + "\n")
+                self._out.flush()
+            return SpanExportResult.SUCCESS
+
+        def shutdown(self) -> None:
+            with self._lock:
+                self._out.close()
+
+    return OtlpJsonFileExporter()
+
+
+def _configure(service_name: str) -> Any:
+    """Install a tracer provider for MCP_TRACING; return a tracer or None."""
+    if TRACING not in ("console", "otlp-file"):
+        logger.warning("Unknown MCP_TRACING=%r; use console or otlp-file", TRACING)
+        return None
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+        if TRACING == "console":
+            exporter = ConsoleSpanExporter(out=sys.stderr)
+        else:
+            exporter = _otlp_file_exporter(TRACING_FILE)
+    except ImportError as exc:
+        logger.warning("MCP_TRACING=%s needs %s; tracing is off", TRACING, exc.name)
+        return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    # Exported from a background thread; flushed when the process exits.
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return trace.get_tracer("mcp-quickstart")
+
+
+def _carrier(context: Any) -> dict[str, str]:
+    """W3C trace-context fields sent by the client, from _meta or HTTP headers."""
+    try:
+        request_context = context.request_context
+    except (AttributeError, ValueError):  # no context, or called outside a request
+        return {}
+    carrier: dict[str, str] = {}
+    headers = getattr(request_context.request, "headers", None)
+    if headers is not None:
+        carrier.update((key, headers[key]) for key in PROPAGATION_KEYS if key in headers)
+    # _meta travels with the MCP message itself, so it wins over the transport.
+    extra = getattr(request_context.meta, "model_extra", None) or {}
+    carrier.update((key, str(extra[key])) for key in PROPAGATION_KEYS if key in extra)
+    return carrier
+
+
+def instrument(mcp: FastMCP) -> None:
+    """Open a span around every tool call of `mcp` when MCP_TRACING is set."""
+    global _tracer
+    if not TRACING or trace is None or getattr(mcp, "_tracing", False):
+        return
+    if _tracer is None:
+        _tracer = _configure(mcp.name)
+        if _tracer is None:
+            return
+    mcp._tracing = True
+
+    manager = mcp._tool_manager
+    call_tool = manager.call_tool
+
+    async def traced_call_tool(name: str, arguments: dict[str, Any], *args, **kwargs) -> Any:
+        context = kwargs.get("context", args[0] if args else None)
+        parent = propagate.extract(_carrier(context))
+        with _tracer.start_as_current_span(
+            f"tools/call {name}",
+            context=parent,
+            kind=trace.SpanKind.SERVER,
+            attributes={"mcp.server": mcp.name, "mcp.tool.name": name},
+        ):
+            return await call_tool(name, arguments, *args, **kwargs)
+
+    manager.call_tool = traced_call_tool
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """Context manager for a child span of the current span (no-op when off)."""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def record_span(name: str, seconds: float, **attributes: Any) -> None:
+    """Record a span that has just ended after taking `seconds`.
+
+    For work timed by someone else (e.g. a callback that reports durations),
+    where wrapping the code in `span()` is not possible.
+    """
+    if _tracer is None:
+        return
+    end = time.time_ns()
+    child = _tracer.start_span(name, attributes=attributes, start_time=end - int(seconds * 1e9))
+    child.end(end_time=end)
@@ -1,115 +1,32 @@
 # -*- coding: utf-8 -*-
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
-
-# ── Palette ───────────────────────────────────────────────────────
-BG      = RGBColor(0x0D, 0x1B, 0x2A)
-PANEL   = RGBColor(0x16, 0x2B, 0x3C)
-PANEL2  = RGBColor(0x0F, 0x22, 0x30)
-ACCENT  = RGBColor(0x00, 0xB4, 0xD8)
-ORANGE  = RGBColor(0xFF, 0x9F, 0x1C)
-GREEN   = RGBColor(0x06, 0xD6, 0xA0)
-YELLOW  = RGBColor(0xFF, 0xD1, 0x66)
-PURPLE  = RGBColor(0xC7, 0x7D, 0xFF)
-PINK    = RGBColor(0xFF, 0x6B, 0x9D)
-WHITE   = RGBColor(0xFF, 0xFF, 0xFF)
-LGRAY   = RGBColor(0xB0, 0xC4, 0xD8)
-RED     = RGBColor(0xFF, 0x5C, 0x5C)
-
-prs = Presentation()
-prs.slide_width  = Inches(13.33)
-prs.slide_height = Inches(7.5)
-blank = prs.slide_layouts[6]
-
-# ── Helpers ───────────────────────────────────────────────────────
-def bg(slide, color=BG):
-    f = slide.background.fill
-    f.solid()
-    f.fore_color.rgb = color
-
-def rect(slide, x, y, w, h, fill=None, border=None, bw=Pt(0)):
-    s = slide.shapes.add_shape(1, Inches(x), Inches(y), Inches(w), Inches(h))
-    s.fill.solid() if fill else s.fill.background()
-    if fill: s.fill.fore_color.rgb = fill
-    if border:
-        s.line.color.rgb = border
-        s.line.width = bw
-    else:
-        s.line.fill.background()
-    s.text = ""
-    return s
-
-def txt(slide, text, x, y, w, h, size=16, bold=False, color=WHITE,
-        align=PP_ALIGN.LEFT, italic=False, name="Segoe UI"):
-    tb = slide.shapes.add_textbox(Inches(x), Inches(y), Inches(w), Inches(h))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p  = tf.paragraphs[0]
-    p.alignment = align
-    r = p.add_run()
-    r.text = text
-    r.font.size      = Pt(size)
-    r.font.bold      = bold
-    r.font.italic    = italic
-    r.font.color.rgb = color
-    r.font.name      = name
-    return tb
-
-def header(slide, title, subtitle=""):
-    rect(slide, 0, 0, 13.33, 1.15, fill=ACCENT)
-    txt(slide, title, 0.3, 0.08, 12.5, 0.65, size=32, bold=True, color=BG)
-    if subtitle:
-        txt(slide, subtitle, 0.3, 0.70, 12.5, 0.38, size=15, color=BG, italic=True)
-
-def slide_num(slide, n):
-    txt(slide, str(n), 12.85, 7.1, 0.4, 0.3, size=12, color=LGRAY, align=PP_ALIGN.RIGHT)
-
-def bullets(slide, items, x, y, w, icon=">>", icol=ACCENT, size=15, gap=0.50):
-    for i, item in enumerate(items):
-        yy = y + i * gap
-        txt(slide, icon, x, yy, 0.38, 0.42, size=size, bold=True, color=icol)
-        txt(slide, item, x + 0.38, yy, w - 0.38, 0.42, size=size, color=LGRAY)
-
-def card(slide, x, y, w, h, col, title, body, title_size=16, body_size=14):
-    rect(slide, x, y, w, h, fill=PANEL, border=col, bw=Pt(2))
-    rect(slide, x, y, w, 0.10, fill=col)
-    txt(slide, title, x+0.15, y+0.15, w-0.3, 0.48, size=title_size, bold=True, color=col)
-    txt(slide, body,  x+0.15, y+0.68, w-0.3, h-0.8, size=body_size, color=LGRAY)
+"""MCP_Complete_Guide.pptx — the 17-slide MCP deep dive, as a deck spec."""
+
+from deck import (
+    ACCENT, BG, GREEN, LGRAY, ORANGE, PANEL, PANEL2, PINK, PURPLE, RED, WHITE, YELLOW,
+    Arrow, Bullets, Card, Deck, Header, LabelBox, Rect, Slide, Text, grid, main,
+)
+
+slides = []
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 1 — Title
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-rect(sl, 0, 0,     13.33, 0.10, fill=ACCENT)
-rect(sl, 0, 7.40,  13.33, 0.10, fill=ORANGE)
-
-txt(sl, "What is MCP?", 0.5, 1.3, 12.3, 1.4, size=56, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-txt(sl, "Model Context Protocol — A Complete Guide",
-    0.5, 2.75, 12.3, 0.65, size=24, color=ACCENT, align=PP_ALIGN.CENTER, italic=True)
-rect(sl, 3.8, 3.55, 5.7, 0.06, fill=ORANGE)
-txt(sl, "Architecture  |  Components  |  Transport  |  Lifecycle  |  Use Cases",
-    0.5, 3.72, 12.3, 0.5, size=17, color=LGRAY, align=PP_ALIGN.CENTER)
-txt(sl, "Comprehensive Study Guide", 0.5, 6.7, 12.3, 0.4,
-    size=14, color=ORANGE, align=PP_ALIGN.CENTER)
+slides.append(Slide(numbered=False, elements=[
+    Rect(0, 0,     13.33, 0.10, fill=ACCENT),
+    Rect(0, 7.40,  13.33, 0.10, fill=ORANGE),
+    Text("What is MCP?", 0.5, 1.3, 12.3, 1.4, size=56, bold=True, color=WHITE, align="center"),
+    Text("Model Context Protocol — A Complete Guide", 0.5, 2.75, 12.3, 0.65,
+         size=24, color=ACCENT, align="center", italic=True),
+    Rect(3.8, 3.55, 5.7, 0.06, fill=ORANGE),
+    Text("Architecture  |  Components  |  Transport  |  Lifecycle  |  Use Cases",
+         0.5, 3.72, 12.3, 0.5, size=17, color=LGRAY, align="center"),
+    Text("Comprehensive Study Guide", 0.5, 6.7, 12.3, 0.4, size=14, color=ORANGE, align="center"),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 2 — MCP in One Line
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "MCP in One Line", "The simplest explanation")
-
-rect(sl, 0.4, 1.3, 12.5, 1.4, fill=PANEL2, border=ACCENT, bw=Pt(2))
-txt(sl,
-    '"MCP is an open standard that lets AI applications connect to external\n'
-    ' tools, data sources, and services in a structured, secure way."',
-    0.65, 1.38, 12.0, 1.22, size=20, color=WHITE, italic=True)
-
-# Three analogy cards
 analogy_data = [
     (ACCENT,  "USB-C Port",
      "Just like USB-C is one universal\nconnector for all devices,\nMCP is one protocol for all AI tools."),
@@ -118,24 +35,25 @@ analogy_data = [
     (GREEN,   "Plugin System",
      "Like browser extensions add\ncapabilities to your browser,\nMCP servers add powers to AI."),
 ]
-for i, (col, title, desc) in enumerate(analogy_data):
-    cx = 0.4 + i * 4.3
-    rect(sl, cx, 2.9, 4.1, 3.9, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, 2.9, 4.1, 0.10, fill=col)
-    txt(sl, "Analogy:", cx+0.15, 3.05, 3.8, 0.36, size=12, color=LGRAY, italic=True)
-    txt(sl, title, cx+0.15, 3.42, 3.8, 0.5, size=20, bold=True, color=col)
-    txt(sl, desc, cx+0.15, 4.0, 3.8, 2.5, size=14, color=LGRAY)
-slide_num(sl, 2)
+
+slides.append(Slide([
+    Header("MCP in One Line", "The simplest explanation"),
+    Rect(0.4, 1.3, 12.5, 1.4, fill=PANEL2, border=ACCENT, border_width=2),
+    Text('"MCP is an open standard that lets AI applications connect to external\n'
+         ' tools, data sources, and services in a structured, secure way."',
+         0.65, 1.38, 12.0, 1.22, size=20, color=WHITE, italic=True),
+    # Three analogy cards
+    *(Card(cx, cy, 4.1, 3.9, col, title, desc,
+           title_y=0.52, title_h=0.5, title_size=20, body_y=1.1, body_h=2.5,
+           decor=(Text("Analogy:", cx + 0.15, cy + 0.15, 3.8, 0.36,
+                       size=12, color=LGRAY, italic=True),))
+      for cx, cy, (col, title, desc) in grid(analogy_data, 3, 0.4, 2.9, 4.3)),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 3 — Background & Origin
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Background & Origin", "Where MCP came from")
-
-# Timeline-style horizontal layout
 timeline = [
     (ACCENT,  "Nov 2024",      "Anthropic releases MCP as an open standard to the public."),
     (ORANGE,  "The Problem",   "AI models couldn't connect to tools without custom code for each integration."),
@@ -143,122 +61,105 @@ timeline = [
     (YELLOW,  "Open Source",   "MCP spec & SDKs are fully open source — anyone can build servers."),
     (PURPLE,  "Adoption",      "Quickly adopted by Cursor, Zed, Replit, Codeium and many others."),
 ]
-for i, (col, label, desc) in enumerate(timeline):
-    cy = 1.35 + i * 1.15
-    rect(sl, 0.35, cy, 2.2, 0.85, fill=col)
-    txt(sl, label, 0.35, cy+0.18, 2.2, 0.5, size=15, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    rect(sl, 2.55, cy+0.35, 0.5, 0.06, fill=col)   # connector
-    rect(sl, 3.05, cy, 9.9, 0.85, fill=PANEL, border=col, bw=Pt(1))
-    txt(sl, desc, 3.2, cy+0.18, 9.5, 0.52, size=14, color=LGRAY)
-slide_num(sl, 3)
+
+# Timeline-style horizontal layout
+slides.append(Slide([
+    Header("Background & Origin", "Where MCP came from"),
+    *(element
+      for _, cy, (col, label, desc) in grid(timeline, 1, 0, 1.35, 0, 1.15)
+      for element in (
+          LabelBox(0.35, cy, 2.2, 0.85, label, fill=col, color=BG, size=15,
+                   text_y=0.18, text_h=0.5),
+          Rect(2.55, cy + 0.35, 0.5, 0.06, fill=col),   # connector
+          Rect(3.05, cy, 9.9, 0.85, fill=PANEL, border=col, border_width=1),
+          Text(desc, 3.2, cy + 0.18, 9.5, 0.52, size=14, color=LGRAY),
+      )),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 4 — The Problem MCP Solves
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "The Problem MCP Solves", "Why AI needed a standard protocol")
-
-# Top: the chaos diagram
-rect(sl, 0.35, 1.3, 12.6, 2.6, fill=PANEL2, border=RED, bw=Pt(1))
-txt(sl, "BEFORE MCP — Every tool needed its own custom glue code",
-    0.55, 1.35, 12.0, 0.45, size=15, bold=True, color=RED)
-
-# AI box in center
-rect(sl, 5.5, 1.95, 2.3, 0.9, fill=RGBColor(0x1A,0x1A,0x2E), border=RED, bw=Pt(2))
-txt(sl, "AI Model", 5.5, 2.12, 2.3, 0.55, size=14, bold=True, color=RED, align=PP_ALIGN.CENTER)
-
 tools_before = ["File System", "Database", "Web API", "Email", "Slack", "GitHub"]
+tools_after = ["File Srv", "DB Srv", "Web Srv", "Email Srv", "Slack Srv", "Git Srv"]
 cols_b = [0.45, 1.9, 3.35, 8.0, 9.45, 10.9]
-for j, (tool, cx) in enumerate(zip(tools_before, cols_b)):
-    rect(sl, cx, 2.0, 1.3, 0.8, fill=PANEL, border=LGRAY, bw=Pt(1))
-    txt(sl, tool, cx, 2.18, 1.3, 0.45, size=11, color=LGRAY, align=PP_ALIGN.CENTER)
-    txt(sl, "custom\ncode", cx+0.2, 2.55, 0.9, 0.35, size=9, color=RED, align=PP_ALIGN.CENTER, italic=True)
-
-txt(sl, "Result: N tools = N custom integrations. Hard to build, maintain & scale.",
-    0.55, 3.58, 12.0, 0.4, size=13, color=RED, italic=True)
 
-# Bottom: MCP solution
-rect(sl, 0.35, 4.1, 12.6, 2.85, fill=PANEL2, border=GREEN, bw=Pt(1))
-txt(sl, "WITH MCP — One standard protocol for everything",
-    0.55, 4.15, 12.0, 0.45, size=15, bold=True, color=GREEN)
-
-rect(sl, 5.5, 4.7, 2.3, 0.9, fill=RGBColor(0x0A,0x25,0x15), border=GREEN, bw=Pt(2))
-txt(sl, "AI Model", 5.5, 4.88, 2.3, 0.55, size=14, bold=True, color=GREEN, align=PP_ALIGN.CENTER)
-
-txt(sl, "MCP Protocol", 4.5, 5.72, 4.3, 0.38, size=13, bold=True, color=ACCENT, align=PP_ALIGN.CENTER)
-rect(sl, 4.5, 5.75, 4.3, 0.06, fill=ACCENT)
-
-tools_after = ["File Srv", "DB Srv", "Web Srv", "Email Srv", "Slack Srv", "Git Srv"]
-for j, (tool, cx) in enumerate(zip(tools_after, cols_b)):
-    rect(sl, cx, 6.0, 1.3, 0.7, fill=PANEL, border=GREEN, bw=Pt(1))
-    txt(sl, tool, cx, 6.17, 1.3, 0.38, size=11, color=GREEN, align=PP_ALIGN.CENTER)
-slide_num(sl, 4)
+slides.append(Slide([
+    Header("The Problem MCP Solves", "Why AI needed a standard protocol"),
+    # Top: the chaos diagram
+    Rect(0.35, 1.3, 12.6, 2.6, fill=PANEL2, border=RED, border_width=1),
+    Text("BEFORE MCP — Every tool needed its own custom glue code",
+         0.55, 1.35, 12.0, 0.45, size=15, bold=True, color=RED),
+    LabelBox(5.5, 1.95, 2.3, 0.9, "AI Model", fill="1A1A2E", color=RED, size=14,
+             border=RED, border_width=2, text_y=0.17, text_h=0.55),
+    *(element
+      for tool, cx in zip(tools_before, cols_b)
+      for element in (
+          LabelBox(cx, 2.0, 1.3, 0.8, tool, fill=PANEL, color=LGRAY, size=11, bold=False,
+                   border=LGRAY, border_width=1, text_y=0.18, text_h=0.45),
+          Text("custom\ncode", cx + 0.2, 2.55, 0.9, 0.35,
+               size=9, color=RED, align="center", italic=True),
+      )),
+    Text("Result: N tools = N custom integrations. Hard to build, maintain & scale.",
+         0.55, 3.58, 12.0, 0.4, size=13, color=RED, italic=True),
+    # Bottom: MCP solution
+    Rect(0.35, 4.1, 12.6, 2.85, fill=PANEL2, border=GREEN, border_width=1),
+    Text("WITH MCP — One standard protocol for everything",
+         0.55, 4.15, 12.0, 0.45, size=15, bold=True, color=GREEN),
+    LabelBox(5.5, 4.7, 2.3, 0.9, "AI Model", fill="0A2515", color=GREEN, size=14,
+             border=GREEN, border_width=2, text_y=0.18, text_h=0.55),
+    Text("MCP Protocol", 4.5, 5.72, 4.3, 0.38, size=13, bold=True, color=ACCENT, align="center"),
+    Rect(4.5, 5.75, 4.3, 0.06, fill=ACCENT),
+    *(LabelBox(cx, 6.0, 1.3, 0.7, tool, fill=PANEL, color=GREEN, size=11, bold=False,
+               border=GREEN, border_width=1, text_y=0.17, text_h=0.38)
+      for tool, cx in zip(tools_after, cols_b)),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 5 — Architecture Overview
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "MCP Architecture Overview", "The big picture")
-
-# HOST container
-rect(sl, 0.3, 1.25, 12.73, 2.5, fill=RGBColor(0x08,0x1C,0x2B), border=ACCENT, bw=Pt(1.5))
-txt(sl, "HOST APPLICATION  (e.g. Claude Desktop / Cursor / VS Code)",
-    0.45, 1.3, 8, 0.42, size=13, bold=True, color=ACCENT)
-
-# Clients inside host
-for i, lbl in enumerate(["MCP Client 1", "MCP Client 2", "MCP Client 3"]):
-    cx = 0.5 + i * 4.1
-    rect(sl, cx, 1.82, 3.8, 1.6, fill=RGBColor(0x12,0x2B,0x3E), border=ACCENT, bw=Pt(1))
-    txt(sl, lbl, cx, 2.28, 3.8, 0.5, size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-    txt(sl, "manages connection", cx, 2.78, 3.8, 0.42,
-        size=11, color=LGRAY, align=PP_ALIGN.CENTER, italic=True)
-
-# Transport band
-rect(sl, 0.3, 3.85, 12.73, 0.55, fill=RGBColor(0x1A,0x0F,0x00), border=ORANGE, bw=Pt(1))
-txt(sl, "TRANSPORT LAYER  --  stdio (local)   |   HTTP + SSE (remote)",
-    0.5, 3.9, 12.3, 0.38, size=14, color=ORANGE, align=PP_ALIGN.CENTER, bold=True)
-
-# Server boxes
 server_info = [
     (ACCENT, "MCP Server A", "File System"),
     (GREEN,  "MCP Server B", "Database"),
     (ORANGE, "MCP Server C", "Web / APIs"),
 ]
-for i, (col, name, sub) in enumerate(server_info):
-    cx = 0.5 + i * 4.1
-    rect(sl, cx, 4.55, 3.8, 1.35, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, 4.55, 3.8, 0.10, fill=col)
-    txt(sl, name, cx, 4.72, 3.8, 0.48, size=15, bold=True, color=col, align=PP_ALIGN.CENTER)
-    txt(sl, sub,  cx, 5.22, 3.8, 0.42, size=13, color=LGRAY, align=PP_ALIGN.CENTER)
-
-# Capabilities row
-cap_data = [
-    (ACCENT, "Tools"), (GREEN, "Resources"), (ORANGE, "Prompts"),
-    (ACCENT, "Tools"), (GREEN, "Resources"), (ORANGE, "Prompts"),
-    (ACCENT, "Tools"), (GREEN, "Resources"), (ORANGE, "Prompts"),
-]
-positions = []
-for srv in range(3):
-    for cap in range(3):
-        positions.append((0.5 + srv*4.1 + cap*1.27, 6.05))
-
-for k, ((col, lbl), (cx, cy)) in enumerate(zip(cap_data, positions)):
-    rect(sl, cx, cy, 1.2, 0.55, fill=RGBColor(0x0A,0x20,0x2E), border=col, bw=Pt(1))
-    txt(sl, lbl, cx, cy+0.1, 1.2, 0.38, size=10, color=col, align=PP_ALIGN.CENTER)
-slide_num(sl, 5)
+capabilities = [(ACCENT, "Tools"), (GREEN, "Resources"), (ORANGE, "Prompts")]
+
+slides.append(Slide([
+    Header("MCP Architecture Overview", "The big picture"),
+    # HOST container
+    Rect(0.3, 1.25, 12.73, 2.5, fill="081C2B", border=ACCENT, border_width=1.5),
+    Text("HOST APPLICATION  (e.g. Claude Desktop / Cursor / VS Code)",
+         0.45, 1.3, 8, 0.42, size=13, bold=True, color=ACCENT),
+    # Clients inside host
+    *(element
+      for cx, cy, label in grid(["MCP Client 1", "MCP Client 2", "MCP Client 3"], 3, 0.5, 1.82, 4.1)
+      for element in (
+          LabelBox(cx, cy, 3.8, 1.6, label, fill="122B3E", size=14,
+                   border=ACCENT, border_width=1, text_y=0.46, text_h=0.5),
+          Text("manages connection", cx, 2.78, 3.8, 0.42,
+               size=11, color=LGRAY, align="center", italic=True),
+      )),
+    # Transport band
+    Rect(0.3, 3.85, 12.73, 0.55, fill="1A0F00", border=ORANGE, border_width=1),
+    Text("TRANSPORT LAYER  --  stdio (local)   |   HTTP + SSE (remote)",
+         0.5, 3.9, 12.3, 0.38, size=14, color=ORANGE, align="center", bold=True),
+    # Server boxes
+    *(Card(cx, cy, 3.8, 1.35, col, name, sub, pad=0, align="center",
+           title_y=0.17, title_h=0.48, title_size=15, body_y=0.67, body_h=0.42, body_size=13)
+      for cx, cy, (col, name, sub) in grid(server_info, 3, 0.5, 4.55, 4.1)),
+    # Capabilities row: every server exposes all three
+    *(LabelBox(cx + srv * 4.1, cy, 1.2, 0.55, label, fill="0A202E", color=col, size=10,
+               bold=False, border=col, border_width=1, text_y=0.1, text_h=0.38)
+      for srv in range(3)
+      for cx, cy, (col, label) in grid(capabilities, 3, 0.5, 6.05, 1.27)),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 6 — The Three Core Components
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "The Three Core Components", "Host, Client & Server explained")
-
 comp_data = [
     (ACCENT, "HOST", "The AI Application",
      "The app the user directly uses.\n\n"
@@ -285,33 +186,25 @@ comp_data = [
      "  - Serve resource data on request\n"
      "  - Can be local or remote"),
 ]
-for i, (col, name, subtitle, body) in enumerate(comp_data):
-    cx = 0.35 + i * 4.32
-    rect(sl, cx, 1.25, 4.1, 5.8, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, 1.25, 4.1, 0.12, fill=col)
-    txt(sl, name, cx+0.15, 1.38, 3.8, 0.52, size=22, bold=True, color=col)
-    txt(sl, subtitle, cx+0.15, 1.9, 3.8, 0.4, size=14, color=LGRAY, italic=True)
-    rect(sl, cx+0.15, 2.35, 3.8, 0.04, fill=col)
-    txt(sl, body, cx+0.15, 2.45, 3.8, 4.4, size=13, color=LGRAY)
-slide_num(sl, 6)
+
+slides.append(Slide([
+    Header("The Three Core Components", "Host, Client & Server explained"),
+    *(element
+      for cx, cy, (col, name, subtitle, body) in grid(comp_data, 3, 0.35, 1.25, 4.32)
+      for element in (
+          # The body goes on after the subtitle and rule, as it was drawn before.
+          Card(cx, cy, 4.1, 5.8, col, name, strip_size=0.12,
+               title_y=0.13, title_h=0.52, title_size=22),
+          Text(subtitle, cx + 0.15, 1.9, 3.8, 0.4, size=14, color=LGRAY, italic=True),
+          Rect(cx + 0.15, 2.35, 3.8, 0.04, fill=col),
+          Text(body, cx + 0.15, cy + 1.2, 3.8, 4.4, size=13, color=LGRAY),
+      )),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 7 — Transport Layer
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Transport Layer", "How Client and Server communicate")
-
-txt(sl, "Transport = the communication channel between MCP Client and MCP Server",
-    0.4, 1.25, 12.5, 0.45, size=16, color=LGRAY, italic=True)
-
-# stdio card
-rect(sl, 0.35, 1.85, 6.0, 5.25, fill=PANEL, border=ACCENT, bw=Pt(2))
-rect(sl, 0.35, 1.85, 6.0, 0.12, fill=ACCENT)
-txt(sl, "stdio  (Standard Input/Output)", 0.5, 2.0, 5.7, 0.52, size=20, bold=True, color=ACCENT)
-txt(sl, "Best for: LOCAL servers on same machine", 0.5, 2.55, 5.7, 0.38, size=13, color=GREEN, italic=True)
-
 stdio_pts = [
     "Client launches Server as a child process",
     "They talk through stdin & stdout pipes",
@@ -319,21 +212,6 @@ stdio_pts = [
     "Server lives & dies with the Client",
     "Great for filesystem, local DBs, scripts",
 ]
-bullets(sl, stdio_pts, 0.5, 3.05, 5.7, icon="->", icol=ACCENT, size=14, gap=0.48)
-
-# diagram for stdio
-rect(sl, 0.6, 5.75, 2.0, 0.6, fill=RGBColor(0x0A,0x25,0x38), border=ACCENT, bw=Pt(1))
-txt(sl, "Client", 0.6, 5.88, 2.0, 0.35, size=13, bold=True, color=ACCENT, align=PP_ALIGN.CENTER)
-txt(sl, "---stdin/stdout--->", 2.65, 5.9, 2.5, 0.35, size=11, color=LGRAY, align=PP_ALIGN.CENTER)
-rect(sl, 5.2, 5.75, 1.0, 0.6, fill=RGBColor(0x0A,0x25,0x38), border=ACCENT, bw=Pt(1))
-txt(sl, "Srv", 5.2, 5.88, 1.0, 0.35, size=13, bold=True, color=ACCENT, align=PP_ALIGN.CENTER)
-
-# HTTP+SSE card
-rect(sl, 6.98, 1.85, 6.0, 5.25, fill=PANEL, border=ORANGE, bw=Pt(2))
-rect(sl, 6.98, 1.85, 6.0, 0.12, fill=ORANGE)
-txt(sl, "HTTP + SSE", 7.13, 2.0, 5.7, 0.52, size=20, bold=True, color=ORANGE)
-txt(sl, "Best for: REMOTE servers over a network", 7.13, 2.55, 5.7, 0.38, size=13, color=GREEN, italic=True)
-
 http_pts = [
     "Client sends requests via HTTP POST",
     "Server pushes updates via SSE (Server-Sent Events)",
@@ -341,24 +219,41 @@ http_pts = [
     "Can be shared by multiple Clients",
     "Great for cloud services, shared tools, SaaS",
 ]
-bullets(sl, http_pts, 7.13, 3.05, 5.7, icon="->", icol=ORANGE, size=14, gap=0.48)
 
-# diagram for HTTP
-rect(sl, 7.15, 5.75, 2.0, 0.6, fill=RGBColor(0x25,0x18,0x00), border=ORANGE, bw=Pt(1))
-txt(sl, "Client", 7.15, 5.88, 2.0, 0.35, size=13, bold=True, color=ORANGE, align=PP_ALIGN.CENTER)
-txt(sl, "--HTTP/SSE-->", 9.2, 5.9, 2.0, 0.35, size=11, color=LGRAY, align=PP_ALIGN.CENTER)
-rect(sl, 11.25, 5.75, 1.6, 0.6, fill=RGBColor(0x25,0x18,0x00), border=ORANGE, bw=Pt(1))
-txt(sl, "Remote Srv", 11.25, 5.88, 1.6, 0.35, size=11, bold=True, color=ORANGE, align=PP_ALIGN.CENTER)
-slide_num(sl, 7)
+slides.append(Slide([
+    Header("Transport Layer", "How Client and Server communicate"),
+    Text("Transport = the communication channel between MCP Client and MCP Server",
+         0.4, 1.25, 12.5, 0.45, size=16, color=LGRAY, italic=True),
+    # stdio card
+    Card(0.35, 1.85, 6.0, 5.25, ACCENT, "stdio  (Standard Input/Output)", strip_size=0.12,
+         title_h=0.52, title_size=20),
+    Text("Best for: LOCAL servers on same machine", 0.5, 2.55, 5.7, 0.38,
+         size=13, color=GREEN, italic=True),
+    Bullets(stdio_pts, 0.5, 3.05, 5.7, icon="->", icon_color=ACCENT, size=14, gap=0.48),
+    # diagram for stdio
+    LabelBox(0.6, 5.75, 2.0, 0.6, "Client", fill="0A2538", color=ACCENT, size=13,
+             border=ACCENT, border_width=1, text_y=0.13, text_h=0.35),
+    Arrow(2.65, 5.9, 2.5, 0.35, glyph="---stdin/stdout--->", size=11, color=LGRAY),
+    LabelBox(5.2, 5.75, 1.0, 0.6, "Srv", fill="0A2538", color=ACCENT, size=13,
+             border=ACCENT, border_width=1, text_y=0.13, text_h=0.35),
+    # HTTP+SSE card
+    Card(6.98, 1.85, 6.0, 5.25, ORANGE, "HTTP + SSE", strip_size=0.12,
+         title_h=0.52, title_size=20),
+    Text("Best for: REMOTE servers over a network", 7.13, 2.55, 5.7, 0.38,
+         size=13, color=GREEN, italic=True),
+    Bullets(http_pts, 7.13, 3.05, 5.7, icon="->", icon_color=ORANGE, size=14, gap=0.48),
+    # diagram for HTTP
+    LabelBox(7.15, 5.75, 2.0, 0.6, "Client", fill="251800", color=ORANGE, size=13,
+             border=ORANGE, border_width=1, text_y=0.13, text_h=0.35),
+    Arrow(9.2, 5.9, 2.0, 0.35, glyph="--HTTP/SSE-->", size=11, color=LGRAY),
+    LabelBox(11.25, 5.75, 1.6, 0.6, "Remote Srv", fill="251800", color=ORANGE, size=11,
+             border=ORANGE, border_width=1, text_y=0.13, text_h=0.35),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 8 — Three Capabilities (Tools / Resources / Prompts)
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "What an MCP Server Can Expose", "Three types of capabilities")
-
 cap_data = [
     (ACCENT, "TOOLS", "AI can CALL these",
      "Functions that DO something.\nThe AI can invoke them to take action.",
@@ -378,36 +273,28 @@ cap_data = [
      "User-controlled -- user selects the template"),
 ]
 
-for i, (col, title, tag, desc, examples, note) in enumerate(cap_data):
-    cx = 0.35 + i * 4.32
-    rect(sl, cx, 1.25, 4.1, 5.85, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, 1.25, 4.1, 0.12, fill=col)
-    txt(sl, title, cx+0.15, 1.38, 3.8, 0.52, size=22, bold=True, color=col)
-    rect(sl, cx+0.15, 1.9, 1.8, 0.32, fill=col)
-    txt(sl, tag, cx+0.16, 1.91, 1.78, 0.3, size=11, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    txt(sl, desc, cx+0.15, 2.3, 3.8, 0.75, size=13, color=LGRAY)
-    txt(sl, "Examples:", cx+0.15, 3.12, 3.8, 0.35, size=13, bold=True, color=col)
-    bullets(sl, examples, cx+0.1, 3.5, 3.95, icon="*", icol=col, size=12, gap=0.42)
-    rect(sl, cx+0.15, 6.55, 3.8, 0.04, fill=col)
-    txt(sl, note, cx+0.15, 6.62, 3.8, 0.38, size=11, color=LGRAY, italic=True)
-slide_num(sl, 8)
+slides.append(Slide([
+    Header("What an MCP Server Can Expose", "Three types of capabilities"),
+    *(element
+      for cx, cy, (col, title, tag, desc, examples, note) in grid(cap_data, 3, 0.35, 1.25, 4.32)
+      for element in (
+          # The tag is drawn before the description, as it was before.
+          Card(cx, cy, 4.1, 5.85, col, title, strip_size=0.12,
+               title_y=0.13, title_h=0.52, title_size=22),
+          Rect(cx + 0.15, 1.9, 1.8, 0.32, fill=col),
+          Text(tag, cx + 0.16, 1.91, 1.78, 0.3, size=11, bold=True, color=BG, align="center"),
+          Text(desc, cx + 0.15, cy + 1.05, 3.8, 0.75, size=13, color=LGRAY),
+          Text("Examples:", cx + 0.15, 3.12, 3.8, 0.35, size=13, bold=True, color=col),
+          Bullets(examples, cx + 0.1, 3.5, 3.95, icon="*", icon_color=col, size=12, gap=0.42),
+          Rect(cx + 0.15, 6.55, 3.8, 0.04, fill=col),
+          Text(note, cx + 0.15, 6.62, 3.8, 0.38, size=11, color=LGRAY, italic=True),
+      )),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 9 — Tools Deep Dive
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Tools — Deep Dive", "The most powerful MCP capability")
-
-rect(sl, 0.35, 1.28, 12.6, 0.82, fill=PANEL2, border=ACCENT, bw=Pt(1))
-txt(sl, "A Tool is a function exposed by an MCP Server that the AI model can CALL to perform "
-        "an action. The AI sends a tool call, the server executes it and returns the result.",
-    0.55, 1.33, 12.2, 0.72, size=15, color=WHITE)
-
-# Left: how tools work
-rect(sl, 0.35, 2.25, 5.9, 4.85, fill=PANEL, border=ACCENT, bw=Pt(1.5))
-txt(sl, "How Tools Work", 0.5, 2.32, 5.6, 0.46, size=17, bold=True, color=ACCENT)
 steps = [
     ("1. Discover", "Server tells Client which tools are available + their parameters"),
     ("2. AI decides", "AI reads the tool list and picks the right tool for the task"),
@@ -416,15 +303,6 @@ steps = [
     ("5. Result",    "Server returns the output back to the AI"),
     ("6. Answer",    "AI uses the result to respond to the user"),
 ]
-for i, (step, desc) in enumerate(steps):
-    cy = 2.85 + i * 0.72
-    rect(sl, 0.5, cy, 1.1, 0.52, fill=ACCENT)
-    txt(sl, step, 0.5, cy+0.08, 1.1, 0.36, size=10, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    txt(sl, desc, 1.7, cy+0.08, 4.4, 0.36, size=12, color=LGRAY)
-
-# Right: example tool definition
-rect(sl, 6.55, 2.25, 6.45, 4.85, fill=RGBColor(0x0A,0x14,0x0A), border=GREEN, bw=Pt(1.5))
-txt(sl, "Example Tool Definition", 6.7, 2.32, 6.1, 0.46, size=17, bold=True, color=GREEN)
 code = (
     'Tool: read_file\n'
     'Description:\n'
@@ -440,61 +318,60 @@ code = (
     'Server Returns:\n'
     '  "Meeting at 3pm. Buy milk."'
 )
-txt(sl, code, 6.7, 2.82, 6.1, 4.1, size=12, color=GREEN, name="Consolas")
-slide_num(sl, 9)
+
+slides.append(Slide([
+    Header("Tools — Deep Dive", "The most powerful MCP capability"),
+    Rect(0.35, 1.28, 12.6, 0.82, fill=PANEL2, border=ACCENT, border_width=1),
+    Text("A Tool is a function exposed by an MCP Server that the AI model can CALL to perform "
+         "an action. The AI sends a tool call, the server executes it and returns the result.",
+         0.55, 1.33, 12.2, 0.72, size=15, color=WHITE),
+    # Left: how tools work
+    Card(0.35, 2.25, 5.9, 4.85, ACCENT, "How Tools Work", border_width=1.5, strip=None,
+         title_y=0.07, title_h=0.46, title_size=17),
+    *(element
+      for _, cy, (step, desc) in grid(steps, 1, 0, 2.85, 0, 0.72)
+      for element in (
+          LabelBox(0.5, cy, 1.1, 0.52, step, fill=ACCENT, color=BG, size=10,
+                   text_y=0.08, text_h=0.36),
+          Text(desc, 1.7, cy + 0.08, 4.4, 0.36, size=12, color=LGRAY),
+      )),
+    # Right: example tool definition
+    Card(6.55, 2.25, 6.45, 4.85, GREEN, "Example Tool Definition", fill="0A140A",
+         border_width=1.5, strip=None, text_w=6.1, title_y=0.07, title_h=0.46, title_size=17),
+    Text(code, 6.7, 2.82, 6.1, 4.1, size=12, color=GREEN, font="Consolas"),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 10 — Resources Deep Dive
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Resources — Deep Dive", "Data the AI can read")
-
-rect(sl, 0.35, 1.28, 12.6, 0.82, fill=PANEL2, border=GREEN, bw=Pt(1))
-txt(sl, "A Resource is a piece of data exposed by an MCP Server. The AI (or Host app) can "
-        "READ it to gain context. Unlike Tools, Resources don't execute actions — they supply information.",
-    0.55, 1.33, 12.2, 0.72, size=15, color=WHITE)
-
-# Resource types grid
 res_types = [
     (ACCENT,  "Text Resources",    "Plain text files, logs,\nconfig files, notes.\n\nURI: file:///path/to/file.txt"),
     (GREEN,   "Binary Resources",  "Images, PDFs, audio.\nReturned as base64.\n\nURI: file:///image.png"),
     (ORANGE,  "Dynamic Resources", "Real-time data like\nlive DB rows or API output.\n\nURI: db://table/rows"),
     (PURPLE,  "Resource Templates","Parameterised URIs\ne.g. file:///{filename}\nto access any matching file"),
 ]
-for i, (col, title, desc) in enumerate(res_types):
-    row, col_idx = i // 2, i % 2
-    cx = 0.35 + col_idx * 6.2
-    cy = 2.28 + row * 2.2
-    rect(sl, cx, cy, 6.0, 2.0, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, cy, 6.0, 0.10, fill=col)
-    txt(sl, title, cx+0.15, cy+0.16, 5.7, 0.46, size=17, bold=True, color=col)
-    txt(sl, desc, cx+0.15, cy+0.68, 5.7, 1.2, size=14, color=LGRAY)
 
-# bottom note
-rect(sl, 0.35, 6.65, 12.6, 0.5, fill=RGBColor(0x0A,0x25,0x15), border=GREEN, bw=Pt(1))
-txt(sl, "Resources use URI addressing  --  each resource has a unique URI like a web URL.",
-    0.55, 6.7, 12.2, 0.38, size=14, color=GREEN)
-slide_num(sl, 10)
+slides.append(Slide([
+    Header("Resources — Deep Dive", "Data the AI can read"),
+    Rect(0.35, 1.28, 12.6, 0.82, fill=PANEL2, border=GREEN, border_width=1),
+    Text("A Resource is a piece of data exposed by an MCP Server. The AI (or Host app) can "
+         "READ it to gain context. Unlike Tools, Resources don't execute actions — they supply information.",
+         0.55, 1.33, 12.2, 0.72, size=15, color=WHITE),
+    # Resource types grid
+    *(Card(cx, cy, 6.0, 2.0, col, title, desc,
+           title_y=0.16, title_h=0.46, title_size=17, body_y=0.68, body_h=1.2)
+      for cx, cy, (col, title, desc) in grid(res_types, 2, 0.35, 2.28, 6.2, 2.2)),
+    # bottom note
+    Rect(0.35, 6.65, 12.6, 0.5, fill="0A2515", border=GREEN, border_width=1),
+    Text("Resources use URI addressing  --  each resource has a unique URI like a web URL.",
+         0.55, 6.7, 12.2, 0.38, size=14, color=GREEN),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 11 — Prompts Deep Dive
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Prompts — Deep Dive", "Reusable AI workflow templates")
-
-rect(sl, 0.35, 1.28, 12.6, 0.82, fill=PANEL2, border=ORANGE, bw=Pt(1))
-txt(sl, "Prompts are pre-built, reusable prompt templates that an MCP Server exposes. "
-        "The USER selects a prompt, the Host fills in parameters, and sends it to the AI — "
-        "giving consistent, repeatable workflows.",
-    0.55, 1.33, 12.2, 0.72, size=15, color=WHITE)
-
-# Left column
-rect(sl, 0.35, 2.25, 5.9, 4.9, fill=PANEL, border=ORANGE, bw=Pt(1.5))
-txt(sl, "Why Prompts Matter", 0.5, 2.32, 5.6, 0.46, size=17, bold=True, color=ORANGE)
 why_pts = [
     "Consistent outputs every time",
     "Encode best practices in a template",
@@ -503,11 +380,6 @@ why_pts = [
     "Teams can share proven workflows",
     "Discoverable -- AI can list available prompts",
 ]
-bullets(sl, why_pts, 0.5, 2.9, 5.6, icon=">>", icol=ORANGE, size=14, gap=0.56)
-
-# Right column: example
-rect(sl, 6.55, 2.25, 6.45, 4.9, fill=RGBColor(0x1A,0x10,0x00), border=ORANGE, bw=Pt(1.5))
-txt(sl, "Example Prompt Template", 6.7, 2.32, 6.1, 0.46, size=17, bold=True, color=ORANGE)
 prompt_ex = (
     'Name: code_review\n'
     'Description:\n'
@@ -523,17 +395,28 @@ prompt_ex = (
     '   improvements:\n'
     '   {code}"'
 )
-txt(sl, prompt_ex, 6.7, 2.82, 6.1, 4.1, size=12, color=ORANGE, name="Consolas")
-slide_num(sl, 11)
+
+slides.append(Slide([
+    Header("Prompts — Deep Dive", "Reusable AI workflow templates"),
+    Rect(0.35, 1.28, 12.6, 0.82, fill=PANEL2, border=ORANGE, border_width=1),
+    Text("Prompts are pre-built, reusable prompt templates that an MCP Server exposes. "
+         "The USER selects a prompt, the Host fills in parameters, and sends it to the AI — "
+         "giving consistent, repeatable workflows.",
+         0.55, 1.33, 12.2, 0.72, size=15, color=WHITE),
+    # Left column
+    Card(0.35, 2.25, 5.9, 4.9, ORANGE, "Why Prompts Matter", border_width=1.5, strip=None,
+         title_y=0.07, title_h=0.46, title_size=17),
+    Bullets(why_pts, 0.5, 2.9, 5.6, icon=">>", icon_color=ORANGE, size=14, gap=0.56),
+    # Right column: example
+    Card(6.55, 2.25, 6.45, 4.9, ORANGE, "Example Prompt Template", fill="1A1000",
+         border_width=1.5, strip=None, text_w=6.1, title_y=0.07, title_h=0.46, title_size=17),
+    Text(prompt_ex, 6.7, 2.82, 6.1, 4.1, size=12, color=ORANGE, font="Consolas"),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 12 — MCP Lifecycle
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "MCP Session Lifecycle", "What happens from start to finish")
-
 phases = [
     (ACCENT,  "1. Initialize",
      "Client connects to Server.\n"
@@ -562,43 +445,32 @@ phases = [
      "Clean exit like closing\nan app properly."),
 ]
 
-for i, (col, phase, desc, analogy) in enumerate(phases):
-    cx = 0.35 + i * 3.22
-    # connector arrow
-    if i > 0:
-        txt(sl, "==>", cx-0.22, 3.3, 0.25, 0.38, size=13, color=ACCENT, align=PP_ALIGN.CENTER)
-    # main card
-    rect(sl, cx, 1.28, 3.0, 4.0, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, 1.28, 3.0, 0.12, fill=col)
-    txt(sl, phase, cx+0.12, 1.42, 2.76, 0.5, size=17, bold=True, color=col)
-    txt(sl, desc,  cx+0.12, 2.0,  2.76, 2.6, size=13, color=LGRAY)
-    # analogy strip
-    rect(sl, cx+0.12, 4.5, 2.76, 0.04, fill=col)
-    txt(sl, "Analogy:", cx+0.12, 4.6, 2.76, 0.32, size=11, bold=True, color=col)
-    txt(sl, analogy, cx+0.12, 4.95, 2.76, 0.72, size=12, color=LGRAY, italic=True)
-
-# bottom note
-rect(sl, 0.35, 5.8, 12.6, 0.62, fill=PANEL2, border=LGRAY, bw=Pt(1))
-txt(sl, "Note: MCP uses JSON-RPC 2.0 as the message format for all communication between Client and Server.",
-    0.55, 5.88, 12.2, 0.46, size=14, color=LGRAY, italic=True)
-slide_num(sl, 12)
+lifecycle = []
+for i, (cx, cy, (col, phase, desc, analogy)) in enumerate(grid(phases, 4, 0.35, 1.28, 3.22)):
+    if i > 0:   # connector arrow
+        lifecycle.append(Arrow(cx - 0.22, 3.3, 0.25, 0.38, glyph="==>", size=13))
+    lifecycle += [
+        Card(cx, cy, 3.0, 4.0, col, phase, desc, strip_size=0.12, pad=0.12,
+             title_y=0.14, title_h=0.5, title_size=17, body_y=0.72, body_h=2.6, body_size=13),
+        # analogy strip
+        Rect(cx + 0.12, 4.5, 2.76, 0.04, fill=col),
+        Text("Analogy:", cx + 0.12, 4.6, 2.76, 0.32, size=11, bold=True, color=col),
+        Text(analogy, cx + 0.12, 4.95, 2.76, 0.72, size=12, color=LGRAY, italic=True),
+    ]
+
+slides.append(Slide([
+    Header("MCP Session Lifecycle", "What happens from start to finish"),
+    *lifecycle,
+    # bottom note
+    Rect(0.35, 5.8, 12.6, 0.62, fill=PANEL2, border=LGRAY, border_width=1),
+    Text("Note: MCP uses JSON-RPC 2.0 as the message format for all communication between Client and Server.",
+         0.55, 5.88, 12.2, 0.46, size=14, color=LGRAY, italic=True),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 13 — MCP vs Function Calling
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "MCP vs Function Calling", "What's the difference?")
-
-# Table header
-rect(sl, 0.35, 1.28, 4.5, 0.55, fill=LGRAY)
-rect(sl, 4.85, 1.28, 3.9, 0.55, fill=PURPLE)
-rect(sl, 8.75, 1.28, 4.22, 0.55, fill=ACCENT)
-txt(sl, "Aspect", 0.5, 1.33, 4.2, 0.4, size=15, bold=True, color=BG)
-txt(sl, "Function Calling", 5.0, 1.33, 3.6, 0.4, size=15, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-txt(sl, "MCP (Tools)", 8.9, 1.33, 3.9, 0.4, size=15, bold=True, color=BG, align=PP_ALIGN.CENTER)
-
 rows = [
     ("What is it?",         "Built into the LLM API.\nAI calls a function directly.",          "External protocol.\nAI calls a server-hosted function."),
     ("Where does it live?", "Inside your app code.\nFunctions defined per-app.",               "In a separate MCP Server.\nReusable across any app."),
@@ -607,29 +479,36 @@ rows = [
     ("Best for",            "Simple, one-off integrations\nwithin a single app.",               "Complex, reusable tools shared\nacross multiple AI applications."),
 ]
 row_cols = [PANEL, PANEL2, PANEL, PANEL2, PANEL]
-for i, (aspect, fc, mcp) in enumerate(rows):
-    cy = 1.9 + i * 1.07
-    rc = row_cols[i]
-    rect(sl, 0.35, cy, 4.5, 1.0, fill=rc)
-    rect(sl, 4.85, cy, 3.9, 1.0, fill=rc)
-    rect(sl, 8.75, cy, 4.22, 1.0, fill=rc)
-    # borders
-    rect(sl, 0.35, cy, 4.5, 1.0, border=LGRAY, bw=Pt(0.5))
-    rect(sl, 4.85, cy, 3.9, 1.0, border=PURPLE, bw=Pt(0.5))
-    rect(sl, 8.75, cy, 4.22, 1.0, border=ACCENT, bw=Pt(0.5))
-    txt(sl, aspect, 0.5, cy+0.08, 4.2, 0.85, size=13, bold=True, color=WHITE)
-    txt(sl, fc,     5.0, cy+0.08, 3.6, 0.85, size=12, color=LGRAY)
-    txt(sl, mcp,    8.9, cy+0.08, 3.9, 0.85, size=12, color=LGRAY)
-slide_num(sl, 13)
+
+slides.append(Slide([
+    Header("MCP vs Function Calling", "What's the difference?"),
+    # Table header
+    Rect(0.35, 1.28, 4.5, 0.55, fill=LGRAY),
+    Rect(4.85, 1.28, 3.9, 0.55, fill=PURPLE),
+    Rect(8.75, 1.28, 4.22, 0.55, fill=ACCENT),
+    Text("Aspect", 0.5, 1.33, 4.2, 0.4, size=15, bold=True, color=BG),
+    Text("Function Calling", 5.0, 1.33, 3.6, 0.4, size=15, bold=True, color=WHITE, align="center"),
+    Text("MCP (Tools)", 8.9, 1.33, 3.9, 0.4, size=15, bold=True, color=BG, align="center"),
+    *(element
+      for (_, cy, (aspect, fc, mcp)), rc in zip(grid(rows, 1, 0, 1.9, 0, 1.07), row_cols)
+      for element in (
+          Rect(0.35, cy, 4.5, 1.0, fill=rc),
+          Rect(4.85, cy, 3.9, 1.0, fill=rc),
+          Rect(8.75, cy, 4.22, 1.0, fill=rc),
+          # borders
+          Rect(0.35, cy, 4.5, 1.0, border=LGRAY, border_width=0.5),
+          Rect(4.85, cy, 3.9, 1.0, border=PURPLE, border_width=0.5),
+          Rect(8.75, cy, 4.22, 1.0, border=ACCENT, border_width=0.5),
+          Text(aspect, 0.5, cy + 0.08, 4.2, 0.85, size=13, bold=True, color=WHITE),
+          Text(fc,     5.0, cy + 0.08, 3.6, 0.85, size=12, color=LGRAY),
+          Text(mcp,    8.9, cy + 0.08, 3.9, 0.85, size=12, color=LGRAY),
+      )),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 14 — Real-World Use Cases
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Real-World Use Cases", "What can you actually DO with MCP?")
-
 use_cases = [
     (ACCENT,  "Developer Tools",
      "- AI reads your codebase files\n"
@@ -662,74 +541,49 @@ use_cases = [
      "- Automate workflows\n"
      "- Integrate legacy systems"),
 ]
-for i, (col, title, desc) in enumerate(use_cases):
-    row, col_idx = i // 3, i % 3
-    cx = 0.35 + col_idx * 4.32
-    cy = 1.28 + row * 2.9
-    rect(sl, cx, cy, 4.1, 2.7, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, cy, 4.1, 0.10, fill=col)
-    txt(sl, title, cx+0.15, cy+0.16, 3.8, 0.5, size=17, bold=True, color=col)
-    txt(sl, desc,  cx+0.15, cy+0.72, 3.8, 1.8, size=13, color=LGRAY)
-slide_num(sl, 14)
+
+slides.append(Slide([
+    Header("Real-World Use Cases", "What can you actually DO with MCP?"),
+    *(Card(cx, cy, 4.1, 2.7, col, title, desc, title_y=0.16, title_h=0.5, title_size=17,
+           body_y=0.72, body_h=1.8, body_size=13)
+      for cx, cy, (col, title, desc) in grid(use_cases, 3, 0.35, 1.28, 4.32, 2.9)),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 15 — Popular MCP Servers (Ecosystem)
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "MCP Ecosystem", "Popular ready-made MCP Servers")
-
-txt(sl, "Anthropic & the community have built hundreds of MCP servers you can use immediately:",
-    0.4, 1.25, 12.5, 0.42, size=15, color=LGRAY, italic=True)
-
 servers = [
-    (ACCENT,  "Official by Anthropic"),
-    (GREEN,   "Official by Anthropic"),
-    (ORANGE,  "Official by Anthropic"),
-    (ACCENT,  "Community"),
-    (GREEN,   "Community"),
-    (ORANGE,  "Community"),
-    (PURPLE,  "Community"),
-    (YELLOW,  "Community"),
-    (PINK,    "Community"),
-]
-server_names = [
-    ("Filesystem",   "Read/write local files\nsafely with permissions"),
-    ("PostgreSQL",   "Query a Postgres DB\nwith read-only access"),
-    ("GitHub",       "Manage repos, issues,\nPRs via GitHub API"),
-    ("Brave Search", "Search the web using\nBrave Search API"),
-    ("Slack",        "Post messages, read\nchannels, manage threads"),
-    ("Puppeteer",    "Control a browser:\nscreenshots, scraping"),
-    ("Notion",       "Read/write Notion\npages and databases"),
-    ("Google Drive", "Access Google Docs,\nSheets, files"),
-    ("SQLite",       "Query a local SQLite\ndatabase file"),
+    (ACCENT,  "Official by Anthropic", "Filesystem",   "Read/write local files\nsafely with permissions"),
+    (GREEN,   "Official by Anthropic", "PostgreSQL",   "Query a Postgres DB\nwith read-only access"),
+    (ORANGE,  "Official by Anthropic", "GitHub",       "Manage repos, issues,\nPRs via GitHub API"),
+    (ACCENT,  "Community",             "Brave Search", "Search the web using\nBrave Search API"),
+    (GREEN,   "Community",             "Slack",        "Post messages, read\nchannels, manage threads"),
+    (ORANGE,  "Community",             "Puppeteer",    "Control a browser:\nscreenshots, scraping"),
+    (PURPLE,  "Community",             "Notion",       "Read/write Notion\npages and databases"),
+    (YELLOW,  "Community",             "Google Drive", "Access Google Docs,\nSheets, files"),
+    (PINK,    "Community",             "SQLite",       "Query a local SQLite\ndatabase file"),
 ]
 
-for i, ((col, badge), (name, desc)) in enumerate(zip(servers, server_names)):
-    row, col_idx = i // 3, i % 3
-    cx = 0.35 + col_idx * 4.32
-    cy = 1.82 + row * 1.82
-    rect(sl, cx, cy, 4.1, 1.65, fill=PANEL, border=col, bw=Pt(1.5))
-    rect(sl, cx, cy, 4.1, 0.10, fill=col)
-    txt(sl, name, cx+0.15, cy+0.16, 2.5, 0.46, size=16, bold=True, color=col)
-    rect(sl, cx+2.8, cy+0.2, 1.15, 0.3, fill=col)
-    txt(sl, badge, cx+2.8, cy+0.2, 1.15, 0.3, size=8, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    txt(sl, desc, cx+0.15, cy+0.68, 3.8, 0.85, size=13, color=LGRAY)
-slide_num(sl, 15)
+slides.append(Slide([
+    Header("MCP Ecosystem", "Popular ready-made MCP Servers"),
+    Text("Anthropic & the community have built hundreds of MCP servers you can use immediately:",
+         0.4, 1.25, 12.5, 0.42, size=15, color=LGRAY, italic=True),
+    *(element
+      for cx, cy, (col, badge, name, desc) in grid(servers, 3, 0.35, 1.82, 4.32, 1.82)
+      for element in (
+          Card(cx, cy, 4.1, 1.65, col, name, border_width=1.5, text_w=2.5,
+               title_y=0.16, title_h=0.46),
+          LabelBox(cx + 2.8, cy + 0.2, 1.15, 0.3, badge, fill=col, color=BG, size=8,
+                   text_y=0, text_h=0.3),
+          Text(desc, cx + 0.15, cy + 0.68, 3.8, 0.85, size=13, color=LGRAY),
+      )),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 16 — Security in MCP
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Security in MCP", "How MCP stays safe")
-
-# Left: principles
-rect(sl, 0.35, 1.28, 6.1, 5.85, fill=PANEL, border=GREEN, bw=Pt(1.5))
-txt(sl, "Security Principles", 0.5, 1.35, 5.8, 0.46, size=18, bold=True, color=GREEN)
-
 sec_pts = [
     ("User Consent",     "Every tool call requires explicit user approval.\nThe user controls what the AI can do."),
     ("Least Privilege",  "Servers only get the permissions they need.\nFilesystem server can't access the network."),
@@ -737,39 +591,43 @@ sec_pts = [
     ("Audit Trail",      "All tool calls are logged.\nYou can see exactly what the AI did."),
     ("No Secrets",       "MCP Servers should not store API keys\nin responses — keep secrets server-side."),
 ]
-for i, (title, desc) in enumerate(sec_pts):
-    cy = 1.92 + i * 0.98
-    rect(sl, 0.5, cy, 0.5, 0.75, fill=GREEN)
-    txt(sl, str(i+1), 0.5, cy+0.16, 0.5, 0.42, size=16, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    txt(sl, title, 1.12, cy+0.05, 5.1, 0.35, size=14, bold=True, color=GREEN)
-    txt(sl, desc,  1.12, cy+0.4,  5.1, 0.45, size=12, color=LGRAY)
-
-# Right: trust model
-rect(sl, 6.75, 1.28, 6.22, 5.85, fill=PANEL, border=ORANGE, bw=Pt(1.5))
-txt(sl, "Trust Model", 6.9, 1.35, 5.9, 0.46, size=18, bold=True, color=ORANGE)
-
 trust_data = [
     (ACCENT,  "HOST",   "Trusted completely.\nYou chose to install it."),
     (GREEN,   "CLIENT", "Trusted — it's inside\nthe Host you control."),
     (ORANGE,  "SERVER", "Partially trusted.\nUser approves each action."),
     (RED,     "User Input", "Prompt injection risk.\nValidate all inputs."),
 ]
-for i, (col, name, note) in enumerate(trust_data):
-    cy = 1.92 + i * 1.25
-    rect(sl, 6.9, cy, 1.5, 1.05, fill=col)
-    txt(sl, name, 6.9, cy+0.28, 1.5, 0.5, size=14, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    txt(sl, "Trust Level:", 8.55, cy+0.08, 4.2, 0.32, size=12, bold=True, color=col)
-    txt(sl, note, 8.55, cy+0.45, 4.2, 0.5, size=12, color=LGRAY)
-slide_num(sl, 16)
+
+slides.append(Slide([
+    Header("Security in MCP", "How MCP stays safe"),
+    # Left: principles
+    Card(0.35, 1.28, 6.1, 5.85, GREEN, "Security Principles", border_width=1.5, strip=None,
+         title_y=0.07, title_h=0.46, title_size=18),
+    *(element
+      for i, (_, cy, (title, desc)) in enumerate(grid(sec_pts, 1, 0, 1.92, 0, 0.98))
+      for element in (
+          LabelBox(0.5, cy, 0.5, 0.75, str(i + 1), fill=GREEN, color=BG, size=16,
+                   text_y=0.16, text_h=0.42),
+          Text(title, 1.12, cy + 0.05, 5.1, 0.35, size=14, bold=True, color=GREEN),
+          Text(desc,  1.12, cy + 0.4,  5.1, 0.45, size=12, color=LGRAY),
+      )),
+    # Right: trust model
+    Card(6.75, 1.28, 6.22, 5.85, ORANGE, "Trust Model", border_width=1.5, strip=None,
+         text_w=5.9, title_y=0.07, title_h=0.46, title_size=18),
+    *(element
+      for _, cy, (col, name, note) in grid(trust_data, 1, 0, 1.92, 0, 1.25)
+      for element in (
+          LabelBox(6.9, cy, 1.5, 1.05, name, fill=col, color=BG, size=14,
+                   text_y=0.28, text_h=0.5),
+          Text("Trust Level:", 8.55, cy + 0.08, 4.2, 0.32, size=12, bold=True, color=col),
+          Text(note, 8.55, cy + 0.45, 4.2, 0.5, size=12, color=LGRAY),
+      )),
+]))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # SLIDE 17 — Summary & Key Takeaways
 # ═══════════════════════════════════════════════════════════════════
-sl = prs.slides.add_slide(blank)
-bg(sl)
-header(sl, "Summary — Everything About MCP", "What you must remember")
-
 takeaways = [
     (ACCENT,  "What",        "Open standard by Anthropic (Nov 2024) for AI-to-tool communication"),
     (GREEN,   "Why",         "Solves the N*M integration problem -- one protocol replaces custom code"),
@@ -781,26 +639,25 @@ takeaways = [
     (GREEN,   "Ecosystem",   "Hundreds of ready servers: GitHub, Postgres, Slack, Filesystem..."),
 ]
 
-for i, (col, label, desc) in enumerate(takeaways):
-    row, col_idx = i // 2, i % 2
-    cx = 0.35 + col_idx * 6.5
-    cy = 1.32 + row * 1.46
-    rect(sl, cx, cy, 6.2, 1.3, fill=PANEL, border=col, bw=Pt(2))
-    rect(sl, cx, cy, 0.12, 1.3, fill=col)
-    rect(sl, cx+0.22, cy+0.12, 0.9, 0.36, fill=col)
-    txt(sl, label, cx+0.22, cy+0.12, 0.9, 0.36, size=11, bold=True, color=BG, align=PP_ALIGN.CENTER)
-    txt(sl, desc, cx+0.22, cy+0.55, 5.8, 0.65, size=14, color=LGRAY)
-
-# footer
-rect(sl, 0.35, 7.05, 12.6, 0.32, fill=ACCENT)
-txt(sl, "MCP = The universal language between AI and the world.",
-    0.5, 7.07, 12.2, 0.28, size=14, bold=True, color=BG, align=PP_ALIGN.CENTER)
-slide_num(sl, 17)
-
-
-# ═══════════════════════════════════════════════════════════════════
-# Save
-# ═══════════════════════════════════════════════════════════════════
-out = r"D:\Study\MCP\MCP_Complete_Guide.pptx"
-prs.save(out)
-print("Saved:", out)
+slides.append(Slide([
+    Header("Summary — Everything About MCP", "What you must remember"),
+    *(element
+      for cx, cy, (col, label, desc) in grid(takeaways, 2, 0.35, 1.32, 6.5, 1.46)
+      for element in (
+          Rect(cx, cy, 6.2, 1.3, fill=PANEL, border=col, border_width=2),
+          Rect(cx, cy, 0.12, 1.3, fill=col),
+          LabelBox(cx + 0.22, cy + 0.12, 0.9, 0.36, label, fill=col, color=BG, size=11,
+                   text_y=0, text_h=0.36),
+          Text(desc, cx + 0.22, cy + 0.55, 5.8, 0.65, size=14, color=LGRAY),
+      )),
+    # footer
+    Rect(0.35, 7.05, 12.6, 0.32, fill=ACCENT),
+    Text("MCP = The universal language between AI and the world.",
+         0.5, 7.07, 12.2, 0.28, size=14, bold=True, color=BG, align="center"),
+]))
+
+
+DECK = Deck(slides)
+
+if __name__ == "__main__":
+    main(DECK, r"D:\Study\MCP\MCP_Complete_Guide.pptx")
@@ -0,0 +1,640 @@
+"""Declarative slide decks rendered with python-pptx.
+
+A deck is data: a `Deck` holds `Slide`s, and a slide is a list of elements
+(headers, text, rectangles, cards, label boxes, bullet lists, arrows) placed
+in inches on a 13.33 x 7.5 in canvas. Colors are hex strings, alignments
+are "left", "center" or "right":
+
+    DECK = Deck([
+        Slide([
+            Header("What is MCP?", "A quick overview"),
+            Card(0.4, 1.4, 4.1, 2.4, ACCENT, "Open Standard", "Like HTTP, for AI tools."),
+            Bullets(["Tools", "Resources", "Prompts"], 5.0, 1.4, 6.0),
+        ]),
+    ])
+
+    if __name__ == "__main__":
+        main(DECK, "Deck.pptx")
+
+How a header, a slide number or a bullet row looks is set once per deck by
+its `Theme`; everything else is spelled out on the element.
+"""
+
+import argparse
+import hashlib
+import io
+import math
+import os
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pptx
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt
+
+# ── Palette ───────────────────────────────────────────────────────
+BG      = "0D1B2A"   # dark navy
+PANEL   = "162B3C"   # slightly lighter panel
+PANEL2  = "0F2230"
+ACCENT  = "00B4D8"   # cyan
+ORANGE  = "FF9F1C"
+GREEN   = "06D6A0"
+YELLOW  = "FFD166"
+PURPLE  = "C77DFF"
+PINK    = "FF6B9D"
+WHITE   = "FFFFFF"
+LGRAY   = "B0C4D8"   # light gray text
+RED     = "FF5C5C"
+
+ALIGN = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+
+BLANK_LAYOUT = 6
+
+
+# ── Drawing primitives ────────────────────────────────────────────
+# Every distinct rectangle or text style is built once through python-pptx
+# on a scratch slide; after that, shapes of that style are deep copies of
+# the template with their id, name, position and text patched in, instead
+# of a dozen separate property writes per shape.
+_TEMPLATES: dict[tuple, Any] = {}
+_scratch = None
+
+
+def _template(build, *style) -> Any:
+    """The `p:sp` element `build(shapes, *style)` makes, built on first use."""
+    key = (build, *style)
+    template = _TEMPLATES.get(key)
+    if template is None:
+        global _scratch
+        if _scratch is None:
+            prs = Presentation()
+            _scratch = prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT]).shapes
+        template = _TEMPLATES[key] = build(_scratch, *style)._element
+    return template
+
+
+def _build_rect(shapes, fill, border, border_width):
+    s = shapes.add_shape(1, 0, 0, 0, 0)  # rectangle
+    if fill:
+        s.fill.solid()
+        s.fill.fore_color.rgb = RGBColor.from_string(fill)
+    else:
+        s.fill.background()
+    if border:
+        s.line.color.rgb = RGBColor.from_string(border)
+        s.line.width = Pt(border_width)
+    else:
+        s.line.fill.background()
+    s.text = ""
+    return s
+
+
+def _add_run(p, size, bold, color, italic, font, text=""):
+    r = p.add_run()
+    r.text = text
+    r.font.size = Pt(size)
+    r.font.bold = bold
+    r.font.italic = italic
+    r.font.color.rgb = RGBColor.from_string(color)
+    r.font.name = font
+
+
+def _build_text(shapes, size, bold, color, align, italic, font):
+    tb = shapes.add_textbox(0, 0, 0, 0)
+    tf = tb.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.alignment = ALIGN[align]
+    _add_run(p, size, bold, color, italic, font)
+    return tb
+
+
+# Line height of a bullet item, as a multiple of its font size
+BULLET_LINE = 1.2
+
+
+def _build_bullets(shapes, size, color, icon, icon_color, indent, gap, font):
+    """A text box whose one paragraph is the pattern for every bullet item.
+
+    The paragraph hangs `indent` inches: the icon sits at the left edge and
+    the text, wrapped lines included, starts `indent` in. Exact line
+    spacing plus space after puts consecutive items `gap` inches apart.
+    A single-character icon is a native bullet; a longer one (">>", "->")
+    is a bold run followed by a tab.
+    """
+    tb = shapes.add_textbox(0, 0, 0, 0)
+    tf = tb.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.alignment = PP_ALIGN.LEFT
+    p.line_spacing = Pt(size * BULLET_LINE)
+    p.space_after = Pt(gap * 72 - size * BULLET_LINE)
+    native = len(icon) == 1
+    if not native:
+        _add_run(p, size, True, icon_color, False, font, icon + "\t")
+    _add_run(p, size, False, color, False, font)
+    margin = Inches(indent)
+    pPr = p._p.get_or_add_pPr()
+    pPr.set("marL", str(margin))
+    pPr.set("indent", str(-margin))
+    if native:
+        etree.SubElement(etree.SubElement(pPr, qn("a:buClr")), qn("a:srgbClr"), val=icon_color)
+        etree.SubElement(pPr, qn("a:buFont"), typeface=font)
+        etree.SubElement(pPr, qn("a:buChar"), char=icon)
+    etree.SubElement(etree.SubElement(pPr, qn("a:tabLst")), qn("a:tab"), pos=str(margin), algn="l")
+    return tb
+
+
+class Canvas:
+    """Stamps shapes onto one slide from the per-style templates."""
+
+    def __init__(self, slide) -> None:
+        self._tree = slide.shapes._spTree
+        self._next_id = self._tree.max_shape_id + 1
+
+    def _stamp(self, template, kind: str, x, y, w, h):
+        sp = deepcopy(template)
+        shape_id = self._next_id
+        self._next_id += 1
+        # Ids and names follow python-pptx: "TextBox 3" has id 4.
+        c_nv_pr = sp[0][0]   # p:nvSpPr/p:cNvPr
+        c_nv_pr.set("id", str(shape_id))
+        c_nv_pr.set("name", f"{kind} {shape_id - 1}")
+        off, ext = sp[1][0]  # p:spPr/a:xfrm
+        off.set("x", str(Inches(x)))
+        off.set("y", str(Inches(y)))
+        ext.set("cx", str(Inches(w)))
+        ext.set("cy", str(Inches(h)))
+        self._tree.insert_element_before(sp, "p:extLst")
+        return sp
+
+    def rect(self, x, y, w, h, fill=None, border=None, border_width=0):
+        template = _template(_build_rect, fill, border, border_width)
+        return self._stamp(template, "Rectangle", x, y, w, h)
+
+    def text(self, text, x, y, w, h, size=16, bold=False, color=WHITE,
+             align="left", italic=False, font="Segoe UI"):
+        template = _template(_build_text, size, bold, color, align, italic, font)
+        sp = self._stamp(template, "TextBox", x, y, w, h)
+        sp.txBody.p_lst[0].r_lst[0].text = text
+        return sp
+
+    def bullets(self, items, x, y, w, h, icon, icon_color, size, gap, indent,
+                color=LGRAY, font="Segoe UI"):
+        """One text box, one paragraph per item; see _build_bullets()."""
+        template = _template(_build_bullets, size, color, icon, icon_color, indent, gap, font)
+        sp = self._stamp(template, "TextBox", x, y, w, h)
+        body = sp.txBody
+        pattern = body.p_lst[0]
+        body.remove(pattern)
+        for item in items:
+            p = deepcopy(pattern)
+            p.r_lst[-1].text = item
+            body.append(p)
+        return sp
+
+
+# ── Elements ──────────────────────────────────────────────────────
+@dataclass
+class Rect:
+    x: float
+    y: float
+    w: float
+    h: float
+    fill: str | None = None
+    border: str | None = None
+    border_width: float = 0   # points
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        canvas.rect(self.x, self.y, self.w, self.h, self.fill, self.border, self.border_width)
+
+
+@dataclass
+class Text:
+    text: str
+    x: float
+    y: float
+    w: float
+    h: float
+    size: float = 16
+    color: str = WHITE
+    bold: bool = False
+    italic: bool = False
+    align: str = "left"
+    font: str = "Segoe UI"
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        canvas.text(self.text, self.x, self.y, self.w, self.h, self.size, self.bold,
+                    self.color, self.align, self.italic, self.font)
+
+
+@dataclass
+class Header:
+    """The title bar across the top of a content slide, styled by the theme."""
+
+    title: str
+    subtitle: str = ""
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        theme.header_bar.draw(canvas, theme)
+        replace(theme.header_title, text=self.title).draw(canvas, theme)
+        if self.subtitle:
+            replace(theme.header_subtitle, text=self.subtitle).draw(canvas, theme)
+
+
+@dataclass
+class LabelBox:
+    """A rectangle with one line of text centered on it.
+
+    `text_y` is the offset of the text box from the top of the rectangle;
+    by default the text is centered vertically.
+    """
+
+    x: float
+    y: float
+    w: float
+    h: float
+    text: str
+    fill: str | None = None
+    color: str = WHITE
+    size: float = 16
+    bold: bool = True
+    italic: bool = False
+    border: str | None = None
+    border_width: float = 0
+    text_y: float | None = None
+    text_h: float = 0.4
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        canvas.rect(self.x, self.y, self.w, self.h, self.fill, self.border, self.border_width)
+        text_y = self.h / 2 - 0.18 if self.text_y is None else self.text_y
+        canvas.text(self.text, self.x, self.y + text_y, self.w, self.text_h, self.size,
+                    self.bold, self.color, "center", self.italic)
+
+
+@dataclass
+class Card:
+    """A bordered panel with a colored title and body text.
+
+    `strip` adds a color band along the "top" or "left" edge. Title and
+    body are offset `pad` from the left edge and `text_w` wide (by default
+    the card width less `pad` on both sides); `title_y` and `body_y` are
+    offsets from the top edge. `decor` elements (absolute positions) are
+    drawn on the panel, below the title and body.
+    """
+
+    x: float
+    y: float
+    w: float
+    h: float
+    color: str
+    title: str
+    body: str = ""
+    fill: str = PANEL
+    border_width: float = 2
+    strip: str | None = "top"
+    strip_size: float = 0.10
+    pad: float = 0.15
+    text_w: float | None = None
+    align: str = "left"
+    title_y: float = 0.15
+    title_h: float = 0.48
+    title_size: float = 16
+    body_y: float = 0.68
+    body_h: float | None = None
+    body_size: float = 14
+    body_color: str = LGRAY
+    decor: tuple["Element", ...] = ()
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        canvas.rect(self.x, self.y, self.w, self.h, self.fill, self.color, self.border_width)
+        if self.strip == "top":
+            canvas.rect(self.x, self.y, self.w, self.strip_size, self.color)
+        elif self.strip == "left":
+            canvas.rect(self.x, self.y, self.strip_size, self.h, self.color)
+        for element in self.decor:
+            element.draw(canvas, theme)
+        x = self.x + self.pad
+        w = self.w - 2 * self.pad if self.text_w is None else self.text_w
+        canvas.text(self.title, x, self.y + self.title_y, w, self.title_h,
+                    self.title_size, True, self.color, self.align)
+        if self.body:
+            body_h = self.h - self.body_y - 0.12 if self.body_h is None else self.body_h
+            canvas.text(self.body, x, self.y + self.body_y, w, body_h,
+                        self.body_size, False, self.body_color, self.align)
+
+
+@dataclass
+class Bullets:
+    """One row per item: an icon in `icon_color`, then the item text.
+
+    Rows are `gap` inches apart, all in a single text box; the icon column
+    width, row height and text color come from the theme.
+    """
+
+    items: list[str]
+    x: float
+    y: float
+    w: float
+    icon: str = ">>"
+    icon_color: str = ACCENT
+    size: float = 15
+    gap: float = 0.50
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        if not self.items:
+            return
+        h = (len(self.items) - 1) * self.gap + theme.bullet_height
+        canvas.bullets(self.items, self.x, self.y, self.w, h, self.icon, self.icon_color,
+                       self.size, self.gap, theme.bullet_indent, theme.bullet_color)
+
+
+@dataclass
+class Arrow:
+    """A connector drawn as a glyph, e.g. "──►" between two boxes."""
+
+    x: float
+    y: float
+    w: float
+    h: float
+    glyph: str = "──►"
+    size: float = 14
+    color: str = ACCENT
+
+    def draw(self, canvas, theme: "Theme") -> None:
+        canvas.text(self.glyph, self.x, self.y, self.w, self.h, self.size,
+                    color=self.color, align="center")
+
+
+Element = Rect | Text | Header | LabelBox | Card | Bullets | Arrow
+
+
+# ── Slides and decks ──────────────────────────────────────────────
+@dataclass
+class Theme:
+    """Deck-wide look: slide size, background, header, numbers and bullets.
+
+    `header_title`, `header_subtitle` and `number` are templates; their
+    text is replaced by the slide's title, subtitle and position.
+    """
+
+    width: float = 13.33
+    height: float = 7.5
+    background: str = BG
+    header_bar: Rect = field(default_factory=lambda: Rect(0, 0, 13.33, 1.15, fill=ACCENT))
+    header_title: Text = field(default_factory=lambda: Text(
+        "", 0.3, 0.08, 12.5, 0.65, size=32, color=BG, bold=True))
+    header_subtitle: Text = field(default_factory=lambda: Text(
+        "", 0.3, 0.70, 12.5, 0.38, size=15, color=BG, italic=True))
+    number: Text | None = field(default_factory=lambda: Text(
+        "", 12.85, 7.1, 0.4, 0.3, size=12, color=LGRAY, align="right"))
+    bullet_indent: float = 0.38
+    bullet_height: float = 0.42
+    bullet_color: str = LGRAY
+
+
+@dataclass
+class Slide:
+    elements: list[Element]
+    background: str | None = None   # the theme's background by default
+    numbered: bool = True
+
+
+@dataclass
+class Deck:
+    slides: list[Slide]
+    theme: Theme = field(default_factory=Theme)
+
+
+def grid(items: Iterable[Any], columns: int, x: float, y: float,
+         dx: float, dy: float = 0) -> Iterator[tuple[float, float, Any]]:
+    """Yield `(x, y, item)`, laying items out left to right, top to bottom."""
+    for i, item in enumerate(items):
+        row, col = divmod(i, columns)
+        yield x + col * dx, y + row * dy, item
+
+
+# ── Rendering ─────────────────────────────────────────────────────
+def draw_slide(slide, spec: Slide, theme: Theme, number: int) -> None:
+    """Draw `spec` onto an empty python-pptx slide at 1-based `number`."""
+    fill = slide.background.fill
+    fill.solid()
+    fill.fore_color.rgb = RGBColor.from_string(spec.background or theme.background)
+    canvas = Canvas(slide)
+    for element in spec.elements:
+        element.draw(canvas, theme)
+    if spec.numbered and theme.number is not None:
+        replace(theme.number, text=str(number)).draw(canvas, theme)
+
+
+def _presentation(theme: Theme):
+    prs = Presentation()
+    prs.slide_width = Inches(theme.width)
+    prs.slide_height = Inches(theme.height)
+    return prs
+
+
+def render_slides(theme: Theme, numbered: list[tuple[int, Slide]]) -> list[bytes]:
+    """Render `(number, spec)` pairs to standalone slide XML, in order.
+
+    A slide part holds nothing but its shapes and background, so the XML
+    can be moved into any presentation with the same layouts.
+    """
+    prs = _presentation(theme)
+    layout = prs.slide_layouts[BLANK_LAYOUT]
+    xml = []
+    for number, spec in numbered:
+        slide = prs.slides.add_slide(layout)
+        draw_slide(slide, spec, theme, number)
+        xml.append(slide.part.blob)
+    return xml
+
+
+def skeleton(theme: Theme, count: int) -> bytes:
+    """A saved presentation of `count` blank slides for assemble() to fill."""
+    prs = _presentation(theme)
+    layout = prs.slide_layouts[BLANK_LAYOUT]
+    for _ in range(count):
+        prs.slides.add_slide(layout)
+    out = io.BytesIO()
+    prs.save(out)
+    return out.getvalue()
+
+
+_SLIDE_PART = re.compile(r"ppt/slides/slide(\d+)\.xml")
+
+
+def assemble(theme: Theme, slides_xml: list[bytes], path: str, shell: bytes | None = None) -> None:
+    """Write a presentation made of already rendered slide XML parts.
+
+    The package is `shell` (by default a fresh skeleton()) with its slide
+    parts swapped for `slides_xml`, zipped straight to `path`.
+    """
+    if shell is None:
+        shell = skeleton(theme, len(slides_xml))
+    with ZipFile(io.BytesIO(shell)) as src, ZipFile(path, "w", ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            part = _SLIDE_PART.fullmatch(info.filename)
+            dst.writestr(info, slides_xml[int(part[1]) - 1] if part else src.read(info))
+
+
+# Rendered XML depends on this file and python-pptx as much as on the spec.
+ENGINE = hashlib.sha256(Path(__file__).read_bytes() + pptx.__version__.encode()).hexdigest()
+
+
+class SlideCache:
+    """Rendered slide XML on disk, keyed by a hash of everything it came from.
+
+    One directory serves one deck: prune() drops the cache's own files the
+    last build did not use, and the manifest records what the output was
+    built from. Every file but the manifest is named `<sha256>.xml` or
+    `<sha256>.pptx`; anything else in the directory is left alone.
+    """
+
+    _OWN = re.compile(r"[0-9a-f]{64}\.(?:xml|pptx)(?:\.tmp)?")
+
+    def __init__(self, directory: str | Path, theme: Theme) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.theme = theme
+        self._theme = repr(theme)
+
+    def _hash(self, *parts: Any) -> str:
+        text = "\n".join(map(str, (ENGINE, self._theme, *parts)))
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def key(self, number: int, spec: Slide) -> str:
+        # Only the number drawn on the slide matters, so inserting an
+        # unnumbered slide leaves the rest of the deck cached.
+        numbered = spec.numbered and self.theme.number is not None
+        return self._hash(number if numbered else "-", repr(spec))
+
+    def _read(self, name: str) -> bytes | None:
+        try:
+            return (self.directory / name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, name: str, data: bytes) -> None:
+        # Write and rename, so an interrupted build never leaves half a file.
+        tmp = self.directory / f"{name}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, self.directory / name)
+
+    def get(self, key: str) -> bytes | None:
+        return self._read(f"{key}.xml")
+
+    def put(self, key: str, xml: bytes) -> None:
+        self._write(f"{key}.xml", xml)
+
+    def skeleton(self, count: int) -> tuple[str, bytes]:
+        name = f"{self._hash('skeleton', count)}.pptx"
+        shell = self._read(name)
+        if shell is None:
+            shell = skeleton(self.theme, count)
+            self._write(name, shell)
+        return name, shell
+
+    def manifest(self) -> str:
+        return (self._read("manifest") or b"").decode()
+
+    def set_manifest(self, manifest: str) -> None:
+        self._write("manifest", manifest.encode())
+
+    def prune(self, keep: set[str]) -> None:
+        for path in self.directory.iterdir():
+            if path.name not in keep and self._OWN.fullmatch(path.name) and path.is_file():
+                path.unlink()
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _render_many(theme: Theme, numbered: list[tuple[int, Slide]], jobs: int) -> list[bytes]:
+    if jobs <= 1 or len(numbered) <= 1:
+        return render_slides(theme, numbered)
+    # A few groups per worker keeps them all busy when slides differ in size.
+    groups = _chunks(numbered, max(1, math.ceil(len(numbered) / (jobs * 4))))
+    with ProcessPoolExecutor(min(jobs, len(groups))) as pool:
+        return [xml for group in pool.map(render_slides, repeat(theme), groups) for xml in group]
+
+
+def _render_incremental(deck: Deck, path: str, jobs: int, cache_dir: str | Path) -> int:
+    cache = SlideCache(cache_dir, deck.theme)
+    numbered = list(enumerate(deck.slides, 1))
+    keys = [cache.key(number, spec) for number, spec in numbered]
+    xml = [cache.get(key) for key in keys]
+    stale = [i for i, cached in enumerate(xml) if cached is None]
+    for i, rendered in zip(stale, _render_many(deck.theme, [numbered[i] for i in stale], jobs)):
+        cache.put(keys[i], rendered)
+        xml[i] = rendered
+    shell_name, shell = cache.skeleton(len(xml))
+    manifest = "\n".join([os.path.abspath(path), shell_name, *keys])
+    if stale or manifest != cache.manifest() or not os.path.exists(path):
+        assemble(deck.theme, xml, path, shell)
+        cache.set_manifest(manifest)
+    cache.prune({shell_name, *(f"{key}.xml" for key in keys)})
+    return len(stale)
+
+
+def render(deck: Deck, path: str, jobs: int = 1, cache_dir: str | Path | None = None) -> int:
+    """Render `deck` to a .pptx file at `path`; return how many slides were drawn.
+
+    With `jobs` > 1, groups of slides are rendered in that many worker
+    processes and their slide XML is merged into one package. Starting
+    the workers costs a few tenths of a second, so this pays off for
+    decks of a hundred slides or more.
+
+    With a `cache_dir`, each slide's XML is kept there under a hash of its
+    spec, its number, the theme and the renderer. Only slides whose hash
+    changed are rendered again, and the output is left alone when nothing
+    changed at all.
+    """
+    if cache_dir is not None:
+        return _render_incremental(deck, path, jobs, cache_dir)
+    theme = deck.theme
+    if jobs <= 1:
+        prs = _presentation(theme)
+        layout = prs.slide_layouts[BLANK_LAYOUT]
+        for number, spec in enumerate(deck.slides, 1):
+            draw_slide(prs.slides.add_slide(layout), spec, theme, number)
+        prs.save(path)
+    else:
+        assemble(theme, _render_many(theme, list(enumerate(deck.slides, 1)), jobs), path)
+    return len(deck.slides)
+
+
+def default_cache_dir(output: str) -> Path:
+    """Where --incremental keeps the slide cache of `output`: beside it."""
+    path = Path(output)
+    return path.with_name(f".{path.stem}.cache")
+
+
+def main(deck: Deck, output: str) -> None:
+    """Command line for a deck script: render `deck` to `output` or argv[1]."""
+    parser = argparse.ArgumentParser(description="Render the deck to a .pptx file.")
+    parser.add_argument("output", nargs="?", default=output,
+                        help=f"where to write the deck (default: {output})")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="render slides in this many processes (0: one per CPU)")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="re-render only slides that changed since the last "
+                             "incremental build (cache: .<name>.cache beside the output)")
+    args = parser.parse_args()
+    cache_dir = default_cache_dir(args.output) if args.incremental else None
+    rendered = render(deck, args.output, args.jobs or os.cpu_count() or 1, cache_dir)
+    print("Saved:", args.output)
+    if args.incremental:
+        print(f"{rendered} of {len(deck.slides)} slides rendered")